@@ -0,0 +1,194 @@
+"""Benchmark pow CLI startup and launch preparation.
+
+Builds a synthetic Isaac Sim install, ROS workspace and project (see
+fixtures.py) in a temporary directory and times the steps `pow sim run`
+goes through before Isaac Sim starts. Results are written as JSON so runs
+on different commits can be compared:
+
+    python benchmarks/bench.py -o before.json
+    git checkout <other commit>
+    python benchmarks/bench.py -o after.json --compare before.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from fixtures import make_isaacsim, make_kit_log, make_project, make_ros_workspace
+
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+
+
+def measure(func, repeat: int, warmup: int = 1) -> dict:
+    """Time func repeat times (after warmup calls), in milliseconds."""
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {
+        "min_ms": round(min(samples), 4),
+        "median_ms": round(statistics.median(samples), 4),
+        "mean_ms": round(statistics.fmean(samples), 4),
+        "max_ms": round(max(samples), 4),
+        "repeat": repeat,
+    }
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=PACKAGE_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(root: Path, profiles: int, repeat: int) -> dict:
+    site = make_isaacsim(root)
+    ros_ws = make_ros_workspace(root)
+    nested = make_project(root, ros_ws, profiles)
+    project = root / "project"
+    kit_log = make_kit_log(root)
+
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join([str(site), str(PACKAGE_ROOT)]),
+        "POW_CACHE_DIR": str(root / "cache"),
+        "SHELL": "/bin/bash",
+    }
+    os.environ.update(POW_CACHE_DIR=env["POW_CACHE_DIR"], SHELL=env["SHELL"])
+    sys.path[:0] = [str(site), str(PACKAGE_ROOT)]
+
+    from pow_cli.lib.startup_trace import build_timeline, parse_log
+    from pow_cli.sim.add.local_assets import update_kit_settings
+    from pow_cli.sim.run.run import (
+        build_launch_command,
+        find_project_root,
+        get_target_profile,
+        load_config,
+        source_isaacsim_ros_workspace,
+    )
+
+    def cli(*args: str):
+        return lambda: subprocess.run(
+            [sys.executable, "-m", "pow_cli.main", *args],
+            env=env,
+            cwd=nested,
+            stdout=subprocess.DEVNULL,
+            check=True,
+        )
+
+    config = load_config(project)
+    kit_log_lines = [(0.0, line) for line in kit_log.read_text().splitlines()]
+    last_profile = f"profile_{profiles - 1}"
+    asset_root = root / "isaacsim_assets"
+
+    benchmarks = {
+        "cli_start_help": (cli("--help"), max(repeat // 10, 3)),
+        "cli_start_sim_info_help": (cli("sim", "info", "--help"), max(repeat // 10, 3)),
+        "cli_start_sim_run_help": (cli("sim", "run", "--help"), max(repeat // 10, 3)),
+        "find_project_root": (lambda: find_project_root(nested), repeat),
+        "load_config": (lambda: load_config(project), repeat),
+        "get_target_profile": (
+            lambda: get_target_profile(config, last_profile),
+            repeat,
+        ),
+        "build_launch_command": (
+            lambda: build_launch_command(config, project, last_profile, ["--foo"]),
+            repeat,
+        ),
+        "source_ros_env_uncached": (
+            lambda: source_isaacsim_ros_workspace(config, use_cache=False),
+            max(repeat // 10, 3),
+        ),
+        "source_ros_env_cached": (
+            lambda: source_isaacsim_ros_workspace(config),
+            repeat,
+        ),
+        "update_kit_settings": (
+            lambda: update_kit_settings(asset_root, "5.1.0"),
+            repeat,
+        ),
+        "parse_startup_log": (
+            lambda: build_timeline(parse_log(kit_log_lines)),
+            repeat,
+        ),
+    }
+
+    results = {}
+    for name, (func, count) in benchmarks.items():
+        with contextlib.redirect_stdout(io.StringIO()):
+            results[name] = measure(func, count)
+        print(
+            f"{name:<28} median {results[name]['median_ms']:>10.3f} ms", file=sys.stderr
+        )
+    return results
+
+
+def compare(results: dict, baseline_path: Path) -> None:
+    baseline = json.loads(baseline_path.read_text())["results"]
+    print(f"\nCompared to {baseline_path}:", file=sys.stderr)
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before = baseline[name]["median_ms"]
+        after = result["median_ms"]
+        ratio = after / before if before else float("inf")
+        print(
+            f"{name:<28} {before:>10.3f} -> {after:>10.3f} ms  x{ratio:.2f}",
+            file=sys.stderr,
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", help="Write JSON results to this file")
+    parser.add_argument("-n", "--repeat", type=int, default=100, help="Repetitions")
+    parser.add_argument(
+        "-p", "--profiles", type=int, default=500, help="Profiles in pow.toml"
+    )
+    parser.add_argument("--compare", help="Baseline JSON results to compare with")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="pow-bench-") as tmp:
+        results = run_benchmarks(Path(tmp), args.profiles, args.repeat)
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "profiles": args.profiles,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+
+    if args.compare:
+        compare(results, Path(args.compare))
+
+
+if __name__ == "__main__":
+    main()
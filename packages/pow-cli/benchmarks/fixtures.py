@@ -0,0 +1,178 @@
+"""Synthetic Isaac Sim, ROS and project fixtures for the benchmarks.
+
+Everything is generated under one directory, so the benchmarks run on any
+Linux machine without Isaac Sim, ROS or a GPU.
+"""
+
+import hashlib
+import io
+import json
+import zipfile
+from pathlib import Path
+
+KIT_SETTINGS_LINES = 400
+ROS_EXPORTS = 200
+
+ISAACSIM_INIT = '''"""Fake isaacsim package generated by the pow benchmarks."""
+
+raise RuntimeError("pow must locate isaacsim without importing it")
+'''
+
+
+def make_isaacsim(root: Path) -> Path:
+    """Create a fake isaacsim package with an isaacsim.exp.base.kit file.
+
+    Returns:
+        Path: Directory to add to sys.path / PYTHONPATH.
+    """
+    site = root / "site-packages"
+    package = site / "isaacsim"
+    (package / "apps").mkdir(parents=True, exist_ok=True)
+    (package / "__init__.py").write_text(ISAACSIM_INIT)
+
+    lines = ["[package]", 'title = "Isaac Sim Base"', 'version = "5.1.0"', ""]
+    lines.append("[dependencies]")
+    lines += [f'"omni.fake.ext_{i}" = {{}}' for i in range(KIT_SETTINGS_LINES // 2)]
+    lines += ["", "[settings]"]
+    lines += [f"app.fake.setting_{i} = {i}" for i in range(KIT_SETTINGS_LINES // 2)]
+    (package / "apps" / "isaacsim.exp.base.kit").write_text("\n".join(lines) + "\n")
+    return site
+
+
+def make_ros_workspace(root: Path, distro: str = "humble") -> Path:
+    """Create an Isaac Sim ROS workspace with two local_setup.bash scripts.
+
+    Returns:
+        Path: Workspace root, as set in [sim.ros].isaacsim_ros_ws.
+    """
+    ws = root / "isaacsim_ros_ws"
+    for name in (f"{distro}_ws", "isaac_sim_ros_ws"):
+        install = ws / "build_ws" / distro / name / "install"
+        install.mkdir(parents=True, exist_ok=True)
+        exports = [
+            f'export POW_BENCH_{name.upper()}_{i}="{install}/share/pkg_{i}"'
+            for i in range(ROS_EXPORTS)
+        ]
+        exports += [
+            f'export AMENT_PREFIX_PATH="{install}${{AMENT_PREFIX_PATH:+:$AMENT_PREFIX_PATH}}"',
+            f'export ROS_DISTRO="{distro}"',
+            'export POW_BENCH_MULTILINE="first line\nsecond line"',
+        ]
+        (install / "local_setup.bash").write_text("\n".join(exports) + "\n")
+    return ws
+
+
+def make_project(root: Path, ros_ws: Path, profiles: int, depth: int = 8) -> Path:
+    """Create a project with a pow.toml holding many profiles.
+
+    Returns:
+        Path: A directory nested depth levels below the project root.
+    """
+    project = root / "project"
+    project.mkdir(parents=True, exist_ok=True)
+    lines = [
+        "[sim]",
+        'version = "5.1.0"',
+        f"ext_folders = {[f'exts/folder_{i}' for i in range(8)]}",
+        "",
+        "[sim.ros]",
+        "enable_ros = true",
+        f'isaacsim_ros_ws = "{ros_ws}"',
+        'ros_distro = "humble"',
+        "",
+        "[[sim.profiles]]",
+        'name = "default"',
+        "cpu_performance_mode = false",
+        "headless = false",
+        'extensions = ["isaacsim.code_editor.vscode"]',
+        'raw_args = ["--/renderer/raytracingMotion/enabled=false"]',
+        'open_scene_path = ""',
+    ]
+    for i in range(profiles):
+        lines += [
+            "",
+            "[[sim.profiles]]",
+            f'name = "profile_{i}"',
+            f"headless = {'true' if i % 2 else 'false'}",
+            f'extensions = ["omni.fake.ext_{i}", "omni.fake.ext_{i + 1}"]',
+            f'raw_args = ["--/app/fake/setting_{i}={i}"]',
+            f'open_scene_path = "scenes/scene_{i}.usd"',
+        ]
+    (project / "pow.toml").write_text("\n".join(lines) + "\n")
+
+    nested = project.joinpath(*[f"level_{i}" for i in range(depth)])
+    nested.mkdir(parents=True, exist_ok=True)
+    return nested
+
+
+def make_kit_log(root: Path, extensions: int = 300) -> Path:
+    """Create a recorded Kit console log of an Isaac Sim startup and shutdown.
+
+    Every tenth extension is slow, and a stage is opened after startup. Run
+    it through `pow sim run --profile-startup --dummy-command "sh -c 'cat <log>' sh"`
+    to check the startup profiler against known timings.
+
+    Returns:
+        Path: Log file.
+    """
+    lines = ["Starting kit application with the following args: [...]"]
+    ts = 0.25
+    for i in range(extensions):
+        lines.append(f"[{ts:.3f}s] [ext: omni.fake.ext_{i}-1.{i}.0] startup")
+        if i % 25 == 0:
+            lines.append(f"[{ts + 0.001:.3f}s] [Info] [carb] loading plugins")
+        ts += 0.5 if i % 10 == 9 else 0.02
+    lines.append(f"[{ts:.3f}s] app ready")
+    lines.append(f"[{ts + 0.1:.3f}s] Isaac Sim Full App is loaded.")
+    lines.append(f"[{ts + 0.2:.3f}s] [Info] [omni.usd] Opening stage scenes/a.usd")
+    lines.append(f"[{ts + 3.2:.3f}s] [Info] [omni.usd] Stage opened")
+    ts += 5.0
+    for i in reversed(range(extensions)):
+        lines.append(f"[{ts:.3f}s] [ext: omni.fake.ext_{i}-1.{i}.0] shutdown")
+        ts += 0.001
+    log = root / "kit_startup.log"
+    log.write_text("\n".join(lines) + "\n")
+    return log
+
+
+def make_ext_registry(root: Path, extensions: int = 20) -> Path:
+    """Create a stand-in Kit extension registry (see lib/ext_mirror.py).
+
+    omni.fake.mirror_{i} depends on omni.fake.mirror_{i + 1}, so enabling
+    omni.fake.mirror_0 needs the whole chain. Serve it with
+    `python -m http.server -d <registry>` and run
+    `pow sim ext sync --registry http://localhost:8000`.
+
+    Returns:
+        Path: Registry directory.
+    """
+    registry = root / "registry"
+    packages = []
+    for i in range(extensions):
+        name, version = f"omni.fake.mirror_{i}", f"1.{i}.0"
+        dependencies = {f"omni.fake.mirror_{i + 1}": {}} if i + 1 < extensions else {}
+        toml = f'[package]\nversion = "{version}"\n\n[dependencies]\n'
+        toml += "".join(f'"{dep}" = {{}}\n' for dep in dependencies)
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("config/extension.toml", toml)
+            zf.writestr(f"{name.replace('.', '/')}/__init__.py", "")
+        data = buffer.getvalue()
+        digest = hashlib.sha256(data).hexdigest()
+        archive = registry / "objects" / digest[:2] / digest[2:]
+        archive.parent.mkdir(parents=True, exist_ok=True)
+        archive.write_bytes(data)
+        packages.append(
+            {
+                "name": name,
+                "version": version,
+                "dependencies": {dep: "" for dep in dependencies},
+                "archive": f"objects/{digest[:2]}/{digest[2:]}",
+                "sha256": digest,
+                "size": len(data),
+            }
+        )
+    (registry / "index.json").write_text(
+        json.dumps({"version": 1, "packages": packages}, indent=2)
+    )
+    return registry
@@ -0,0 +1,63 @@
+"""Bridge executed inside Isaac Sim by `pow sim serve` (via --exec).
+
+Connects to the daemon bridge socket given in $POW_SERVE_BRIDGE and runs
+the requests it receives on Kit's event loop, one JSON object per line:
+
+    {"op": "open_stage", "path": "/abs/scene.usd"}
+    {"op": "run_script", "path": "/abs/script.py", "args": ["--flag"]}
+
+This file runs in Kit's Python interpreter, so it must not import pow_cli.
+"""
+
+import asyncio
+import json
+import os
+import runpy
+import sys
+import traceback
+
+import omni.usd
+
+
+class ScriptError(Exception):
+    """Raised when a script run for a request fails, with its traceback."""
+
+
+# malformed requests and failures reported back to the client
+REQUEST_ERRORS = (ScriptError, KeyError, TypeError, ValueError, OSError, RuntimeError)
+
+
+async def _handle(request: dict) -> dict:
+    op = request.get("op")
+    if op == "open_stage":
+        result, error = await omni.usd.get_context().open_stage_async(request["path"])
+        return {"ok": bool(result), "stage": request["path"], "error": error or None}
+    if op == "run_script":
+        saved_argv = sys.argv
+        sys.argv = [request["path"], *request.get("args", [])]
+        try:
+            runpy.run_path(request["path"], run_name="__main__")
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                raise ScriptError(f"{request['path']} exited with {e.code}") from e
+        except Exception as e:
+            raise ScriptError(traceback.format_exc()) from e
+        finally:
+            sys.argv = saved_argv
+        return {"ok": True, "script": request["path"]}
+    return {"ok": False, "error": f"Unknown op: {op}"}
+
+
+async def _serve(path: str) -> None:
+    reader, writer = await asyncio.open_unix_connection(path)
+    while line := await reader.readline():
+        try:
+            response = await _handle(json.loads(line))
+        except REQUEST_ERRORS as e:
+            response = {"ok": False, "error": str(e)}
+        writer.write(json.dumps(response).encode("utf-8") + b"\n")
+        await writer.drain()
+
+
+if os.environ.get("POW_SERVE_BRIDGE"):
+    asyncio.ensure_future(_serve(os.environ["POW_SERVE_BRIDGE"]))
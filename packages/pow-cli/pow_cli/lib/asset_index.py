@@ -0,0 +1,258 @@
+"""Persistent SQLite index of an installed asset tree."""
+
+import os
+import sqlite3
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path, PurePosixPath
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS dirs (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS files (
+    dir_id INTEGER NOT NULL REFERENCES dirs(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    category TEXT NOT NULL,
+    type TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    PRIMARY KEY (dir_id, name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS files_name ON files(name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS files_category ON files(category, type);
+"""
+
+FILE_TYPES = {
+    ".usd": "usd",
+    ".usda": "usd",
+    ".usdc": "usd",
+    ".usdz": "usd",
+    ".mdl": "material",
+    ".png": "texture",
+    ".jpg": "texture",
+    ".jpeg": "texture",
+    ".exr": "texture",
+    ".hdr": "texture",
+    ".tga": "texture",
+    ".dds": "texture",
+    ".ktx": "texture",
+    ".urdf": "robot",
+    ".mjcf": "robot",
+    ".json": "data",
+    ".yaml": "data",
+    ".yml": "data",
+    ".txt": "data",
+    ".mp4": "video",
+    ".wav": "audio",
+}
+
+
+def file_type(name: str) -> str:
+    """Classify a file by extension (usd, material, texture, ...)."""
+    return FILE_TYPES.get(os.path.splitext(name)[1].lower(), "other")
+
+
+def category_of(rel_dir: str) -> str:
+    """Get the top-level category (e.g., "Robots") of a directory path.
+
+    Paths are relative to the version folder, e.g. "Isaac/Robots/Franka".
+    """
+    parts = PurePosixPath(rel_dir).parts
+    if len(parts) >= 2 and parts[0] == "Isaac":
+        return parts[1]
+    return parts[0] if parts else ""
+
+
+def connect(db_path: Path) -> sqlite3.Connection:
+    """Open (and create if needed) an asset index database."""
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _scan_dir(root: Path, rel: str, known_mtime: int | None):
+    """List one directory; skip listing files if its mtime is unchanged."""
+    path = root / rel if rel else root
+    mtime = path.stat().st_mtime_ns
+    subdirs, files = [], []
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.name.startswith(".pow-"):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(f"{rel}/{entry.name}" if rel else entry.name)
+            elif mtime != known_mtime and entry.is_file():
+                files.append((entry.name, entry.stat().st_size))
+    return rel, mtime, None if mtime == known_mtime else files, subdirs
+
+
+def update_index(root: Path, db_path: Path, workers: int = 16) -> dict:
+    """Build or incrementally refresh the index of an asset tree.
+
+    Directories are scanned in parallel with os.scandir. A directory whose
+    mtime matches the index keeps its indexed files (no stat per file), but
+    is still descended into so changes deeper in the tree are found.
+
+    Args:
+        root: Asset version folder (e.g., .../Assets/Isaac/5.1).
+        db_path: Index database path.
+        workers: Number of scanning threads.
+
+    Returns:
+        dict: Number of scanned, changed and removed directories.
+    """
+    conn = connect(db_path)
+    known = {
+        path: (dir_id, mtime)
+        for dir_id, path, mtime in conn.execute("SELECT id, path, mtime_ns FROM dirs")
+    }
+
+    results = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = {pool.submit(_scan_dir, root, "", known.get("", (None, None))[1])}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                results.append(result)
+                for sub in result[3]:
+                    pending.add(
+                        pool.submit(
+                            _scan_dir, root, sub, known.get(sub, (None, None))[1]
+                        )
+                    )
+
+    seen = set()
+    changed = 0
+    with conn:
+        for rel, mtime, files, _ in results:
+            seen.add(rel)
+            if files is None:
+                continue
+            changed += 1
+            conn.execute(
+                "INSERT INTO dirs (path, mtime_ns) VALUES (?, ?) "
+                "ON CONFLICT(path) DO UPDATE SET mtime_ns = excluded.mtime_ns",
+                (rel, mtime),
+            )
+            (dir_id,) = conn.execute(
+                "SELECT id FROM dirs WHERE path = ?", (rel,)
+            ).fetchone()
+            conn.execute("DELETE FROM files WHERE dir_id = ?", (dir_id,))
+            category = category_of(rel)
+            conn.executemany(
+                "INSERT INTO files (dir_id, name, category, type, size) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (dir_id, name, category, file_type(name), size)
+                    for name, size in files
+                ],
+            )
+
+        removed = [(known[path][0],) for path in known.keys() - seen]
+        conn.executemany("DELETE FROM dirs WHERE id = ?", removed)
+    conn.close()
+
+    return {"scanned": len(results), "changed": changed, "removed": len(removed)}
+
+
+def search(
+    conn: sqlite3.Connection,
+    pattern: str,
+    category: str | None = None,
+    kind: str | None = None,
+    limit: int = 50,
+) -> list[tuple[str, str, str, int]]:
+    """Find files whose name contains pattern ("*" and "?" are wildcards).
+
+    Returns:
+        list[tuple[str, str, str, int]]: (path, category, type, size) rows.
+    """
+    like = _escape_like(pattern).replace("*", "%").replace("?", "_")
+    if "*" not in pattern and "?" not in pattern:
+        like = f"%{like}%"
+    query = (
+        "SELECT dirs.path, files.name, files.category, files.type, files.size "
+        "FROM files JOIN dirs ON dirs.id = files.dir_id "
+        "WHERE files.name LIKE ? ESCAPE '\\'"
+    )
+    params: list = [like]
+    if category:
+        query += " AND files.category = ? COLLATE NOCASE"
+        params.append(category)
+    if kind:
+        query += " AND files.type = ?"
+        params.append(kind)
+    query += " ORDER BY dirs.path, files.name LIMIT ?"
+    params.append(limit)
+    return [
+        (f"{path}/{name}" if path else name, cat, typ, size)
+        for path, name, cat, typ, size in conn.execute(query, params)
+    ]
+
+
+def list_dir(
+    conn: sqlite3.Connection, rel: str = ""
+) -> tuple[list[str], list[tuple[str, str, int]]]:
+    """List the subdirectories and files of an indexed directory.
+
+    Returns:
+        tuple: Subdirectory names, and (name, type, size) of each file.
+    """
+    rel = rel.strip("/")
+    prefix = f"{rel}/" if rel else ""
+    subdirs = sorted(
+        path[len(prefix) :]
+        for (path,) in conn.execute(
+            "SELECT path FROM dirs WHERE path LIKE ? ESCAPE '\\' AND path != ?",
+            (_escape_like(prefix) + "%", rel),
+        )
+        if "/" not in path[len(prefix) :]
+    )
+    files = list(
+        conn.execute(
+            "SELECT files.name, files.type, files.size FROM files "
+            "JOIN dirs ON dirs.id = files.dir_id WHERE dirs.path = ? "
+            "ORDER BY files.name",
+            (rel,),
+        )
+    )
+    return subdirs, files
+
+
+def disk_usage(
+    conn: sqlite3.Connection, rel: str = "", depth: int = 1
+) -> list[tuple[str, int, int]]:
+    """Sum file sizes below a directory, grouped down to a given depth.
+
+    Returns:
+        list[tuple[str, int, int]]: (path, total bytes, file count), largest first.
+    """
+    rel = rel.strip("/")
+    prefix = f"{rel}/" if rel else ""
+    totals: dict[str, list[int]] = {}
+    rows = conn.execute(
+        "SELECT dirs.path, SUM(files.size), COUNT(*) FROM files "
+        "JOIN dirs ON dirs.id = files.dir_id "
+        "WHERE dirs.path = ? OR dirs.path LIKE ? ESCAPE '\\' GROUP BY dirs.id",
+        (rel, _escape_like(prefix) + "%"),
+    )
+    for path, size, count in rows:
+        below = path[len(prefix) :].split("/") if path != rel else []
+        key = "/".join([rel] + below[:depth] if rel else below[:depth]) or "."
+        total = totals.setdefault(key, [0, 0])
+        total[0] += size
+        total[1] += count
+    return sorted(
+        ((path, size, count) for path, (size, count) in totals.items()),
+        key=lambda row: row[1],
+        reverse=True,
+    )
+
+
+def _escape_like(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
@@ -0,0 +1,152 @@
+"""Serve the download cache over HTTP, so other machines fetch at LAN speed.
+
+Files are served by name at /<name>, the layout of the asset server, so a
+machine running `pow sim assets serve` can be listed as a mirror in
+[sim.assets] mirrors. Single byte ranges are supported, for the segmented
+downloader and chunk repairs, and each file's chunk manifest is published
+at /<name>.manifest.json for verification.
+"""
+
+import json
+import os
+import re
+import urllib.parse
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from .download_cache import find_in_cache, list_refs
+from .integrity import MANIFEST_SUFFIX, manifest_path
+
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+SENDFILE_BLOCK_SIZE = 8 * 1024 * 1024  # 8MB
+
+
+def parse_range(header: str | None, size: int) -> tuple[int, int] | None:
+    """Parse a single "bytes=start-end" range into [start, end).
+
+    Returns:
+        tuple[int, int] | None: The range, or None to send the whole file
+            (no header, or several ranges).
+
+    Raises:
+        ValueError: If the range cannot be satisfied.
+    """
+    if not header:
+        return None
+    match = RANGE_RE.match(header.strip())
+    if not match:
+        if "," in header:
+            return None  # multiple ranges, the whole file is a valid answer
+        raise ValueError(header)
+    first, last = match.groups()
+    if not first:
+        if not last:
+            raise ValueError(header)
+        start, end = max(size - int(last), 0), size  # suffix range
+    else:
+        start = int(first)
+        end = min(int(last) + 1, size) if last else size
+    if start >= size or start >= end:
+        raise ValueError(header)
+    return start, end
+
+
+class AssetRequestHandler(BaseHTTPRequestHandler):
+    """Serve cached files and their manifests, read-only."""
+
+    server_version = "pow-assets"
+    protocol_version = "HTTP/1.1"
+    cache: Path
+    quiet = False
+
+    def do_HEAD(self) -> None:
+        self._serve(head=True)
+
+    def do_GET(self) -> None:
+        self._serve(head=False)
+
+    def log_message(self, format: str, *args) -> None:
+        if not self.quiet:
+            super().log_message(format, *args)
+
+    def _send_json(self, data, status: HTTPStatus = HTTPStatus.OK, head=False):
+        body = (json.dumps(data, indent=2) + "\n").encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+
+    def _serve(self, head: bool) -> None:
+        name = urllib.parse.unquote(urllib.parse.urlsplit(self.path).path).lstrip("/")
+        if name in ("", "index.json"):
+            self._send_json(list_refs(self.cache), head=head)
+            return
+
+        is_manifest = name.endswith(MANIFEST_SUFFIX)
+        obj = find_in_cache(self.cache, name.removesuffix(MANIFEST_SUFFIX))
+        if obj is None:
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+        if is_manifest:
+            try:
+                manifest = json.loads(manifest_path(obj).read_text())
+            except (OSError, ValueError):
+                self.send_error(HTTPStatus.NOT_FOUND)
+                return
+            self._send_json(manifest, head=head)
+            return
+
+        with open(obj, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            try:
+                byte_range = parse_range(self.headers.get("Range"), size)
+            except ValueError:
+                self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+
+            start, end = byte_range or (0, size)
+            if byte_range:
+                self.send_response(HTTPStatus.PARTIAL_CONTENT)
+                self.send_header("Content-Range", f"bytes {start}-{end - 1}/{size}")
+            else:
+                self.send_response(HTTPStatus.OK)
+            self.send_header("Content-Type", "application/octet-stream")
+            self.send_header("Content-Length", str(end - start))
+            self.send_header("Accept-Ranges", "bytes")
+            self.end_headers()
+            if head:
+                return
+
+            self.wfile.flush()
+            offset = start
+            while offset < end:
+                # zero-copy from the page cache to the socket
+                sent = os.sendfile(
+                    self.connection.fileno(),
+                    f.fileno(),
+                    offset,
+                    min(SENDFILE_BLOCK_SIZE, end - offset),
+                )
+                if sent == 0:
+                    break
+                offset += sent
+
+
+def make_server(
+    cache: Path, host: str, port: int, quiet: bool = False
+) -> ThreadingHTTPServer:
+    """Create a threaded HTTP server for a download cache (one thread per client)."""
+    handler = type(
+        "BoundAssetRequestHandler",
+        (AssetRequestHandler,),
+        {"cache": cache, "quiet": quiet},
+    )
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
@@ -0,0 +1,109 @@
+"""Generate the Isaac Sim asset browser cache from the asset index."""
+
+import json
+import os
+import sqlite3
+from pathlib import Path
+
+THUMBNAIL_DIR = ".thumbs/256x256"
+
+
+def get_browser_cache_path(isaacsim_path: Path) -> Path:
+    """Get the cache file read by the isaacsim.asset.browser extension."""
+    return (
+        isaacsim_path
+        / "exts"
+        / "isaacsim.asset.browser"
+        / "cache"
+        / "isaacsim.asset.browser.cache.json"
+    )
+
+
+def build_browser_cache(
+    conn: sqlite3.Connection, asset_base: Path, folders: list[str]
+) -> dict:
+    """Build the browser cache of the configured folders from the asset index.
+
+    Each configured folder maps to a tree of folders holding the USD files
+    found in it, with the modification time of the folder and the thumbnail
+    of each file when Omniverse generated one. Folders without any USD file
+    below them are left out, as the browser would hide them anyway.
+
+    Args:
+        conn: Open asset index (see asset_index.update_index).
+        asset_base: Asset version folder the index was built from.
+        folders: Folders shown by the asset browser, relative to asset_base.
+
+    Returns:
+        dict: Folder URL to folder tree.
+    """
+    thumbnails = {
+        f"{path.removesuffix('/' + THUMBNAIL_DIR)}/{name.removesuffix('.png')}"
+        for path, name in conn.execute(
+            "SELECT dirs.path, files.name FROM files "
+            "JOIN dirs ON dirs.id = files.dir_id WHERE dirs.path LIKE ?",
+            (f"%/{THUMBNAIL_DIR}",),
+        )
+    }
+
+    nodes: dict[str, dict] = {}
+    rows = conn.execute(
+        "SELECT dirs.path, dirs.mtime_ns, files.name FROM dirs "
+        "LEFT JOIN files ON files.dir_id = dirs.id AND files.type = 'usd' "
+        "ORDER BY dirs.path, files.name"
+    )
+    for rel, mtime, name in rows:
+        if "/." in f"/{rel}":
+            continue
+        node = nodes.get(rel)
+        if node is None:
+            node = nodes[rel] = {
+                "name": rel.rsplit("/", 1)[-1],
+                "url": f"{asset_base}/{rel}",
+                "timestamp": mtime / 1e9,
+                "files": [],
+                "sub_folders": [],
+            }
+        if name:
+            url = f"{asset_base}/{rel}/{name}"
+            thumbnail = (
+                f"{asset_base}/{rel}/{THUMBNAIL_DIR}/{name}.png"
+                if f"{rel}/{name}" in thumbnails
+                else None
+            )
+            node["files"].append({"name": name, "url": url, "thumbnail": thumbnail})
+
+    # link children bottom-up so empty folders can be dropped
+    for rel in sorted(nodes, key=lambda p: p.count("/"), reverse=True):
+        node = nodes[rel]
+        node["sub_folders"].sort(key=lambda child: child["name"])
+        if (node["files"] or node["sub_folders"]) and "/" in rel:
+            parent = nodes.get(rel.rsplit("/", 1)[0])
+            if parent is not None:
+                parent["sub_folders"].append(node)
+
+    return {
+        f"{asset_base}/{folder}": nodes[folder]
+        for folder in folders
+        if folder in nodes and (nodes[folder]["files"] or nodes[folder]["sub_folders"])
+    }
+
+
+def write_browser_cache(cache_path: Path, cache: dict) -> bool:
+    """Write the browser cache atomically, leaving it untouched if unchanged.
+
+    Returns:
+        bool: True if the cache file was written.
+    """
+    content = json.dumps(cache, indent=1)
+    try:
+        if cache_path.read_text() == content:
+            return False
+    except (FileNotFoundError, UnicodeDecodeError):
+        pass
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = cache_path.with_name(cache_path.name + ".tmp")
+    tmp.write_text(content)
+    os.replace(tmp, cache_path)
+    return True
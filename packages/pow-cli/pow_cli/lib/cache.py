@@ -0,0 +1,23 @@
+"""User-level cache directory shared by pow commands."""
+
+import os
+from pathlib import Path
+
+CACHE_DIR_ENV = "POW_CACHE_DIR"
+
+
+def get_cache_dir(name: str) -> Path:
+    """Get (and create) a named cache directory.
+
+    Caches live in ~/.pow/cache/<name>, or under $POW_CACHE_DIR if set.
+
+    Args:
+        name: Cache name, e.g. "ros-env".
+
+    Returns:
+        Path: The cache directory.
+    """
+    root = os.environ.get(CACHE_DIR_ENV) or Path.home() / ".pow" / "cache"
+    path = Path(root).expanduser() / name
+    path.mkdir(parents=True, exist_ok=True)
+    return path
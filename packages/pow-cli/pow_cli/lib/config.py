@@ -0,0 +1,278 @@
+"""Load, validate and cache the project configuration (pow.toml)."""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+
+import click
+
+from .cache import get_cache_dir
+
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python 3.10
+    tomllib = None
+
+CONFIG_FILENAME = "pow.toml"
+# bump when the compiled layout or the schema changes
+CACHE_VERSION = 8
+
+# How a profile key is merged over the profiles it extends (default: replace)
+MERGE_RULES = {
+    "extensions": "union",
+    "raw_args": "append",
+}
+
+# profile keys applied to the launched processes (see placement.parse_placement)
+PLACEMENT_KEYS = ("cpu_affinity", "nice", "ionice", "memory_limit", "open_files")
+
+PROFILE_SCHEMA = {
+    "name": str,
+    # "extends" is a name or an array of names, checked by compile_profiles
+    "cpu_performance_mode": bool,
+    "headless": bool,
+    "extensions": [str],
+    "raw_args": [str],
+    "open_scene_path": str,
+    "cache_path": str,
+    "cpu_affinity": str,
+    "nice": int,
+    "ionice": str,
+    "memory_limit": str,
+    "open_files": int,
+}
+
+SCHEMA = {
+    "sim": {
+        "version": str,
+        "base_app": str,
+        "ext_folders": [str],
+        "trim_ext_folders": bool,
+        "ext_mirror": {"registry": str, "path": str},
+        "assets": {"store": str, "mirrors": [str], "download_cache": str},
+        "cache": {"path": str, "max_size": str, "max_age": str},
+        "ros": {"enable_ros": bool, "isaacsim_ros_ws": str, "ros_distro": str},
+        "profiles": [PROFILE_SCHEMA],
+    },
+}
+
+TYPE_NAMES = {str: "a string", bool: "a boolean", int: "an integer", float: "a number"}
+
+
+class ConfigError(click.ClickException):
+    """Raised when pow.toml cannot be parsed or does not match the schema."""
+
+    def __init__(self, message: str):
+        super().__init__(click.style(message, fg="red"))
+
+
+class ProjectConfig(dict):
+    """Parsed pow.toml, with the project root and resolved profiles.
+
+    It is the plain configuration dictionary, so existing lookups such as
+    config.get("sim", {}) keep working, plus:
+
+    Attributes:
+        root: Directory containing pow.toml.
+        path: Path of pow.toml.
+        profiles: Profile name to profile resolved through its extends chain.
+    """
+
+    def __init__(self, data: dict, root: Path, profiles: dict[str, dict]):
+        super().__init__(data)
+        self.root = root
+        self.path = root / CONFIG_FILENAME
+        self.profiles = profiles
+
+
+def parse_toml(path: Path) -> dict:
+    """Parse a TOML file with tomllib, falling back to the toml package.
+
+    Raises:
+        ConfigError: If the file is not valid TOML.
+    """
+    try:
+        if tomllib is not None:
+            with open(path, "rb") as f:
+                return tomllib.load(f)
+        import toml
+
+        return toml.load(path)
+    except ValueError as e:  # TOMLDecodeError of both parsers
+        raise ConfigError(f"Invalid TOML in {path}: {e}")
+
+
+def validate(data, schema, where: str = "") -> None:
+    """Check the types of known keys; unknown keys are allowed.
+
+    Raises:
+        ConfigError: With the dotted path of the first invalid value.
+    """
+    if isinstance(schema, dict):
+        if not isinstance(data, dict):
+            raise ConfigError(f"pow.toml: '{where}' must be a table")
+        for key, sub_schema in schema.items():
+            if key in data:
+                validate(data[key], sub_schema, f"{where}.{key}" if where else key)
+    elif isinstance(schema, list):
+        if not isinstance(data, list):
+            raise ConfigError(f"pow.toml: '{where}' must be an array")
+        for i, item in enumerate(data):
+            validate(item, schema[0], f"{where}[{i}]")
+    elif not isinstance(data, schema) or (schema is int and isinstance(data, bool)):
+        raise ConfigError(f"pow.toml: '{where}' must be {TYPE_NAMES[schema]}")
+
+
+def merge_profile(base: dict, override: dict) -> dict:
+    """Merge a profile over a base profile using the per-key MERGE_RULES.
+
+    "union" lists keep the base entries and add new ones; an entry prefixed
+    with "-" removes it instead. "append" lists are concatenated. Tables are
+    merged recursively and any other value replaces the base value.
+    """
+    merged = dict(base)
+    for key, value in override.items():
+        rule = MERGE_RULES.get(key)
+        old = merged.get(key)
+        if rule in ("union", "append") and old is None:
+            old = []
+        if rule == "union" and isinstance(old, list) and isinstance(value, list):
+            removed = {v[1:] for v in value if isinstance(v, str) and v.startswith("-")}
+            result = [v for v in old if v not in removed]
+            result += [
+                v
+                for v in value
+                if not (isinstance(v, str) and v.startswith("-")) and v not in result
+            ]
+            merged[key] = result
+        elif rule == "append" and isinstance(old, list) and isinstance(value, list):
+            merged[key] = old + value
+        elif isinstance(old, dict) and isinstance(value, dict):
+            merged[key] = merge_profile(old, value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def compile_profiles(data: dict) -> dict[str, dict]:
+    """Resolve every profile through its extends chain, indexed by name.
+
+    A profile extends the profiles listed in its "extends" key, or the
+    default profile if it has none. Its ancestors are linearized (parents
+    before children, left to right, shared ancestors once) and merged in
+    that order, so a diamond does not apply the same layer twice. Lineages
+    are memoized, and the compiled config is cached by load_project_config.
+
+    Raises:
+        ConfigError: If a profile has no name, a name is used twice, or the
+            extends chain names an unknown profile or forms a cycle.
+    """
+    raw = {}
+    for i, profile in enumerate(data.get("sim", {}).get("profiles", [])):
+        name = profile.get("name")
+        if not name:
+            raise ConfigError(f"pow.toml: 'sim.profiles[{i}].name' is required")
+        if name in raw:
+            raise ConfigError(f"pow.toml: duplicate profile name '{name}'")
+        raw[name] = profile
+
+    lineages: dict[str, list[str]] = {}
+
+    def lineage(name: str, chain: list[str]) -> list[str]:
+        # ancestors first, each once (left to right), then the profile itself
+        if name in lineages:
+            return lineages[name]
+        if name in chain:
+            cycle = " -> ".join(chain[chain.index(name) :] + [name])
+            raise ConfigError(f"pow.toml: profile inheritance cycle: {cycle}")
+
+        parents = raw[name].get("extends")
+        if parents is None:
+            parents = ["default"] if name != "default" and "default" in raw else []
+        elif isinstance(parents, str):
+            parents = [parents]
+        if not isinstance(parents, list) or not all(
+            isinstance(p, str) for p in parents
+        ):
+            raise ConfigError(
+                f"pow.toml: 'extends' of profile '{name}' must be a profile name "
+                "or an array of profile names"
+            )
+
+        order: list[str] = []
+        for parent in parents:
+            if parent not in raw:
+                raise ConfigError(
+                    f"pow.toml: profile '{name}' extends unknown profile '{parent}'"
+                )
+            order += [n for n in lineage(parent, chain + [name]) if n not in order]
+        lineages[name] = order + [name]
+        return lineages[name]
+
+    resolved = {}
+    for name in raw:
+        merged: dict = {}
+        for layer in lineage(name, []):
+            merged = merge_profile(
+                merged, {k: v for k, v in raw[layer].items() if k != "extends"}
+            )
+        resolved[name] = merged
+    return resolved
+
+
+def compile_config(root: Path) -> ProjectConfig:
+    """Parse and validate pow.toml without using the cache."""
+    data = parse_toml(root / CONFIG_FILENAME)
+    validate(data, SCHEMA)
+    return ProjectConfig(data, root, compile_profiles(data))
+
+
+def _cache_file(path: Path) -> Path:
+    digest = hashlib.sha256(str(path).encode("utf-8")).hexdigest()[:16]
+    return get_cache_dir("config") / f"{digest}.pickle"
+
+
+def load_project_config(root: Path) -> ProjectConfig:
+    """Load the compiled configuration of a project, using the cache if valid.
+
+    The compiled config is cached in ~/.pow/cache/config, keyed on the
+    pow.toml path, mtime and size, so it is only parsed again after an edit.
+
+    Args:
+        root: Directory containing pow.toml.
+
+    Returns:
+        ProjectConfig: The validated configuration.
+
+    Raises:
+        FileNotFoundError: If pow.toml is not found.
+        ConfigError: If pow.toml is invalid.
+    """
+    root = root.resolve()
+    path = root / CONFIG_FILENAME
+    stat = path.stat()
+    key = (CACHE_VERSION, str(path), stat.st_mtime_ns, stat.st_size)
+
+    try:
+        cache_file = _cache_file(path)
+        with open(cache_file, "rb") as f:
+            cached_key, config = pickle.load(f)
+        if cached_key == key:
+            return config
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, AttributeError):
+        pass
+
+    config = compile_config(root)
+    try:
+        cache_file = _cache_file(path)
+        tmp = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp, "wb") as f:
+                pickle.dump((key, config), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, cache_file)
+        finally:
+            tmp.unlink(missing_ok=True)
+    except OSError:
+        pass  # read-only or full cache: compile again next time
+    return config
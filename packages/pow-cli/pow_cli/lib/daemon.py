@@ -0,0 +1,305 @@
+"""Supervise a warm Isaac Sim process and control it over UNIX sockets.
+
+The daemon owns two sockets:
+
+- the control socket, where clients (`pow sim run --attach`) send requests;
+- the bridge socket, where the supervised child connects back to receive
+  the requests it must execute (see data/kit_bridge.py).
+
+Both speak the same protocol: one JSON object per line, one response line
+per request line.
+"""
+
+import hashlib
+import json
+import os
+import socket
+import socketserver
+import stat
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+BRIDGE_ENV = "POW_SERVE_BRIDGE"
+INITIAL_BACKOFF = 1.0
+MAX_BACKOFF = 60.0
+# a child that ran this long is considered healthy, so backoff starts over
+STABLE_AFTER = 60.0
+READY_TIMEOUT = 300.0
+
+
+class DaemonError(Exception):
+    """Raised when the daemon or its child cannot handle a request."""
+
+
+def get_socket_dir() -> Path:
+    """Get the per-user directory holding daemon sockets.
+
+    Raises:
+        DaemonError: If the directory exists but is not a private directory
+            of the current user (e.g. another user created it in /tmp first).
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    path = Path(runtime_dir) / f"pow-{os.getuid()}"
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    info = path.lstat()
+    if (
+        not stat.S_ISDIR(info.st_mode)
+        or info.st_uid != os.getuid()
+        or info.st_mode & 0o077
+    ):
+        raise DaemonError(
+            f"Refusing to use {path} for daemon sockets: it must be a directory "
+            "owned by you with mode 0700"
+        )
+    return path
+
+
+def get_control_socket_path(project_root: Path) -> Path:
+    """Get the control socket of the daemon serving a project.
+
+    The name is a hash of the project root, keeping it below the UNIX
+    socket path length limit.
+    """
+    digest = hashlib.sha256(str(project_root.resolve()).encode()).hexdigest()[:16]
+    return get_socket_dir() / f"sim-{digest}.sock"
+
+
+def read_message(stream) -> dict | None:
+    """Read one JSON line, or None at end of stream."""
+    line = stream.readline()
+    if not line:
+        return None
+    return json.loads(line)
+
+
+def write_message(stream, message: dict) -> None:
+    """Write one JSON line and flush it."""
+    stream.write(json.dumps(message).encode("utf-8") + b"\n")
+    stream.flush()
+
+
+def send_request(
+    socket_path: Path, request: dict, timeout: float | None = None
+) -> dict:
+    """Send a request to a daemon control socket and wait for the response.
+
+    Args:
+        socket_path: Control socket of the daemon.
+        request: Request, e.g. {"op": "open_stage", "path": "..."}.
+        timeout: Seconds to wait for the response (default: no limit).
+
+    Returns:
+        dict: The response.
+
+    Raises:
+        DaemonError: If no daemon listens on the socket or it disconnected.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(str(socket_path))
+        except (FileNotFoundError, ConnectionRefusedError):
+            raise DaemonError(f"No daemon is listening on {socket_path}")
+        with sock.makefile("rwb") as stream:
+            write_message(stream, request)
+            response = read_message(stream)
+    if response is None:
+        raise DaemonError("The daemon closed the connection")
+    return response
+
+
+class Supervisor:
+    """Keep a child process running and forward requests to it.
+
+    The child gets the bridge socket path in $POW_SERVE_BRIDGE and must
+    connect to it once it is ready to execute requests. When it exits, it
+    is restarted after an exponential backoff that resets once a child has
+    stayed up for STABLE_AFTER seconds.
+
+    Args:
+        argv: Child command line.
+        bridge_path: Bridge socket path.
+        env: Child environment (default: inherited).
+        cwd: Child working directory.
+        log: Callable receiving supervisor log lines.
+    """
+
+    def __init__(
+        self,
+        argv: list[str],
+        bridge_path: Path,
+        env: dict[str, str] | None = None,
+        cwd: Path | None = None,
+        log=print,
+    ):
+        self.argv = argv
+        self.bridge_path = bridge_path
+        self.env = dict(env if env is not None else os.environ)
+        self.env[BRIDGE_ENV] = str(bridge_path)
+        self.cwd = cwd
+        self.log = log
+
+        self.process: subprocess.Popen | None = None
+        self.restarts = 0
+        self.started_at: float | None = None
+        self._stopping = threading.Event()
+        self._ready = threading.Condition()
+        self._bridge: socket.socket | None = None
+        self._bridge_stream = None
+        self._request_lock = threading.Lock()
+        self._listener: socket.socket | None = None
+
+    def start(self) -> None:
+        """Start listening for the child and the supervision thread."""
+        self.bridge_path.unlink(missing_ok=True)
+        self._listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._listener.bind(str(self.bridge_path))
+        self._listener.listen(1)
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+        threading.Thread(target=self._supervise_loop, daemon=True).start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Stop the child (SIGTERM, then SIGKILL) and do not restart it."""
+        self._stopping.set()
+        process = self.process
+        if process and process.poll() is None:
+            process.terminate()
+            try:
+                process.wait(timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        self._disconnect()
+        if self._listener:
+            self._listener.close()
+        self.bridge_path.unlink(missing_ok=True)
+
+    def status(self) -> dict:
+        process = self.process
+        running = process is not None and process.poll() is None
+        return {
+            "ok": True,
+            "pid": process.pid if running else None,
+            "ready": self._bridge is not None,
+            "restarts": self.restarts,
+            "uptime": round(time.monotonic() - self.started_at, 1)
+            if running and self.started_at
+            else 0.0,
+        }
+
+    def request(self, message: dict, ready_timeout: float = READY_TIMEOUT) -> dict:
+        """Forward a request to the child, waiting for it to be ready.
+
+        Raises:
+            DaemonError: If the child is not ready in time or crashed.
+        """
+        with self._request_lock:
+            with self._ready:
+                if not self._ready.wait_for(
+                    lambda: self._bridge is not None or self._stopping.is_set(),
+                    ready_timeout,
+                ):
+                    raise DaemonError("Isaac Sim did not become ready in time")
+                if self._stopping.is_set():
+                    raise DaemonError("The daemon is stopping")
+                stream = self._bridge_stream
+            try:
+                write_message(stream, message)
+                response = read_message(stream)
+            except (OSError, ValueError) as e:
+                response = None
+                self.log(f"Lost connection to the child: {e}")
+            if response is None:
+                self._disconnect()
+                raise DaemonError("Isaac Sim exited while handling the request")
+            return response
+
+    def _accept_loop(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                conn, _ = self._listener.accept()
+            except OSError:
+                return
+            self._disconnect()
+            with self._ready:
+                self._bridge = conn
+                self._bridge_stream = conn.makefile("rwb")
+                self._ready.notify_all()
+            self.log("Isaac Sim is ready.")
+
+    def _disconnect(self) -> None:
+        with self._ready:
+            if self._bridge is not None:
+                self._bridge_stream.close()
+                self._bridge.close()
+            self._bridge = None
+            self._bridge_stream = None
+            self._ready.notify_all()
+
+    def _supervise_loop(self) -> None:
+        backoff = INITIAL_BACKOFF
+        while not self._stopping.is_set():
+            self.started_at = time.monotonic()
+            try:
+                self.process = subprocess.Popen(self.argv, env=self.env, cwd=self.cwd)
+            except OSError as e:
+                self.log(f"Failed to start {self.argv[0]}: {e}")
+                returncode = None
+            else:
+                self.log(f"Started Isaac Sim (pid {self.process.pid}).")
+                returncode = self.process.wait()
+            self._disconnect()
+            if self._stopping.is_set():
+                return
+
+            if time.monotonic() - self.started_at >= STABLE_AFTER:
+                backoff = INITIAL_BACKOFF
+            self.restarts += 1
+            self.log(
+                f"Isaac Sim exited with code {returncode}, restarting in {backoff:.0f}s."
+            )
+            if self._stopping.wait(backoff):
+                return
+            backoff = min(backoff * 2, MAX_BACKOFF)
+
+
+class _ControlHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        daemon: ControlServer = self.server
+        while (request := read_message(self.rfile)) is not None:
+            op = request.get("op")
+            if op == "status":
+                response = daemon.supervisor.status()
+            elif op == "stop":
+                write_message(self.wfile, {"ok": True})
+                threading.Thread(target=daemon.shutdown, daemon=True).start()
+                return
+            else:
+                try:
+                    response = daemon.supervisor.request(request)
+                except DaemonError as e:
+                    response = {"ok": False, "error": str(e)}
+            write_message(self.wfile, response)
+
+
+class ControlServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Control socket server forwarding client requests to a Supervisor.
+
+    "status" and "stop" are answered by the daemon itself; every other
+    request is executed by the child.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path, supervisor: Supervisor):
+        socket_path.unlink(missing_ok=True)
+        super().__init__(str(socket_path), _ControlHandler)
+        os.chmod(socket_path, 0o600)
+        self.socket_path = socket_path
+        self.supervisor = supervisor
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.socket_path.unlink(missing_ok=True)
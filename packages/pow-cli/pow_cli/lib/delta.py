@@ -0,0 +1,110 @@
+"""Plan delta upgrades by comparing an archive against an installed tree."""
+
+import json
+import os
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from .extract import safe_member_path
+
+CRC_BLOCK_SIZE = 1024 * 1024  # 1MB
+
+
+def file_crc32(path: Path) -> int:
+    """Compute the CRC-32 of a file as stored in zip central directories."""
+    crc = 0
+    with open(path, "rb") as f:
+        while block := f.read(CRC_BLOCK_SIZE):
+            crc = zlib.crc32(block, crc)
+    return crc
+
+
+def load_install_manifest(path: Path) -> dict[str, tuple[int, int]]:
+    """Load the (size, CRC) of every member recorded at install time.
+
+    Args:
+        path: Install manifest written by save_install_manifest.
+
+    Returns:
+        dict[str, tuple[int, int]]: Member name to (size, CRC), empty if the
+            manifest does not exist.
+    """
+    try:
+        data = json.loads(path.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    return {name: (size, crc) for name, (size, crc) in data.items()}
+
+
+def save_install_manifest(path: Path, members: dict[str, tuple[int, int]]) -> None:
+    """Save the (size, CRC) of every installed member next to the tree."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(members, separators=(",", ":")))
+    os.replace(tmp, path)
+
+
+def plan_delta(
+    members: list[zipfile.ZipInfo],
+    old_root: Path,
+    old_name_for,
+    known: dict[str, tuple[int, int]] | None = None,
+    workers: int | None = None,
+) -> tuple[list[tuple[zipfile.ZipInfo, Path]], list[zipfile.ZipInfo]]:
+    """Split archive members into unchanged files and files to extract.
+
+    A member is unchanged if the matching installed file has the same size
+    and CRC-32. CRCs recorded at install time are trusted while the file
+    size still matches. Otherwise the installed file is hashed, in parallel,
+    but only if its size already matches.
+
+    Args:
+        members: Archive members from the central directory.
+        old_root: Directory the installed tree was extracted into.
+        old_name_for: Callable mapping a member name to the name of its
+            installed counterpart, or None if there is none.
+        known: Optional installed member name to (size, CRC) recorded at
+            install time.
+        workers: Number of threads used to hash installed files.
+
+    Returns:
+        tuple: (member, installed path) pairs that can be linked, and the
+            members that must be extracted.
+    """
+    known = known or {}
+    candidates = []
+    changed = []
+    for member in members:
+        old_name = None if member.is_dir() else old_name_for(member.filename)
+        if old_name is None:
+            changed.append(member)
+            continue
+        old_path = safe_member_path(old_root, old_name)
+        try:
+            if old_path.stat().st_size != member.file_size:
+                changed.append(member)
+                continue
+        except FileNotFoundError:
+            changed.append(member)
+            continue
+        candidates.append((member, old_name, old_path))
+
+    def crc_of(candidate: tuple[zipfile.ZipInfo, str, Path]) -> int:
+        member, old_name, old_path = candidate
+        recorded = known.get(old_name)
+        if recorded and recorded[0] == member.file_size:
+            return recorded[1]
+        return file_crc32(old_path)
+
+    unchanged = []
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        for (member, _, old_path), crc in zip(candidates, pool.map(crc_of, candidates)):
+            if crc == member.CRC:
+                unchanged.append((member, old_path))
+            else:
+                changed.append(member)
+
+    changed.sort(key=lambda m: m.header_offset)
+    return unchanged, changed
@@ -0,0 +1,475 @@
+"""Concurrent, segmented HTTP downloads with a global connection budget."""
+
+import json
+import os
+import shutil
+import struct
+import subprocess
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import click
+
+from .progress import ProgressLine, format_eta, format_size
+
+DEFAULT_MAX_CONNECTIONS = 16
+SEGMENT_SIZE = 64 * 1024 * 1024  # 64MB
+READ_BLOCK_SIZE = 256 * 1024  # 256KB
+STATE_SUFFIX = ".pow-download"
+HTTP_TIMEOUT = 30
+MAX_RETRIES = 5
+
+_SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3}
+
+
+def parse_size(value: str | int | None) -> int | None:
+    """Parse a human readable byte size such as "50M" or "1.5G".
+
+    Args:
+        value: Size string, plain integer, or None.
+
+    Returns:
+        int | None: Number of bytes, or None if value is empty.
+
+    Raises:
+        ValueError: If the value cannot be parsed.
+    """
+    if value is None or value == "" or value == 0:
+        return None
+    if isinstance(value, int):
+        return value
+
+    text = value.strip().upper().removesuffix("B").removesuffix("I")
+    unit = text[-1] if text and text[-1] in _SIZE_UNITS else ""
+    number = text[: len(text) - len(unit)]
+    return int(float(number) * _SIZE_UNITS[unit])
+
+
+class RangeNotSupportedError(OSError):
+    """Raised when a server answers a range request with the whole file."""
+
+
+def is_download_incomplete(dest: Path) -> bool:
+    """Check if a download left a resume sidecar from aria2c or pow.
+
+    Args:
+        dest: Destination file of the download.
+
+    Returns:
+        bool: True if an aria2c or pow resume state file exists next to dest.
+    """
+    return (
+        dest.with_name(dest.name + ".aria2").exists()
+        or dest.with_name(dest.name + STATE_SUFFIX).exists()
+    )
+
+
+class _RateLimiter:
+    """Token bucket shared by all connections to cap overall bandwidth."""
+
+    def __init__(self, rate: int | None):
+        self.rate = rate
+        self._tokens = float(rate or 0)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, amount: int) -> None:
+        if not self.rate:
+            return
+        # a block larger than one second of budget must still fit the bucket
+        capacity = float(max(self.rate, amount))
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    capacity, self._tokens + (now - self._last) * self.rate
+                )
+                self._last = now
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+                wait = (amount - self._tokens) / self.rate
+            time.sleep(min(wait, 0.5))
+
+
+class _Progress(ProgressLine):
+    """Combined throughput reporter for all running downloads."""
+
+    def __init__(self, total: int, done: int):
+        super().__init__(total, done)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._report, daemon=True)
+
+    def add(self, amount: int) -> None:
+        with self._lock:
+            self.done += amount
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.finish()
+
+    def _report(self) -> None:
+        while not self._stop.wait(0.5):
+            self.update()
+
+
+class _PartState:
+    """Resume state of one file, persisted to a JSON sidecar next to it.
+
+    The sidecar stores each segment as [start, end, done] where end is
+    exclusive and done is the number of bytes already written.
+    """
+
+    def __init__(self, url: str, dest: Path, size: int, segments: list[list[int]]):
+        self.url = url
+        self.dest = dest
+        self.size = size
+        self.segments = segments
+        self.state_path = dest.with_name(dest.name + STATE_SUFFIX)
+        self._lock = threading.Lock()
+        self._last_save = 0.0
+
+    @classmethod
+    def load_or_create(
+        cls, url: str, dest: Path, size: int, ranges: bool, segment_size: int
+    ) -> "_PartState":
+        state_path = dest.with_name(dest.name + STATE_SUFFIX)
+        if state_path.exists() and dest.exists():
+            try:
+                data = json.loads(state_path.read_text())
+                if data.get("size") == size and data.get("segments"):
+                    return cls(url, dest, size, data["segments"])
+            except (json.JSONDecodeError, OSError):
+                pass
+
+        step = segment_size if ranges else max(size, 1)
+        segments = [
+            [start, min(start + step, size), 0] for start in range(0, size, step)
+        ]
+        if not segments:
+            segments = [[0, 0, 0]]
+
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        with open(dest, "wb") as f:
+            f.truncate(size)
+        state = cls(url, dest, size, segments)
+        state.save(force=True)
+        return state
+
+    @property
+    def done(self) -> int:
+        return sum(seg[2] for seg in self.segments)
+
+    def advance(self, index: int, amount: int) -> None:
+        with self._lock:
+            self.segments[index][2] += amount
+        self.save()
+
+    def reset(self, index: int) -> int:
+        with self._lock:
+            lost = self.segments[index][2]
+            self.segments[index][2] = 0
+        return lost
+
+    def save(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and now - self._last_save < 1.0:
+            return
+        with self._lock:
+            self._last_save = now
+            data = {"url": self.url, "size": self.size, "segments": self.segments}
+            tmp = self.state_path.with_name(self.state_path.name + ".tmp")
+            tmp.write_text(json.dumps(data))
+            os.replace(tmp, self.state_path)
+
+    def finish(self) -> None:
+        self.state_path.unlink(missing_ok=True)
+
+
+def probe(url: str) -> tuple[int, bool]:
+    """Get the size of a remote file and whether it supports range requests.
+
+    Args:
+        url: URL of the remote file.
+
+    Returns:
+        tuple[int, bool]: Content length in bytes and range support flag.
+
+    Raises:
+        urllib.error.URLError: If the server cannot be reached.
+    """
+    request = urllib.request.Request(url, headers={"Range": "bytes=0-0"})
+    with urllib.request.urlopen(request, timeout=HTTP_TIMEOUT) as response:
+        if response.status == 206:
+            content_range = response.headers.get("Content-Range", "")
+            return int(content_range.rsplit("/", 1)[-1]), True
+        return int(response.headers.get("Content-Length", 0)), False
+
+
+def fetch_range(
+    url: str,
+    dest: Path,
+    start: int,
+    end: int,
+    on_data=None,
+    limiter: _RateLimiter | None = None,
+) -> None:
+    """Fetch bytes [start, end) of a remote file into the same offset of dest.
+
+    Args:
+        url: URL of the remote file.
+        dest: Existing local file to write into.
+        start: First byte offset to fetch.
+        end: Exclusive end offset.
+        on_data: Optional callback receiving the number of bytes written.
+        limiter: Optional shared bandwidth limiter.
+
+    Raises:
+        urllib.error.URLError: If the request fails.
+        RangeNotSupportedError: If the server ignores the range request.
+        OSError: If the server closes the connection early.
+    """
+    if start >= end:
+        return
+
+    headers = {"Range": f"bytes={start}-{end - 1}"}
+    request = urllib.request.Request(url, headers=headers)
+    with urllib.request.urlopen(request, timeout=HTTP_TIMEOUT) as response:
+        if response.status != 206 and start != 0:
+            raise RangeNotSupportedError(
+                f"Server does not support range requests: {url}"
+            )
+
+        with open(dest, "r+b", buffering=0) as f:
+            f.seek(start)
+            remaining = end - start
+            while remaining > 0:
+                block = response.read(min(READ_BLOCK_SIZE, remaining))
+                if not block:
+                    raise OSError(f"Connection closed early while fetching {url}")
+                if limiter:
+                    limiter.consume(len(block))
+                f.write(block)
+                remaining -= len(block)
+                if on_data:
+                    on_data(len(block))
+
+
+class _Cancelled(Exception):
+    """Raised inside a worker when another segment failed or the user aborted."""
+
+
+def _download_segment(
+    state: _PartState,
+    index: int,
+    progress: _Progress,
+    limiter: _RateLimiter,
+    cancel: threading.Event,
+) -> None:
+    def on_data(amount: int) -> None:
+        state.advance(index, amount)
+        progress.add(amount)
+        if cancel.is_set():
+            raise _Cancelled()
+
+    for attempt in range(MAX_RETRIES):
+        start, end, done = state.segments[index]
+        if start + done >= end or cancel.is_set():
+            return
+
+        try:
+            fetch_range(state.url, state.dest, start + done, end, on_data, limiter)
+            return
+        except RangeNotSupportedError:
+            # restart a non-resumable segment from its beginning
+            progress.add(-state.reset(index))
+            if attempt == MAX_RETRIES - 1:
+                raise
+        except (urllib.error.URLError, OSError, TimeoutError):
+            if attempt == MAX_RETRIES - 1:
+                raise
+            time.sleep(2**attempt)
+
+
+def _download_with_python(
+    jobs: list[tuple[str, Path]],
+    max_connections: int,
+    max_bandwidth: int | None,
+    segment_size: int,
+) -> int:
+    states = []
+    for url, dest in jobs:
+        size, ranges = probe(url)
+        states.append(_PartState.load_or_create(url, dest, size, ranges, segment_size))
+
+    # Interleave segments across files so every part progresses at the same time
+    work = []
+    longest = max(len(s.segments) for s in states)
+    for i in range(longest):
+        for state in states:
+            if i < len(state.segments):
+                work.append((state, i))
+
+    limiter = _RateLimiter(max_bandwidth)
+    cancel = threading.Event()
+    total = sum(s.size for s in states)
+    initial = sum(s.done for s in states)
+    with _Progress(total, initial) as progress:
+        pool = ThreadPoolExecutor(max_workers=max_connections)
+        futures = [
+            pool.submit(_download_segment, state, i, progress, limiter, cancel)
+            for state, i in work
+        ]
+        try:
+            for future in futures:
+                future.result()
+        except BaseException:
+            cancel.set()
+            raise
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+            for state in states:
+                state.save(force=True)
+
+    for state in states:
+        state.finish()
+    return progress.done - initial
+
+
+def _aria2_completed(dest: Path) -> int:
+    """Get the bytes of dest aria2c already downloaded, from its control file.
+
+    Only the pieces marked complete in the control file's bitfield are
+    counted. Without a control file, a partial dest is resumed from its size.
+    """
+    control = dest.with_name(dest.name + ".aria2")
+    try:
+        data = control.read_bytes()
+    except FileNotFoundError:
+        return dest.stat().st_size if dest.exists() else 0
+    try:
+        # version 1 is big-endian, version 0 uses the host byte order
+        order = ">" if data[:2] == b"\x00\x01" else "="
+        (hash_length,) = struct.unpack_from(order + "I", data, 6)
+        offset = 10 + hash_length
+        piece_length, total, _, bitfield_length = struct.unpack_from(
+            order + "IQQI", data, offset
+        )
+        offset += 24
+        bitfield = data[offset : offset + bitfield_length]
+    except (struct.error, IndexError):
+        return 0
+    pieces = sum(byte.bit_count() for byte in bitfield)
+    return min(pieces * piece_length, total)
+
+
+def _download_with_aria2c(
+    jobs: list[tuple[str, Path]],
+    max_connections: int,
+    max_bandwidth: int | None,
+    segment_size: int,
+) -> int:
+    """Download with aria2c.
+
+    Returns:
+        int: Number of bytes fetched, not counting resumed data.
+    """
+    initial = sum(_aria2_completed(dest) for _, dest in jobs)
+    _run_aria2c(jobs, max_connections, max_bandwidth, segment_size)
+    final = sum(dest.stat().st_size for _, dest in jobs if dest.exists())
+    return max(final - initial, 0)
+
+
+def _run_aria2c(
+    jobs: list[tuple[str, Path]],
+    max_connections: int,
+    max_bandwidth: int | None,
+    segment_size: int,
+) -> None:
+    per_file = max(1, min(16, max_connections // len(jobs)))
+    with tempfile.NamedTemporaryFile("w", suffix=".aria2-input", delete=False) as f:
+        for url, dest in jobs:
+            f.write(f"{url}\n  dir={dest.parent}\n  out={dest.name}\n")
+        input_file = f.name
+
+    command = [
+        "aria2c",
+        "--input-file",
+        input_file,
+        "--continue=true",
+        f"--max-concurrent-downloads={len(jobs)}",
+        f"--max-connection-per-server={per_file}",
+        f"--split={per_file}",
+        f"--min-split-size={segment_size // (1024 * 1024)}M",
+        "--console-log-level=warn",
+    ]
+    if max_bandwidth:
+        command.append(f"--max-overall-download-limit={max_bandwidth}")
+
+    try:
+        subprocess.run(command, check=True)
+    finally:
+        os.unlink(input_file)
+
+
+def download_files(
+    jobs: list[tuple[str, Path]],
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    max_bandwidth: int | None = None,
+    segment_size: int = SEGMENT_SIZE,
+    use_aria2c: bool | None = None,
+) -> None:
+    """Download several files at the same time using segmented range requests.
+
+    All files share one connection budget and one bandwidth budget. Uses
+    aria2c when it is installed and falls back to a pure Python downloader
+    otherwise. Both keep per-file resume state next to the destination.
+
+    Args:
+        jobs: List of (url, destination path) pairs.
+        max_connections: Total number of connections across all files.
+        max_bandwidth: Overall bandwidth limit in bytes per second (None = unlimited).
+        segment_size: Size of each range request segment in bytes.
+        use_aria2c: Force (True) or disable (False) aria2c; auto-detect if None.
+
+    Returns:
+        None
+
+    Raises:
+        subprocess.CalledProcessError: If aria2c download fails.
+        urllib.error.URLError: If the Python downloader fails after retries.
+    """
+    if not jobs:
+        return
+
+    if use_aria2c is None:
+        use_aria2c = shutil.which("aria2c") is not None
+
+    start = time.monotonic()
+
+    if use_aria2c:
+        fetched = _download_with_aria2c(
+            jobs, max_connections, max_bandwidth, segment_size
+        )
+    else:
+        fetched = _download_with_python(
+            jobs, max_connections, max_bandwidth, segment_size
+        )
+
+    elapsed = time.monotonic() - start
+    if elapsed > 0:
+        click.echo(
+            f"Downloaded {len(jobs)} file(s) in {format_eta(elapsed)}"
+            f" ({format_size(fetched / elapsed)}/s combined)"
+        )
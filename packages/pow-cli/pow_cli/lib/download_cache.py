@@ -0,0 +1,176 @@
+"""User-level content-addressed cache of downloaded files, shared by projects.
+
+Files are stored by content id under objects/ (see store.object_path) and
+looked up by file name through refs/<name>.json, which records the content
+id and size. The content id is the sha256 of the file's chunk manifest (see
+integrity.compute_manifest), so caching a verified download reuses the
+chunk hashes computed to verify it. Each object keeps its manifest next to
+it, which `pow sim assets serve` publishes so clients can verify and repair
+what they fetched.
+
+A file that could only be checked by size is added as pending: its ref
+records the path it was added from, and it is neither found nor served
+until confirm_in_cache is called for that path (after its extraction
+passed every CRC check).
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from .cache import get_cache_dir
+from .integrity import CHUNK_SIZE, get_manifest, manifest_path, save_manifest
+from .links import link_file
+from .store import object_path
+
+
+def get_download_cache_path(pow_config: dict) -> Path:
+    """Get the download cache ([sim.assets] download_cache, or ~/.pow/cache/downloads)."""
+    path = pow_config.get("sim", {}).get("assets", {}).get("download_cache", "")
+    if path:
+        return Path(path).expanduser()
+    return get_cache_dir("downloads")
+
+
+def content_id(manifest: dict) -> str:
+    """Get the content id of a file from its chunk manifest."""
+    key = {
+        "size": manifest["size"],
+        "chunk_size": manifest["chunk_size"],
+        "algorithm": manifest["algorithm"],
+        "chunks": manifest["chunks"],
+    }
+    return hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()
+
+
+def _ref_path(cache: Path, name: str) -> Path:
+    return cache / "refs" / f"{name}.json"
+
+
+def find_in_cache(cache: Path, name: str) -> Path | None:
+    """Find the cached object of a file name, if it is complete.
+
+    Returns:
+        Path | None: The object, or None if the name is not cached.
+    """
+    if "/" in name or name.startswith("."):
+        return None
+    try:
+        ref = json.loads(_ref_path(cache, name).read_text())
+        if ref.get("pending"):
+            return None
+        obj = object_path(cache, ref["id"])
+        if obj.stat().st_size == ref["size"]:
+            return obj
+    except (OSError, ValueError, KeyError):
+        pass
+    return None
+
+
+def list_refs(cache: Path) -> dict[str, dict]:
+    """List the cached file names and their refs ({"id", "size"}), not pending."""
+    refs = {}
+    try:
+        entries = list(os.scandir(cache / "refs"))
+    except OSError:
+        return refs
+    for entry in entries:
+        if not entry.name.endswith(".json") or entry.name.startswith("."):
+            continue
+        try:
+            ref = json.loads(Path(entry.path).read_text())
+        except (OSError, ValueError):
+            continue
+        if not ref.get("pending"):
+            refs[entry.name.removesuffix(".json")] = ref
+    return refs
+
+
+def restore_from_cache(cache: Path, name: str, dest: Path) -> str | None:
+    """Link or copy a cached file to dest.
+
+    The object's manifest is copied along as dest's manifest sidecar, so it
+    is not hashed again when verified.
+
+    Returns:
+        str | None: The link method used (see links.link_file), or None if
+            the name is not cached.
+    """
+    obj = find_in_cache(cache, name)
+    if obj is None:
+        return None
+    method = link_file(obj, dest)
+    try:
+        manifest = json.loads(manifest_path(obj).read_text())
+        stat = dest.stat()
+        save_manifest(
+            dest, {**manifest, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        )
+    except (OSError, ValueError):
+        pass
+    return method
+
+
+def _write_ref(cache: Path, name: str, ref: dict) -> None:
+    ref_path = _ref_path(cache, name)
+    ref_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = ref_path.with_name(f".{ref_path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(ref))
+    os.replace(tmp, ref_path)
+
+
+def add_to_cache(
+    cache: Path, path: Path, chunk_size: int = CHUNK_SIZE, pending: bool = False
+) -> tuple[str, bool]:
+    """Add a downloaded file to the cache under its file name.
+
+    The file is linked into the cache (reflink or hard link when possible,
+    copied otherwise), so caching large parts costs no extra space on the
+    same filesystem. A hard-linked file is never rewritten in place (see
+    integrity.repair_chunks): a repaired file is added again, under its
+    new content id.
+
+    Args:
+        cache: Download cache directory.
+        path: File to add.
+        chunk_size: Size of each hashed chunk in bytes.
+        pending: If True, the file is not used until confirm_in_cache.
+
+    Returns:
+        tuple[str, bool]: Content id and whether the object was new.
+    """
+    manifest = get_manifest(path, chunk_size)
+    digest = content_id(manifest)
+    obj = object_path(cache, digest)
+    created = False
+    if not obj.exists():
+        tmp = obj.with_name(f".{obj.name}.{os.getpid()}.tmp")
+        link_file(path, tmp)
+        os.replace(tmp, obj)
+        created = True
+    stat = obj.stat()
+    save_manifest(obj, {**manifest, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns})
+
+    ref = {"id": digest, "size": stat.st_size}
+    if pending and find_in_cache(cache, path.name) != obj:
+        ref["pending"] = str(path.resolve())  # unless already confirmed
+    _write_ref(cache, path.name, ref)
+    return digest, created
+
+
+def confirm_in_cache(cache: Path, path: Path) -> bool:
+    """Make a file added as pending from path available.
+
+    Returns:
+        bool: Whether a pending ref of path was confirmed.
+    """
+    try:
+        ref = json.loads(_ref_path(cache, path.name).read_text())
+    except (OSError, ValueError):
+        return False
+    if ref.get("pending") != str(path.resolve()):
+        return False
+    del ref["pending"]
+    _write_ref(cache, path.name, ref)
+    return True
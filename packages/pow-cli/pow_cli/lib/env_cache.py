@@ -0,0 +1,105 @@
+"""Cache environments captured by sourcing shell setup files."""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from .cache import get_cache_dir
+
+CACHE_NAME = "ros-env"
+MAX_ENTRIES = 32
+
+# Base variables that change what sourcing a ROS setup file produces
+RELEVANT_PREFIXES = ("ROS_", "AMENT_", "COLCON_", "RMW_")
+RELEVANT_VARS = (
+    "PATH",
+    "LD_LIBRARY_PATH",
+    "PYTHONPATH",
+    "CMAKE_PREFIX_PATH",
+    "PKG_CONFIG_PATH",
+)
+
+# Variables the shell itself sets, never part of the setup file's delta
+SHELL_VARS = ("_", "SHLVL", "PWD", "OLDPWD")
+
+
+def parse_env0(output: str) -> dict[str, str]:
+    """Parse the NUL-delimited output of `env -0`."""
+    env = {}
+    for entry in output.split("\0"):
+        key, sep, value = entry.partition("=")
+        if sep and key:
+            env[key] = value
+    return env
+
+
+def env_cache_key(
+    setup_files: list[Path], shell: str, distro: str, base_env: dict[str, str]
+) -> str:
+    """Compute the cache key of a sourced environment.
+
+    The key covers each setup file's size and mtime, the mtime of the install
+    folder holding it (which changes when packages are added or removed), the
+    shell, the ROS distro and the base variables that affect sourcing.
+
+    Returns:
+        str: Hex digest identifying the environment.
+    """
+    files = []
+    for path in setup_files:
+        stat = path.stat()
+        files.append(
+            [str(path), stat.st_size, stat.st_mtime_ns, path.parent.stat().st_mtime_ns]
+        )
+    relevant = {
+        key: value
+        for key, value in base_env.items()
+        if key in RELEVANT_VARS or key.startswith(RELEVANT_PREFIXES)
+    }
+    data = {"files": files, "shell": shell, "distro": distro, "env": relevant}
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def diff_env(base: dict[str, str], new: dict[str, str]) -> dict:
+    """Get the variables set and unset going from base to new."""
+    return {
+        "set": {
+            key: value
+            for key, value in new.items()
+            if key not in SHELL_VARS and base.get(key) != value
+        },
+        "unset": sorted(
+            key for key in base if key not in new and key not in SHELL_VARS
+        ),
+    }
+
+
+def apply_env_delta(base: dict[str, str], delta: dict) -> dict[str, str]:
+    """Apply a delta from diff_env to an environment."""
+    env = {key: value for key, value in base.items() if key not in delta["unset"]}
+    env.update(delta["set"])
+    return env
+
+
+def load_env_delta(key: str) -> dict | None:
+    """Load a cached environment delta, or None if not cached."""
+    try:
+        return json.loads((get_cache_dir(CACHE_NAME) / f"{key}.json").read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def save_env_delta(key: str, delta: dict) -> None:
+    """Cache an environment delta, keeping only the most recent entries."""
+    cache_dir = get_cache_dir(CACHE_NAME)
+    path = cache_dir / f"{key}.json"
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(delta))
+    os.replace(tmp, path)
+
+    entries = sorted(
+        cache_dir.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True
+    )
+    for stale in entries[MAX_ENTRIES:]:
+        stale.unlink(missing_ok=True)
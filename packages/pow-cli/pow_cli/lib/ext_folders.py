@@ -0,0 +1,39 @@
+"""Locate the extension folders passed to Kit: pow.toml's and the mirror's.
+
+Kept apart from ext_mirror, which fetches and unpacks archives, so
+launching does not import the network and zip modules.
+"""
+
+import os
+from pathlib import Path
+
+from .cache import get_cache_dir
+
+
+def get_mirror_path(config: dict) -> Path:
+    """Get the mirror directory ([sim.ext_mirror] path, or ~/.pow/cache/ext-mirror)."""
+    path = config.get("sim", {}).get("ext_mirror", {}).get("path", "")
+    if path:
+        return Path(path).expanduser()
+    return get_cache_dir("ext-mirror")
+
+
+def get_mirror_ext_folder(config: dict) -> Path | None:
+    """Get the mirror's extension folder, or None if nothing was synced."""
+    folder = get_mirror_path(config) / "exts"
+    try:
+        with os.scandir(folder) as it:
+            if any(not entry.name.startswith(".") for entry in it):
+                return folder
+    except OSError:
+        pass
+    return None
+
+
+def get_ext_folders(config: dict) -> list[str]:
+    """Get the ext_folders of pow.toml followed by the mirror's folder."""
+    ext_folders = list(config.get("sim", {}).get("ext_folders", []))
+    mirror_folder = get_mirror_ext_folder(config)
+    if mirror_folder is not None and str(mirror_folder) not in ext_folders:
+        ext_folders.append(str(mirror_folder))
+    return ext_folders
@@ -0,0 +1,256 @@
+"""Index Kit extension folders and resolve extension dependency closures.
+
+An extension is a folder holding config/extension.toml, named
+<name>[-<version>]. Each extension folder's index is cached in
+~/.pow/cache/ext-index together with the mtimes of the directories scanned
+and the extension.toml files parsed, and is only rebuilt when one changed.
+"""
+
+import hashlib
+import os
+import pickle
+import re
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+from .cache import get_cache_dir
+from .config import ConfigError, parse_toml
+
+# bump when the cached layout changes
+INDEX_VERSION = 1
+# how deep extensions are searched for below an extension folder
+MAX_DEPTH = 4
+SKIPPED_DIRS = {"__pycache__", "node_modules", "data", "docs"}
+# extension folders shipped with Isaac Sim, relative to the isaacsim package
+BUILTIN_EXT_FOLDERS = (
+    "exts",
+    "extscore",
+    "extsDeprecated",
+    "extscache",
+    "extsPhysics",
+    "kit/exts",
+    "kit/extscore",
+)
+
+NAME_VERSION_RE = re.compile(r"^(?P<name>.+?)-(?P<version>\d[\w.+\-]*)$")
+
+
+def split_ext_id(ext_id: str) -> tuple[str, str]:
+    """Split "omni.foo-1.2.3" into ("omni.foo", "1.2.3"); version may be ""."""
+    match = NAME_VERSION_RE.match(ext_id)
+    if match:
+        return match["name"], match["version"]
+    return ext_id, ""
+
+
+def _read_extension(path: Path) -> dict:
+    name, dir_version = split_ext_id(path.name)
+    toml_path = path / "config" / "extension.toml"
+    try:
+        data = parse_toml(toml_path)
+    except (ConfigError, OSError) as e:
+        return {
+            "name": name,
+            "version": dir_version,
+            "path": str(path),
+            "error": str(e),
+        }
+    dependencies = {}
+    for dep, spec in data.get("dependencies", {}).items():
+        version = spec.get("version", "") if isinstance(spec, dict) else ""
+        optional = isinstance(spec, dict) and spec.get("optional", False)
+        if not optional:
+            dependencies[dep] = str(version)
+    return {
+        "name": name,
+        "version": str(data.get("package", {}).get("version", dir_version)),
+        "path": str(path),
+        "dependencies": dependencies,
+    }
+
+
+def _scan_dir(path: str, depth: int) -> tuple[int, list[tuple[str, int]], list[dict]]:
+    """List one directory: its mtime, subdirs to descend into, extensions."""
+    subdirs, extensions = [], []
+    mtime = os.stat(path).st_mtime_ns
+    with os.scandir(path) as it:
+        for entry in it:
+            if not entry.is_dir() or entry.name.startswith("."):
+                continue
+            toml_path = os.path.join(entry.path, "config", "extension.toml")
+            try:
+                toml_mtime = os.stat(toml_path).st_mtime_ns
+            except OSError:
+                if depth < MAX_DEPTH and entry.name not in SKIPPED_DIRS:
+                    subdirs.append((entry.path, depth + 1))
+                continue
+            extension = _read_extension(Path(entry.path))
+            extension["toml_mtime"] = (toml_path, toml_mtime)
+            extensions.append(extension)
+    return mtime, subdirs, extensions
+
+
+def scan_folder(folder: Path, pool: ThreadPoolExecutor) -> dict:
+    """Scan an extension folder, listing its directories in parallel.
+
+    Returns:
+        dict: {"dirs": {path: mtime_ns}, "tomls": {path: mtime_ns},
+            "extensions": [extension, ...]}.
+    """
+    dirs, tomls, extensions = {}, {}, []
+    pending = {pool.submit(_scan_dir, str(folder), 1): str(folder)}
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            path = pending.pop(future)
+            try:
+                mtime, subdirs, found = future.result()
+            except OSError:
+                continue
+            dirs[path] = mtime
+            for extension in found:
+                toml_path, toml_mtime = extension.pop("toml_mtime")
+                tomls[toml_path] = toml_mtime
+                extensions.append(extension)
+            for subdir, depth in subdirs:
+                pending[pool.submit(_scan_dir, subdir, depth)] = subdir
+    return {"dirs": dirs, "tomls": tomls, "extensions": extensions}
+
+
+def _is_fresh(index: dict) -> bool:
+    for paths in (index["dirs"], index["tomls"]):
+        for path, mtime in paths.items():
+            try:
+                if os.stat(path).st_mtime_ns != mtime:
+                    return False
+            except OSError:
+                return False
+    return True
+
+
+def _cache_file(folder: Path) -> Path:
+    digest = hashlib.sha256(str(folder).encode("utf-8")).hexdigest()[:16]
+    return get_cache_dir("ext-index") / f"{digest}.pickle"
+
+
+def load_folder_index(folder: Path, pool: ThreadPoolExecutor) -> dict:
+    """Get the index of an extension folder, rescanning it if it changed."""
+    try:
+        cache_file = _cache_file(folder)
+        with open(cache_file, "rb") as f:
+            version, cached_folder, index = pickle.load(f)
+        if (
+            version == INDEX_VERSION
+            and cached_folder == str(folder)
+            and _is_fresh(index)
+        ):
+            return index
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        pass
+
+    index = scan_folder(folder, pool)
+    try:
+        cache_file = _cache_file(folder)
+        tmp = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp, "wb") as f:
+                pickle.dump((INDEX_VERSION, str(folder), index), f)
+            os.replace(tmp, cache_file)
+        finally:
+            tmp.unlink(missing_ok=True)
+    except OSError:
+        pass  # read-only or full cache: scan again next time
+    return index
+
+
+def build_ext_index(folders: list[Path], workers: int = 16) -> dict[str, list[dict]]:
+    """Index extension folders, indexed by extension name.
+
+    Returns:
+        dict[str, list[dict]]: Extension name to its candidates, each with
+            name, version, path, dependencies and the "folder" holding it.
+    """
+    index: dict[str, list[dict]] = {}
+    folders = [folder for folder in folders if folder.is_dir()]
+    if not folders:
+        return index
+    # folders are loaded concurrently, their directories share one pool
+    with (
+        ThreadPoolExecutor(max_workers=workers) as pool,
+        ThreadPoolExecutor(max_workers=len(folders)) as loaders,
+    ):
+        folder_indexes = list(
+            zip(folders, loaders.map(lambda f: load_folder_index(f, pool), folders))
+        )
+    for folder, folder_index in folder_indexes:
+        for extension in folder_index["extensions"]:
+            index.setdefault(extension["name"], []).append(
+                {**extension, "folder": str(folder)}
+            )
+    return index
+
+
+def _version_key(version: str) -> tuple:
+    return tuple(int(part) for part in re.findall(r"\d+", version.split("+")[0]))
+
+
+def version_matches(version: str, required: str) -> bool:
+    """Check a version against a Kit dependency version (same major, not older)."""
+    if not required:
+        return True
+    have, want = _version_key(version), _version_key(required)
+    if not have or not want:
+        return True
+    return have[0] == want[0] and have >= want
+
+
+def resolve_closure(
+    extensions: list[str], index: dict[str, list[dict]], builtin: set[str]
+) -> dict:
+    """Resolve the dependency closure of extensions over the index.
+
+    Builtin extensions (shipped with Isaac Sim) end the traversal, Kit
+    resolves their dependencies itself.
+
+    Returns:
+        dict: "selected" (name to the chosen candidate), "missing" (name to
+            the extensions requiring it) and "conflicts" (name to a message).
+    """
+    selected: dict[str, dict] = {}
+    missing: dict[str, list[str]] = {}
+    conflicts: dict[str, str] = {}
+    pending = [(*split_ext_id(ext), "profile") for ext in extensions]
+    while pending:
+        name, required, requester = pending.pop()
+        candidates = index.get(name, [])
+        if not candidates:
+            if name not in builtin:
+                missing.setdefault(name, []).append(requester)
+            continue
+        if name in selected:
+            if not version_matches(selected[name]["version"], required):
+                conflicts[name] = (
+                    f"{requester} requires {required}, "
+                    f"{selected[name]['version']} is selected"
+                )
+            continue
+        matching = [c for c in candidates if version_matches(c["version"], required)]
+        if not matching:
+            versions = ", ".join(sorted({c["version"] for c in candidates}))
+            conflicts[name] = f"{requester} requires {required}, found {versions}"
+            matching = candidates
+        # Kit picks the highest version
+        chosen = max(matching, key=lambda c: _version_key(c["version"]))
+        selected[name] = chosen
+        if "error" in chosen:
+            conflicts[name] = f"invalid extension.toml: {chosen['error']}"
+        for dep, version in chosen.get("dependencies", {}).items():
+            pending.append((dep, version, name))
+    return {"selected": selected, "missing": missing, "conflicts": conflicts}
+
+
+def get_builtin_ext_folders(isaacsim_path: Path | None) -> list[Path]:
+    """Get the extension folders shipped with Isaac Sim."""
+    if isaacsim_path is None:
+        return []
+    return [isaacsim_path / folder for folder in BUILTIN_EXT_FOLDERS]
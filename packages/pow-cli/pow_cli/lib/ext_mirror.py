@@ -0,0 +1,233 @@
+"""Mirror Kit extensions from a registry into a local content-addressed store.
+
+A registry is a directory served over HTTP (or read through a file:// URL)
+holding index.json:
+
+    {"version": 1, "packages": [{"name": "omni.foo", "version": "1.2.0",
+      "dependencies": {"omni.bar": "1.0"}, "archive": "objects/ab/cdef...",
+      "sha256": "abcdef...", "size": 1234}, ...]}
+
+Archives are zip files of an extension folder's content, "archive" is
+relative to index.json. The mirror stores archives by sha256 under objects/
+and extracts them to exts/<name>-<version>, the folder passed to Kit. It
+writes an index.json of the same format, so a mirror can be served (e.g.
+`python -m http.server -d <mirror>`) as the registry of other machines.
+The mirror's location is given by ext_folders.get_mirror_path.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from .config import ConfigError
+from .download import HTTP_TIMEOUT, MAX_RETRIES, READ_BLOCK_SIZE
+from .extract import safe_member_path
+from .store import hash_file, object_path
+
+INDEX_NAME = "index.json"
+REGISTRY_VERSION = 1
+# written into each extracted extension, to know which archive it came from
+SOURCE_MARKER = ".pow-sha256"
+
+
+def index_url(registry: str) -> str:
+    """Get the URL of a registry's index.json (registry may be a local path)."""
+    if "://" not in registry:
+        registry = Path(registry).expanduser().resolve().as_uri()
+    return registry.rstrip("/") + "/" + INDEX_NAME
+
+
+def load_registry_index(registry: str) -> dict[str, list[dict]]:
+    """Fetch a registry's index.json, indexed by extension name.
+
+    Returns:
+        dict[str, list[dict]]: Extension name to its candidates, in the
+            layout of ext_index.build_ext_index, with the archive "url",
+            "sha256" and "size".
+
+    Raises:
+        urllib.error.URLError: If the registry cannot be reached.
+        ConfigError: If index.json is not a registry index.
+    """
+    url = index_url(registry)
+    with urllib.request.urlopen(url, timeout=HTTP_TIMEOUT) as response:
+        try:
+            data = json.loads(response.read())
+        except ValueError as e:
+            raise ConfigError(f"Invalid registry index {url}: {e}")
+    if not isinstance(data, dict) or data.get("version") != REGISTRY_VERSION:
+        raise ConfigError(f"Unsupported registry index {url}")
+
+    index: dict[str, list[dict]] = {}
+    for package in data.get("packages", []):
+        index.setdefault(package["name"], []).append(
+            {
+                "name": package["name"],
+                "version": str(package.get("version", "")),
+                "dependencies": package.get("dependencies", {}),
+                "url": urllib.parse.urljoin(url, package["archive"]),
+                "sha256": package["sha256"],
+                "size": package.get("size"),
+                "folder": registry,
+            }
+        )
+    return index
+
+
+def merge_indexes(
+    local: dict[str, list[dict]], registry: dict[str, list[dict]]
+) -> dict[str, list[dict]]:
+    """Add registry candidates for the extensions not found locally.
+
+    Extensions available in ext_folders or Isaac Sim are never fetched,
+    Kit would load the local copy anyway.
+    """
+    merged = dict(local)
+    for name, candidates in registry.items():
+        merged.setdefault(name, candidates)
+    return merged
+
+
+def _download(url: str, dest: Path, sha256: str, size: int | None) -> int:
+    """Download url to dest, checking its size and sha256 while streaming."""
+    tmp = dest.with_name(f".{dest.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    for attempt in range(MAX_RETRIES):
+        digest, received = hashlib.sha256(), 0
+        try:
+            with (
+                urllib.request.urlopen(url, timeout=HTTP_TIMEOUT) as response,
+                open(tmp, "wb") as f,
+            ):
+                while block := response.read(READ_BLOCK_SIZE):
+                    digest.update(block)
+                    f.write(block)
+                    received += len(block)
+            if size is not None and received != size:
+                raise OSError(f"{url}: expected {size} bytes, got {received}")
+            if digest.hexdigest() != sha256:
+                raise OSError(f"{url}: sha256 mismatch")
+            os.replace(tmp, dest)
+            return received
+        except (OSError, urllib.error.URLError, TimeoutError):
+            tmp.unlink(missing_ok=True)
+            if attempt == MAX_RETRIES - 1:
+                raise
+            time.sleep(2**attempt)
+    return 0
+
+
+def _extract(archive: Path, dest: Path, sha256: str) -> None:
+    """Extract an archive to dest through a temporary folder."""
+    tmp = dest.with_name(f".{dest.name}.{os.getpid()}.tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+    with zipfile.ZipFile(archive) as zf:
+        for member in zf.infolist():
+            target = safe_member_path(tmp, member.filename)
+            if member.is_dir():
+                target.mkdir(parents=True, exist_ok=True)
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with zf.open(member) as src, open(target, "wb") as dst:
+                shutil.copyfileobj(src, dst, READ_BLOCK_SIZE)
+    (tmp / SOURCE_MARKER).write_text(sha256)
+    shutil.rmtree(dest, ignore_errors=True)
+    os.replace(tmp, dest)
+
+
+def mirror_package(mirror: Path, candidate: dict, verify: bool = False) -> int:
+    """Store a registry package in the mirror and extract it.
+
+    Archives already in the mirror are not fetched again; with verify, their
+    sha256 is checked first and corrupted ones are fetched again.
+
+    Returns:
+        int: Number of bytes downloaded.
+
+    Raises:
+        urllib.error.URLError: If the archive cannot be fetched.
+        OSError: If the archive does not match its size or sha256.
+        zipfile.BadZipFile: If the archive is not a zip file.
+    """
+    sha256 = candidate["sha256"]
+    archive = object_path(mirror, sha256)
+    fetched = 0
+    if archive.exists() and verify and hash_file(archive) != sha256:
+        archive.unlink()
+    if not archive.exists():
+        fetched = _download(candidate["url"], archive, sha256, candidate.get("size"))
+
+    dest = mirror / "exts" / f"{candidate['name']}-{candidate['version']}"
+    try:
+        extracted = (dest / SOURCE_MARKER).read_text() == sha256
+    except OSError:
+        extracted = False
+    if not extracted or fetched:
+        _extract(archive, dest, sha256)
+    return fetched
+
+
+def sync_packages(
+    mirror: Path, candidates: list[dict], workers: int = 8, verify: bool = False
+) -> tuple[int, dict[str, str]]:
+    """Mirror packages in parallel.
+
+    Returns:
+        tuple[int, dict[str, str]]: Bytes downloaded and the failures
+            ("name-version" to the error).
+    """
+    failures: dict[str, str] = {}
+    fetched = 0
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(mirror_package, mirror, candidate, verify): candidate
+            for candidate in candidates
+        }
+        for future, candidate in futures.items():
+            try:
+                fetched += future.result()
+            except (urllib.error.URLError, OSError, zipfile.BadZipFile) as e:
+                failures[f"{candidate['name']}-{candidate['version']}"] = str(e)
+    return fetched, failures
+
+
+def write_mirror_index(mirror: Path, candidates: list[dict]) -> Path:
+    """Add packages to the mirror's index.json, keeping the ones listed before.
+
+    Returns:
+        Path: The index path.
+    """
+    path = mirror / INDEX_NAME
+    try:
+        packages = json.loads(path.read_text()).get("packages", [])
+    except (OSError, ValueError):
+        packages = []
+    entries = {(p["name"], p["version"]): p for p in packages}
+    for candidate in candidates:
+        archive = object_path(mirror, candidate["sha256"])
+        entries[(candidate["name"], candidate["version"])] = {
+            "name": candidate["name"],
+            "version": candidate["version"],
+            "dependencies": candidate.get("dependencies", {}),
+            "archive": archive.relative_to(mirror).as_posix(),
+            "sha256": candidate["sha256"],
+            "size": archive.stat().st_size,
+        }
+    data = {
+        "version": REGISTRY_VERSION,
+        "packages": [entries[key] for key in sorted(entries)],
+    }
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(json.dumps(data, indent=2) + "\n")
+    os.replace(tmp, path)
+    return path
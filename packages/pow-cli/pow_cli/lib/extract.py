@@ -0,0 +1,347 @@
+"""Parallel zip extraction across a process pool."""
+
+import bz2
+import hashlib
+import multiprocessing
+import os
+import struct
+import time
+import zipfile
+import zlib
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+
+from .multipart import MultiPartFile
+from .progress import ProgressLine
+from .store import ingest_file
+
+BATCHES_PER_WORKER = 8
+# Extra weight per member so batches of many small files stay balanced
+# against batches of a few large ones (file creation dominates small files)
+MEMBER_OVERHEAD = 64 * 1024
+COPY_BLOCK_SIZE = 1024 * 1024  # 1MB
+
+_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+_LOCAL_HEADER_SIGNATURE = b"PK\003\004"
+
+
+class CorruptMemberError(zipfile.BadZipFile):
+    """A member's data failed its CRC check or could not be decompressed.
+
+    Args:
+        name: Member file name.
+        start: Offset of the member's local header in the archive.
+        end: Offset just past the member's compressed data.
+    """
+
+    def __init__(self, name: str, start: int, end: int):
+        super().__init__(name, start, end)
+        self.name = name
+        self.start = start
+        self.end = end
+
+    def __str__(self) -> str:
+        return f"Bad CRC-32 for file {self.name!r}"
+
+
+# Bytes written and bytes deduplicated by all workers, shared through the
+# pool initializer
+_written = None
+_deduped = None
+
+
+def read_members(archive: MultiPartFile) -> list[zipfile.ZipInfo]:
+    """Read the zip central directory once.
+
+    Args:
+        archive: Open view over the archive parts.
+
+    Returns:
+        list[zipfile.ZipInfo]: Members sorted by their offset in the archive.
+
+    Raises:
+        zipfile.BadZipFile: If the archive is not a valid zip file.
+    """
+    with zipfile.ZipFile(archive) as zf:
+        return sorted(zf.infolist(), key=lambda m: m.header_offset)
+
+
+def plan_batches(
+    members: list[zipfile.ZipInfo], workers: int
+) -> list[list[zipfile.ZipInfo]]:
+    """Split members into size-balanced batches of neighbouring members.
+
+    Batches keep archive order, so finished batches free whole ranges of the
+    archive and parts can be released while later batches still run.
+
+    Args:
+        members: Members sorted by header offset.
+        workers: Number of worker processes.
+
+    Returns:
+        list[list[zipfile.ZipInfo]]: Batches in archive order.
+    """
+    weights = [m.file_size + MEMBER_OVERHEAD for m in members]
+    target = max(sum(weights) // max(workers * BATCHES_PER_WORKER, 1), 1)
+
+    batches = []
+    batch, batch_weight = [], 0
+    for member, weight in zip(members, weights):
+        batch.append(member)
+        batch_weight += weight
+        if batch_weight >= target:
+            batches.append(batch)
+            batch, batch_weight = [], 0
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def safe_member_path(output_path: Path, name: str) -> Path:
+    """Resolve a member name below output_path, dropping unsafe components.
+
+    Mirrors zipfile's sanitizing: absolute paths, drive letters, "." and ".."
+    components are removed so members cannot escape the output directory.
+    """
+    parts = [p for p in name.replace("\\", "/").split("/") if p not in ("", ".", "..")]
+    return output_path.joinpath(*parts)
+
+
+def _decompressor(member: zipfile.ZipInfo):
+    if member.compress_type == zipfile.ZIP_DEFLATED:
+        return zlib.decompressobj(-15)
+    if member.compress_type == zipfile.ZIP_BZIP2:
+        return bz2.BZ2Decompressor()
+    return None
+
+
+def _preallocate(fd: int, size: int) -> None:
+    if size <= 0:
+        return
+    try:
+        os.posix_fallocate(fd, 0, size)
+    except (AttributeError, OSError):
+        os.ftruncate(fd, size)
+
+
+def _write_member(
+    archive: MultiPartFile, member: zipfile.ZipInfo, target: Path, digest=None
+) -> int:
+    """Decompress one member into target, verifying its CRC while writing.
+
+    If a hashlib object is given as digest, it is updated with the data too.
+    """
+    archive.seek(member.header_offset)
+    header = _LOCAL_HEADER.unpack(archive.read(_LOCAL_HEADER.size))
+    if member.flag_bits & 0x1:
+        raise zipfile.BadZipFile(f"Encrypted member not supported: {member.filename}")
+    if header[0] != _LOCAL_HEADER_SIGNATURE:
+        end = member.header_offset + _LOCAL_HEADER.size + len(member.filename)
+        raise CorruptMemberError(member.filename, member.header_offset, end)
+    name_length, extra_length = header[-2], header[-1]
+    data_offset = member.header_offset + _LOCAL_HEADER.size + name_length + extra_length
+    data_end = data_offset + member.compress_size
+    archive.seek(data_offset)
+
+    if member.compress_type == zipfile.ZIP_STORED:
+        decompressor = None
+    else:
+        decompressor = _decompressor(member)
+        if decompressor is None:
+            raise zipfile.BadZipFile(
+                f"Unsupported compression type {member.compress_type} "
+                f"for {member.filename}"
+            )
+
+    crc = 0
+    written = 0
+    # never write through a hard link shared with another tree
+    target.unlink(missing_ok=True)
+    fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        _preallocate(fd, member.file_size)
+        remaining = member.compress_size
+        while remaining > 0:
+            chunk = archive.read(min(COPY_BLOCK_SIZE, remaining))
+            if not chunk:
+                raise zipfile.BadZipFile(f"Truncated data for {member.filename}")
+            remaining -= len(chunk)
+            try:
+                data = decompressor.decompress(chunk) if decompressor else chunk
+            except (zlib.error, OSError, EOFError):
+                raise CorruptMemberError(
+                    member.filename, member.header_offset, data_end
+                )
+            if data:
+                crc = zlib.crc32(data, crc)
+                if digest:
+                    digest.update(data)
+                _write_all(fd, data)
+                written += len(data)
+        if decompressor and hasattr(decompressor, "flush"):
+            data = decompressor.flush()
+            if data:
+                crc = zlib.crc32(data, crc)
+                if digest:
+                    digest.update(data)
+                _write_all(fd, data)
+                written += len(data)
+        if written != member.file_size:
+            os.ftruncate(fd, written)
+    finally:
+        os.close(fd)
+
+    if crc != member.CRC or written != member.file_size:
+        target.unlink(missing_ok=True)
+        raise CorruptMemberError(member.filename, member.header_offset, data_end)
+
+    mtime = time.mktime(member.date_time + (0, 0, -1))
+    os.utime(target, (mtime, mtime))
+    return written
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+def _init_worker(written, deduped) -> None:
+    global _written, _deduped
+    _written = written
+    _deduped = deduped
+
+
+def _add(counter, amount: int) -> None:
+    if counter is not None:
+        with counter.get_lock():
+            counter.value += amount
+
+
+def _extract_batch(
+    part_paths: list[Path],
+    part_sizes: list[int],
+    output_path: Path,
+    batch: list[zipfile.ZipInfo],
+    store: Path | None = None,
+) -> list[tuple[str, int, int]]:
+    """Extract one batch in a worker process.
+
+    With a store, each file is hashed while it is written and then replaced
+    by a hard link into the content-addressed store.
+
+    Returns:
+        list[tuple[str, int, int]]: (name, size, CRC) of every extracted member.
+    """
+    done = []
+    with MultiPartFile(part_paths, part_sizes) as archive:
+        for member in batch:
+            target = safe_member_path(output_path, member.filename)
+            if member.is_dir():
+                target.mkdir(parents=True, exist_ok=True)
+            else:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                digest = hashlib.sha256() if store else None
+                _write_member(archive, member, target, digest)
+                _add(_written, member.file_size)
+                if store and ingest_file(store, target, digest.hexdigest()):
+                    _add(_deduped, member.file_size)
+            done.append((member.filename, member.file_size, member.CRC))
+    return done
+
+
+def extract_parallel(
+    archive: MultiPartFile,
+    output_path: Path,
+    workers: int | None = None,
+    release_parts: bool = True,
+    members: list[zipfile.ZipInfo] | None = None,
+    on_batch_done=None,
+    on_parts_released=None,
+    store: Path | None = None,
+) -> tuple[int, int]:
+    """Extract a zip archive with a pool of worker processes.
+
+    Reads the central directory once, splits the members into size-balanced
+    batches and extracts them in parallel. Output files are preallocated and
+    their CRC is verified while writing. Progress is printed with real
+    throughput and ETA.
+
+    Args:
+        archive: Open view over the archive parts.
+        output_path: Directory to extract into.
+        workers: Number of worker processes (default: CPU count).
+        release_parts: If True, delete parts once no pending batch needs them.
+        members: Members to extract, as returned by read_members (default:
+            all members of the archive).
+        on_batch_done: Optional callback receiving the (name, size, CRC)
+            tuples of each finished batch.
+        on_parts_released: Optional callback receiving released part paths,
+            called before they are deleted.
+        store: Optional content-addressed store to hard-link files into.
+
+    Returns:
+        tuple[int, int]: Number of bytes written, and number of those bytes
+            that were duplicates already present in the store.
+
+    Raises:
+        CorruptMemberError: If a member fails its CRC check.
+        zipfile.BadZipFile: If the archive is otherwise corrupted, or a
+            member uses a compression other than stored, deflate or bzip2.
+    """
+    workers = workers or os.cpu_count() or 1
+    if members is None:
+        members = read_members(archive)
+    members = sorted(members, key=lambda m: m.header_offset)
+
+    output_path.mkdir(parents=True, exist_ok=True)
+    batches = plan_batches(members, workers)
+    total = sum(m.file_size for m in members)
+    progress = ProgressLine(total)
+
+    written = multiprocessing.Value("Q", 0)
+    deduped = multiprocessing.Value("Q", 0)
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(written, deduped)
+    ) as pool:
+        pending = {
+            pool.submit(
+                _extract_batch,
+                archive.paths,
+                archive.sizes,
+                output_path,
+                batch,
+                store,
+            ): batch[0].header_offset
+            for batch in batches
+        }
+        try:
+            while pending:
+                finished, _ = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    pending.pop(future)
+                    results = future.result()
+                    if on_batch_done:
+                        on_batch_done(results)
+
+                if finished and release_parts:
+                    # the central directory was read up front, so once every
+                    # batch is done no part is needed anymore
+                    needed = min(pending.values(), default=archive.size)
+                    released = archive.release_before(needed, delete=False)
+                    # report the release before deleting, so an interrupted
+                    # run never finds a part missing that its journal does
+                    # not record as released
+                    if released and on_parts_released:
+                        on_parts_released(released)
+                    for path in released:
+                        path.unlink(missing_ok=True)
+
+                progress.update(written.value)
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            raise
+
+    progress.finish()
+    return written.value, deduped.value
@@ -0,0 +1,214 @@
+"""Plan, pin and supervise several isolated Isaac Sim instances."""
+
+import os
+import shutil
+import signal
+import subprocess
+from pathlib import Path
+
+from .kit_cache import cache_settings
+
+# Kit HTTP service port of the first instance, the next ones count up
+BASE_PORT = 8011
+# highest ROS_DOMAIN_ID that avoids the ephemeral port range on Linux
+MAX_DOMAIN_ID = 101
+FORWARDED_SIGNALS = (signal.SIGINT, signal.SIGTERM, signal.SIGHUP)
+
+
+def parse_cpulist(text: str) -> list[int]:
+    """Parse a kernel CPU list such as "0-3,8-11"."""
+    cpus = []
+    for part in text.strip().split(","):
+        if not part:
+            continue
+        first, _, last = part.partition("-")
+        cpus += range(int(first), int(last or first) + 1)
+    return cpus
+
+
+def get_numa_nodes(
+    allowed: set[int] | None = None,
+) -> list[tuple[int | None, list[int]]]:
+    """Get the CPUs this process may use, grouped by NUMA node.
+
+    Args:
+        allowed: CPUs to keep among the usable ones (default: all).
+
+    Returns:
+        list[tuple[int | None, list[int]]]: (node, CPUs) pairs; a single
+            (None, CPUs) pair when the topology is not exposed.
+    """
+    allowed = os.sched_getaffinity(0) & (allowed or os.sched_getaffinity(0))
+    nodes = []
+    for node_dir in sorted(Path("/sys/devices/system/node").glob("node[0-9]*")):
+        try:
+            cpus = parse_cpulist((node_dir / "cpulist").read_text())
+        except OSError:
+            continue
+        cpus = [cpu for cpu in cpus if cpu in allowed]
+        if cpus:
+            nodes.append((int(node_dir.name[4:]), cpus))
+    return nodes or [(None, sorted(allowed))]
+
+
+def spread_cpus(
+    count: int, nodes: list[tuple[int | None, list[int]]]
+) -> list[tuple[int | None, list[int]]]:
+    """Assign instances to NUMA nodes round-robin and split each node's CPUs.
+
+    Instances sharing a node get disjoint, contiguous CPU slices of it. If
+    there are more instances on a node than CPUs, slices wrap around.
+
+    Returns:
+        list[tuple[int | None, list[int]]]: (node, CPUs) of each instance.
+    """
+    per_node: dict[int, list[int]] = {}
+    for index in range(count):
+        per_node.setdefault(index % len(nodes), []).append(index)
+
+    placement: list[tuple[int | None, list[int]]] = [(None, [])] * count
+    for slot, indexes in per_node.items():
+        node, cpus = nodes[slot]
+        share = max(len(cpus) // len(indexes), 1)
+        for i, index in enumerate(indexes):
+            start = i * share % len(cpus)
+            placement[index] = (node, cpus[start : start + share])
+    return placement
+
+
+def plan_instances(
+    count: int,
+    launch_argv: list[str],
+    base_env: dict[str, str],
+    run_dir: Path,
+    base_port: int = BASE_PORT,
+    allowed_cpus: list[int] | None = None,
+) -> list[dict]:
+    """Plan the command line, environment and placement of each instance.
+
+    Each instance gets ROS_DOMAIN_ID (counting up from the inherited one),
+    the Kit HTTP service port base_port + index, its own cache and log
+    folders in run_dir/<index>, and POW_INSTANCE/POW_INSTANCES so scripts
+    can shard their work. CPUs are split among the usable ones, restricted
+    to allowed_cpus if given (the profile's cpu_affinity).
+
+    Returns:
+        list[dict]: Instances with index, argv, env, node, cpus and log keys.
+
+    Raises:
+        ValueError: If the ROS domain IDs would go past MAX_DOMAIN_ID.
+    """
+    base_domain = int(base_env.get("ROS_DOMAIN_ID") or 0)
+    if base_domain + count - 1 > MAX_DOMAIN_ID:
+        raise ValueError(
+            f"{count} instances need ROS_DOMAIN_ID {base_domain} to "
+            f"{base_domain + count - 1}, above the maximum of {MAX_DOMAIN_ID}"
+        )
+
+    nodes = get_numa_nodes(set(allowed_cpus or ()))
+    instances = []
+    for index, (node, cpus) in enumerate(spread_cpus(count, nodes)):
+        instance_dir = run_dir / str(index)
+        log_dir = instance_dir / "logs"
+        log_dir.mkdir(parents=True, exist_ok=True)
+        argv = launch_argv + cache_settings(instance_dir / "cache")
+        argv += [
+            f"--/exts/omni.services.transport.server.http/port={base_port + index}",
+            f"--/log/file={log_dir / 'kit.log'}",
+        ]
+        if node is not None and shutil.which("numactl"):
+            argv = ["numactl", f"--membind={node}", *argv]
+        env = dict(base_env)
+        env.update(
+            ROS_DOMAIN_ID=str(base_domain + index),
+            POW_INSTANCE=str(index),
+            POW_INSTANCES=str(count),
+        )
+        instances.append(
+            {
+                "index": index,
+                "argv": argv,
+                "env": env,
+                "node": node,
+                "cpus": cpus,
+                "log": log_dir / "output.log",
+            }
+        )
+    return instances
+
+
+def exit_status(returncode: int) -> int:
+    """Convert a Popen return code to a shell exit status (128 + signal)."""
+    return 128 - returncode if returncode < 0 else returncode
+
+
+def run_instances(
+    instances: list[dict],
+    cwd: Path | None = None,
+    log=print,
+    preexec_fn=None,
+    on_start=None,
+) -> int:
+    """Start every instance, forward signals to them and wait for all.
+
+    Each child runs in its own session, pinned to its CPUs (inherited from
+    a temporary affinity of this process, so there is no window where it
+    runs elsewhere), with its output in its log file. SIGINT, SIGTERM and
+    SIGHUP received by pow are forwarded to all children. preexec_fn is
+    passed to each Popen and on_start, if given, is called with each
+    instance and its pid once it started.
+
+    Returns:
+        int: 0 if all instances succeeded, else the exit status of the first
+            failed instance.
+    """
+    own_affinity = os.sched_getaffinity(0)
+    processes: list[subprocess.Popen] = []
+
+    def forward(signum, _frame):
+        for process in processes:
+            if process.poll() is None:
+                process.send_signal(signum)
+
+    previous = {sig: signal.signal(sig, forward) for sig in FORWARDED_SIGNALS}
+    try:
+        for instance in instances:
+            with open(instance["log"], "wb") as output:
+                if instance["cpus"]:
+                    os.sched_setaffinity(0, instance["cpus"])
+                try:
+                    process = subprocess.Popen(
+                        instance["argv"],
+                        env=instance["env"],
+                        cwd=cwd,
+                        stdin=subprocess.DEVNULL,
+                        stdout=output,
+                        stderr=subprocess.STDOUT,
+                        start_new_session=True,
+                        preexec_fn=preexec_fn,  # noqa: PLW1509 (see placement_preexec)
+                    )
+                finally:
+                    os.sched_setaffinity(0, own_affinity)
+            processes.append(process)
+            if on_start is not None:
+                on_start(instance, process.pid)
+            log(
+                f"Instance {instance['index']}: pid {process.pid}, "
+                f"ROS_DOMAIN_ID {instance['env']['ROS_DOMAIN_ID']}, "
+                f"CPUs {instance['cpus'][0]}-{instance['cpus'][-1]}, "
+                f"log {instance['log']}"
+            )
+
+        status = 0
+        for instance, process in zip(instances, processes):
+            returncode = exit_status(process.wait())
+            log(f"Instance {instance['index']} exited with code {returncode}.")
+            if returncode and not status:
+                status = returncode
+        return status
+    except BaseException:
+        forward(signal.SIGTERM, None)
+        raise
+    finally:
+        for sig, handler in previous.items():
+            signal.signal(sig, handler)
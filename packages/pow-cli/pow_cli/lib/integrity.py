@@ -0,0 +1,238 @@
+"""Chunked hash manifests and range-based repair of downloaded files."""
+
+import hashlib
+import json
+import mmap
+import os
+import shutil
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from .download import HTTP_TIMEOUT, fetch_range
+
+CHUNK_SIZE = 16 * 1024 * 1024  # 16MB
+MANIFEST_SUFFIX = ".manifest.json"
+HASH_ALGORITHM = "sha256"
+
+
+def manifest_path(path: Path) -> Path:
+    """Get the sidecar path of a file's manifest."""
+    return path.with_name(path.name + MANIFEST_SUFFIX)
+
+
+def _hash_chunk(buffer: memoryview, start: int, end: int) -> str:
+    # hashlib releases the GIL for large buffers, so threads hash in parallel
+    return hashlib.new(HASH_ALGORITHM, buffer[start:end]).hexdigest()
+
+
+def compute_manifest(
+    path: Path, chunk_size: int = CHUNK_SIZE, workers: int | None = None
+) -> dict:
+    """Hash a file in fixed-size chunks using mmap and a thread pool.
+
+    Args:
+        path: File to hash.
+        chunk_size: Size of each hashed chunk in bytes.
+        workers: Number of hashing threads (default: CPU count).
+
+    Returns:
+        dict: Manifest with size, mtime_ns, chunk_size, algorithm and the
+            list of chunk digests.
+    """
+    stat = path.stat()
+    chunks = []
+    if stat.st_size:
+        with (
+            open(path, "rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+        ):
+            buffer = memoryview(mm)
+            try:
+                offsets = range(0, stat.st_size, chunk_size)
+                with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+                    chunks = list(
+                        pool.map(
+                            lambda start: _hash_chunk(
+                                buffer, start, min(start + chunk_size, stat.st_size)
+                            ),
+                            offsets,
+                        )
+                    )
+            finally:
+                buffer.release()
+
+    return {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "chunk_size": chunk_size,
+        "algorithm": HASH_ALGORITHM,
+        "chunks": chunks,
+    }
+
+
+def refresh_manifest(path: Path, manifest: dict, chunks: list[int]) -> dict:
+    """Rehash only the given chunks after they were rewritten in place.
+
+    Args:
+        path: File the manifest describes.
+        manifest: Manifest computed before the chunks were rewritten.
+        chunks: Indices of the rewritten chunks.
+
+    Returns:
+        dict: Updated manifest, also saved to the sidecar.
+    """
+    stat = path.stat()
+    chunk_size = manifest["chunk_size"]
+    count = (stat.st_size + chunk_size - 1) // chunk_size
+    digests = (manifest["chunks"] + [""] * count)[:count]
+
+    with open(path, "rb") as f:
+        for index in chunks:
+            if index < count:
+                f.seek(index * chunk_size)
+                digests[index] = hashlib.new(
+                    HASH_ALGORITHM, f.read(chunk_size)
+                ).hexdigest()
+
+    manifest = {
+        **manifest,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "chunks": digests,
+    }
+    save_manifest(path, manifest)
+    return manifest
+
+
+def save_manifest(path: Path, manifest: dict) -> None:
+    """Write a manifest sidecar next to the file it describes."""
+    manifest_path(path).write_text(json.dumps(manifest))
+
+
+def get_manifest(path: Path, chunk_size: int = CHUNK_SIZE) -> dict:
+    """Get a file's manifest, reusing the cached sidecar when still valid.
+
+    The sidecar is reused if the file's size and mtime are unchanged and it
+    was computed with the same chunk size; otherwise it is recomputed.
+
+    Args:
+        path: File to get the manifest for.
+        chunk_size: Size of each hashed chunk in bytes.
+
+    Returns:
+        dict: The file's manifest.
+    """
+    stat = path.stat()
+    try:
+        cached = json.loads(manifest_path(path).read_text())
+        if (
+            cached.get("size") == stat.st_size
+            and cached.get("mtime_ns") == stat.st_mtime_ns
+            and cached.get("chunk_size") == chunk_size
+            and cached.get("algorithm") == HASH_ALGORITHM
+        ):
+            return cached
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+
+    manifest = compute_manifest(path, chunk_size)
+    save_manifest(path, manifest)
+    return manifest
+
+
+def fetch_reference_manifest(url: str) -> dict | None:
+    """Fetch the manifest published next to a remote file.
+
+    Mirrors publish "<file>.manifest.json" next to each file; servers that
+    do not publish one return None.
+
+    Args:
+        url: URL of the remote file (not of the manifest).
+
+    Returns:
+        dict | None: The reference manifest, or None if not published.
+    """
+    try:
+        with urllib.request.urlopen(
+            url + MANIFEST_SUFFIX, timeout=HTTP_TIMEOUT
+        ) as response:
+            manifest = json.loads(response.read())
+    except (OSError, ValueError):  # URLError, timeouts, invalid JSON
+        return None
+    if (
+        not isinstance(manifest, dict)
+        or manifest.get("algorithm") != HASH_ALGORITHM
+        or not isinstance(manifest.get("chunks"), list)
+        or not isinstance(manifest.get("size"), int)
+        or not isinstance(manifest.get("chunk_size"), int)
+        or manifest["chunk_size"] <= 0
+    ):
+        return None
+    return manifest
+
+
+def find_bad_chunks(local: dict, reference: dict) -> list[int]:
+    """Compare a local manifest with a reference manifest.
+
+    Args:
+        local: Manifest of the local file.
+        reference: Trusted manifest of the same file.
+
+    Returns:
+        list[int]: Indices of chunks that differ or are missing locally.
+    """
+    local_chunks = local["chunks"]
+    return [
+        i
+        for i, digest in enumerate(reference["chunks"])
+        if i >= len(local_chunks) or local_chunks[i] != digest
+    ]
+
+
+def chunks_for_range(start: int, end: int, chunk_size: int = CHUNK_SIZE) -> list[int]:
+    """Get the indices of the chunks overlapping the byte range [start, end)."""
+    if end <= start:
+        return []
+    return list(range(start // chunk_size, (end - 1) // chunk_size + 1))
+
+
+def repair_chunks(
+    url: str,
+    path: Path,
+    chunks: list[int],
+    size: int,
+    chunk_size: int = CHUNK_SIZE,
+    max_connections: int = 8,
+) -> None:
+    """Re-fetch only the given chunks of a file with range requests.
+
+    The file is resized to the expected size first, so truncated files are
+    completed and oversized files are cut. A file hard-linked elsewhere (the
+    download cache) is copied first, so the other links keep their content.
+
+    Args:
+        url: URL of the remote file.
+        path: Local file to repair.
+        chunks: Indices of the chunks to re-fetch.
+        size: Expected size of the file in bytes.
+        chunk_size: Size of each chunk in bytes.
+        max_connections: Number of parallel range requests.
+
+    Raises:
+        urllib.error.URLError: If a range request fails.
+    """
+    if path.stat().st_nlink > 1:
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        shutil.copy2(path, tmp)  # keeps the mtime, so the sidecar stays valid
+        os.replace(tmp, path)
+    with open(path, "r+b") as f:
+        f.truncate(size)
+
+    def fetch(index: int) -> None:
+        start = index * chunk_size
+        fetch_range(url, path, start, min(start + chunk_size, size))
+
+    with ThreadPoolExecutor(max_workers=max_connections) as pool:
+        list(pool.map(fetch, chunks))
@@ -0,0 +1,116 @@
+"""Append-only journal for resumable archive extraction."""
+
+import json
+import os
+from pathlib import Path
+
+
+class ExtractionJournal:
+    """Record extraction progress so an interrupted run can resume.
+
+    The journal is a JSON lines file. The first line describes the archive
+    parts; every later line records either a batch of completed members
+    ({"members": [[name, size, crc], ...]}) or a released part
+    ({"released": name}). Lines are flushed and synced after each write, so
+    at most the batches in flight are lost on interruption.
+
+    Args:
+        path: Location of the journal file.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.parts: list[tuple[str, int]] = []
+        self.completed: dict[str, tuple[int, int]] = {}
+        self.released: set[str] = set()
+
+    def load(self) -> bool:
+        """Load an existing journal.
+
+        Returns:
+            bool: True if a readable journal was found, False otherwise.
+        """
+        if not self.path.exists():
+            return False
+
+        with open(self.path) as f:
+            lines = f.read().splitlines()
+        if not lines:
+            return False
+
+        try:
+            header = json.loads(lines[0])
+            self.parts = [tuple(part) for part in header["parts"]]
+        except (json.JSONDecodeError, KeyError, TypeError):
+            return False
+
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                break  # torn write at the end of an interrupted run
+            for name, size, crc in entry.get("members", []):
+                self.completed[name] = (size, crc)
+            if "released" in entry:
+                self.released.add(entry["released"])
+        return True
+
+    def matches(self, parts: list[Path]) -> bool:
+        """Check that the journal belongs to these parts.
+
+        Every part must either be released or still have its recorded size.
+        """
+        if [name for name, _ in self.parts] != [p.name for p in parts]:
+            return False
+        for (name, size), path in zip(self.parts, parts):
+            if name in self.released:
+                continue
+            if not path.exists() or path.stat().st_size != size:
+                return False
+        return True
+
+    def start(self, parts: list[Path]) -> None:
+        """Start a new journal for the given parts, discarding any old one."""
+        self.parts = [(p.name, p.stat().st_size) for p in parts]
+        self.completed.clear()
+        self.released.clear()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w") as f:
+            f.write(json.dumps({"parts": self.parts}) + "\n")
+
+    def is_complete(self, name: str, size: int, crc: int, target: Path) -> bool:
+        """Check if a member was fully extracted by a previous run.
+
+        The journal entry must match the archive's size and CRC, and the
+        file on disk must still have that size.
+        """
+        if self.completed.get(name) != (size, crc):
+            return False
+        if name.endswith("/"):
+            return target.is_dir()
+        try:
+            return target.stat().st_size == size
+        except FileNotFoundError:
+            return False
+
+    def record_members(self, members: list[tuple[str, int, int]]) -> None:
+        """Append a batch of completed (name, size, crc) members."""
+        for name, size, crc in members:
+            self.completed[name] = (size, crc)
+        self._append({"members": members})
+
+    def record_released(self, parts: list[Path]) -> None:
+        """Append parts that were deleted because no member needs them."""
+        for part in parts:
+            self.released.add(part.name)
+            self._append({"released": part.name})
+
+    def _append(self, entry: dict) -> None:
+        with open(self.path, "a") as f:
+            f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def remove(self) -> None:
+        """Delete the journal after a successful extraction."""
+        self.path.unlink(missing_ok=True)
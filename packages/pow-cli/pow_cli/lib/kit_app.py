@@ -0,0 +1,325 @@
+"""Compile profiles into Kit app (.kit) files with a pinned version lock.
+
+A generated app depends on the base Isaac Sim experience and the profile's
+extensions, carries the profile's "--/path=value" settings, and pins every
+extension of the dependency closure with Kit's version lock
+([settings.app.exts] enabled = ["name-version", ...]), so Kit starts from
+a solved set. Paths use Kit tokens (${kit}, ${app}) so the files can be
+committed and used on other machines. The extension mirror lives in the
+user's cache, so it is not written into the app: 'pow sim run' passes it
+with --ext-folder.
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+
+from .config import ConfigError, parse_toml
+from .ext_folders import get_mirror_ext_folder
+
+DEFAULT_BASE_APP = "isaacsim.exp.full"
+HASH_RE = re.compile(r"^# pow-profile-hash: (\w+)$", re.MULTILINE)
+BARE_KEY_RE = re.compile(r"^[A-Za-z0-9_-]+$")
+SETTING_ARG_RE = re.compile(r"^--(/[^=\s]+)=(.*)$", re.DOTALL)
+
+HEADER = """\
+# Generated by `pow sim build-app` from profile '{profile}' in pow.toml.
+# Do not edit: change pow.toml and run `pow sim build-app` again.
+# pow-profile-hash: {profile_hash}
+"""
+
+
+def get_app_dir(project_root: Path) -> Path:
+    """Get the folder of generated apps (<project>/apps)."""
+    return project_root / "apps"
+
+
+def get_app_path(project_root: Path, profile: str) -> Path:
+    """Get the generated app of a profile (apps/<profile>.kit)."""
+    return get_app_dir(project_root) / f"{profile}.kit"
+
+
+def profile_hash(config: dict, target_profile: dict) -> str:
+    """Hash what a generated app is built from, to detect stale apps.
+
+    The extension folders are those of get_ext_folders, with the mirror as
+    a flag rather than its path, which differs between machines. What the
+    folders hold is checked against the lockfile (see check_app_lock).
+    """
+    sim_config = config.get("sim", {})
+    inputs = {
+        "profile": target_profile,
+        "ext_folders": sim_config.get("ext_folders", []),
+        "ext_mirror": get_mirror_ext_folder(config) is not None,
+        "base_app": sim_config.get("base_app", DEFAULT_BASE_APP),
+    }
+    return hashlib.sha256(
+        json.dumps(inputs, sort_keys=True).encode("utf-8")
+    ).hexdigest()[:16]
+
+
+def is_app_fresh(app_path: Path, expected_hash: str) -> bool:
+    """Check that a generated app exists and was built from the same inputs."""
+    try:
+        with open(app_path) as f:
+            head = f.read(512)
+    except OSError:
+        return False
+    match = HASH_RE.search(head)
+    return bool(match) and match.group(1) == expected_hash
+
+
+def get_user_ext_folders(config: dict, project_root: Path) -> list[Path]:
+    """Get pow.toml's ext_folders, resolved, followed by the mirror's folder."""
+    folders = [
+        (project_root / Path(folder).expanduser()).resolve()
+        for folder in config.get("sim", {}).get("ext_folders", [])
+    ]
+    mirror_folder = get_mirror_ext_folder(config)
+    if mirror_folder is not None and mirror_folder.resolve() not in folders:
+        folders.append(mirror_folder.resolve())
+    return folders
+
+
+def check_app_lock(
+    app_path: Path, config: dict, project_root: Path, isaacsim_path: Path | None
+) -> str | None:
+    """Check that the extensions pinned by an app are still what would be solved.
+
+    The app's <profile>.lock.json is compared with the extensions now in
+    the ext_folders, the mirror and Isaac Sim: every pinned version must
+    still be available, and none of the missing extensions may have
+    appeared.
+
+    Returns:
+        str | None: Why the app is out of date, or None if it is current.
+    """
+    from .ext_index import build_ext_index, get_builtin_ext_folders
+
+    try:
+        lock = json.loads(app_path.with_suffix(".lock.json").read_text())
+        pinned, missing = lock["extensions"], lock["missing"]
+    except (OSError, ValueError, KeyError):
+        return "its lockfile is missing or invalid"
+    if isaacsim_path is None:
+        return None  # Isaac Sim's extensions cannot be checked
+
+    index = build_ext_index(
+        get_user_ext_folders(config, project_root)
+        + get_builtin_ext_folders(isaacsim_path)
+    )
+    for name, version in sorted(pinned.items()):
+        if not any(c["version"] == version for c in index.get(name, [])):
+            ext_id = f"{name}-{version}" if version else name
+            return f"{ext_id} is no longer available"
+    for name in missing:
+        if name in index:
+            return f"{name} is now available"
+    return None
+
+
+def split_setting_args(raw_args: list[str]) -> tuple[dict, list[str]]:
+    """Split "--/path/to/key=value" arguments from other raw arguments.
+
+    Returns:
+        tuple[dict, list[str]]: Settings ("/path/to/key" to parsed value)
+            and the remaining arguments.
+    """
+    settings, rest = {}, []
+    for arg in raw_args:
+        match = SETTING_ARG_RE.match(arg)
+        if match:
+            settings[match.group(1)] = parse_setting_value(match.group(2))
+        else:
+            rest.append(arg)
+    return settings, rest
+
+
+def parse_setting_value(value: str) -> bool | int | float | str:
+    """Parse a command line setting value the way Kit does."""
+    if value.lower() in ("true", "false"):
+        return value.lower() == "true"
+    for cast in (int, float):
+        try:
+            return cast(value)
+        except ValueError:
+            pass
+    return value
+
+
+def toml_key(path: str) -> str:
+    """Convert "/a/b.c/d" to the dotted TOML key a."b.c".d."""
+    return ".".join(
+        part if BARE_KEY_RE.match(part) else json.dumps(part)
+        for part in path.strip("/").split("/")
+    )
+
+
+def toml_value(value) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, list):
+        return "[" + ", ".join(toml_value(v) for v in value) + "]"
+    return json.dumps(str(value))
+
+
+def kit_token_path(path: Path, app_dir: Path, isaacsim_path: Path | None) -> str:
+    """Express a path with ${app} or ${kit} when it lies below them."""
+    if isaacsim_path is not None:
+        try:
+            rel = path.relative_to(isaacsim_path / "kit")
+            return f"${{kit}}/{rel.as_posix()}"
+        except ValueError:
+            pass
+        try:
+            rel = path.relative_to(isaacsim_path)
+            return f"${{kit}}/../{rel.as_posix()}"
+        except ValueError:
+            pass
+    try:
+        return f"${{app}}/{Path(os.path.relpath(path, app_dir)).as_posix()}"
+    except ValueError:
+        return path.as_posix()
+
+
+def read_app_dependencies(apps_dir: Path, app: str, seen: set | None = None) -> dict:
+    """Get the extension dependencies of a Kit app, through the apps it extends.
+
+    Dependencies naming another .kit file of apps_dir are followed.
+
+    Raises:
+        ConfigError: If the app file is not found or is not valid TOML.
+    """
+    seen = set() if seen is None else seen
+    seen.add(app)
+    app_path = apps_dir / f"{app}.kit"
+    if not app_path.exists():
+        raise ConfigError(f"Kit app not found: {app_path}")
+    dependencies = {}
+    for name, spec in parse_toml(app_path).get("dependencies", {}).items():
+        if (apps_dir / f"{name}.kit").exists():
+            if name not in seen:
+                dependencies.update(read_app_dependencies(apps_dir, name, seen))
+            continue
+        if isinstance(spec, dict) and spec.get("optional", False):
+            continue
+        version = spec.get("version", "") if isinstance(spec, dict) else ""
+        dependencies[name] = str(version)
+    return dependencies
+
+
+def lock_extensions(
+    config: dict,
+    project_root: Path,
+    target_profile: dict,
+    isaacsim_path: Path,
+) -> dict:
+    """Resolve the pinned closure of the base app and profile extensions.
+
+    The project's ext_folders and the extension mirror come first, then
+    Isaac Sim's own folders.
+
+    Returns:
+        dict: See ext_index.resolve_closure.
+    """
+    from .ext_index import build_ext_index, get_builtin_ext_folders, resolve_closure
+
+    sim_config = config.get("sim", {})
+    base_app = sim_config.get("base_app", DEFAULT_BASE_APP)
+    roots = [
+        f"{name}-{version}" if version else name
+        for name, version in read_app_dependencies(
+            isaacsim_path / "apps", base_app
+        ).items()
+    ]
+    roots += target_profile.get("extensions", [])
+
+    index = build_ext_index(get_user_ext_folders(config, project_root))
+    for name, candidates in build_ext_index(
+        get_builtin_ext_folders(isaacsim_path)
+    ).items():
+        index.setdefault(name, []).extend(candidates)
+    return resolve_closure(roots, index, set())
+
+
+def generate_app(
+    config: dict,
+    project_root: Path,
+    profile: str,
+    target_profile: dict,
+    resolution: dict,
+    isaacsim_path: Path,
+) -> str:
+    """Generate the .kit file content of a profile."""
+    sim_config = config.get("sim", {})
+    app_dir = get_app_dir(project_root)
+    settings, _ = split_setting_args(target_profile.get("raw_args", []))
+
+    lines = [
+        HEADER.format(
+            profile=profile, profile_hash=profile_hash(config, target_profile)
+        ),
+        "[package]",
+        f"title = {json.dumps(f'{project_root.name} ({profile})')}",
+        'version = "1.0.0"',
+        'keywords = ["app"]',
+        "",
+        "[dependencies]",
+        f"{json.dumps(sim_config.get('base_app', DEFAULT_BASE_APP))} = {{}}",
+    ]
+    lines += [
+        f"{json.dumps(ext)} = {{}}" for ext in target_profile.get("extensions", [])
+    ]
+
+    lines += ["", "[settings]"]
+    lines += [
+        f"{toml_key(key)} = {toml_value(value)}" for key, value in settings.items()
+    ]
+
+    folders = [kit_token_path(isaacsim_path / "apps", app_dir, isaacsim_path)]
+    user_folders = [
+        (project_root / Path(folder).expanduser()).resolve()
+        for folder in sim_config.get("ext_folders", [])
+    ]
+    if sim_config.get("trim_ext_folders", True):
+        needed = {c["folder"] for c in resolution["selected"].values()}
+        user_folders = [folder for folder in user_folders if str(folder) in needed]
+    folders += [
+        kit_token_path(folder, app_dir, isaacsim_path) for folder in user_folders
+    ]
+    enabled = sorted(
+        f"{name}-{candidate['version']}" if candidate["version"] else name
+        for name, candidate in resolution["selected"].items()
+    )
+    lines += [
+        "",
+        "[settings.app.exts]",
+        f'folders."++" = {toml_value(folders)}',
+        "# Version lock for all dependencies:",
+        "enabled = [",
+        *(f"    {json.dumps(ext)}," for ext in enabled),
+        "]",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def write_app(app_path: Path, content: str, lock: dict) -> Path:
+    """Write a generated app and its <profile>.lock.json atomically.
+
+    Returns:
+        Path: Lockfile path.
+    """
+    app_path.parent.mkdir(parents=True, exist_ok=True)
+    lock_path = app_path.with_suffix(".lock.json")
+    for path, text in (
+        (app_path, content),
+        (lock_path, json.dumps(lock, indent=2, sort_keys=True) + "\n"),
+    ):
+        tmp = path.with_name(f".{path.name}.tmp")
+        tmp.write_text(text)
+        os.replace(tmp, path)
+    return lock_path
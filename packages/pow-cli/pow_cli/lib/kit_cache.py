@@ -0,0 +1,168 @@
+"""Locate, measure, relocate and prune Kit/Omniverse caches."""
+
+import os
+import re
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+# Kit settings pointing its caches at a relocated root, with the
+# sub-directory of the root each one should use
+KIT_CACHE_SETTINGS = {
+    "/app/tokens/cache": "",
+    "/rtx-transient/resourcemanager/localTextureCachePath": "texturecache",
+}
+
+DURATION_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+
+def get_default_cache_root() -> Path:
+    """Get Kit's default cache root (${cache}, i.e. ~/.cache/ov)."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "ov"
+
+
+def cache_settings(cache_root: Path) -> list[str]:
+    """Get the Kit command line settings relocating caches to cache_root."""
+    return [
+        f"--{setting}={cache_root / sub if sub else cache_root}"
+        for setting, sub in KIT_CACHE_SETTINGS.items()
+    ]
+
+
+def parse_duration(value: str) -> float:
+    """Parse a duration like "30d", "12h" or "90m" into seconds.
+
+    Raises:
+        ValueError: If the duration is not valid.
+    """
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([smhdw]?)\s*", value.lower())
+    if not match:
+        raise ValueError(f"Invalid duration: {value}")
+    return float(match.group(1)) * DURATION_UNITS[match.group(2) or "s"]
+
+
+def _scan_dir(path: str) -> tuple[list[tuple[str, int, float]], list[str]]:
+    files, subdirs = [], []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    stat = entry.stat(follow_symlinks=False)
+                    # last use: atime when the filesystem records it
+                    files.append(
+                        (entry.path, stat.st_size, max(stat.st_atime, stat.st_mtime))
+                    )
+    except (FileNotFoundError, PermissionError):
+        pass
+    return files, subdirs
+
+
+def scan_tree(root: Path, workers: int = 16) -> list[tuple[str, int, float]]:
+    """List (path, size, last use time) of every file below root.
+
+    Directories are listed in parallel with os.scandir.
+    """
+    if not root.is_dir():
+        return []
+    files = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = {pool.submit(_scan_dir, str(root))}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                found, subdirs = future.result()
+                files += found
+                pending |= {pool.submit(_scan_dir, sub) for sub in subdirs}
+    return files
+
+
+def summarize(root: Path, files: list[tuple[str, int, float]]) -> dict[str, list]:
+    """Group file sizes by the top-level directory below root.
+
+    Returns:
+        dict[str, list]: Directory name to [bytes, file count, last use].
+    """
+    usage: dict[str, list] = {}
+    prefix = len(str(root)) + 1
+    for path, size, used in files:
+        name = path[prefix:].split("/", 1)[0]
+        entry = usage.setdefault(name, [0, 0, 0.0])
+        entry[0] += size
+        entry[1] += 1
+        entry[2] = max(entry[2], used)
+    return usage
+
+
+def select_prune(
+    files: list[tuple[str, int, float]],
+    older_than: float | None = None,
+    max_size: int | None = None,
+    now: float | None = None,
+) -> list[tuple[str, int, float]]:
+    """Pick files to delete, least recently used first.
+
+    Files unused for older_than seconds are always selected. Then, while
+    the remaining total exceeds max_size, the least recently used files are.
+
+    Returns:
+        list[tuple[str, int, float]]: Files to delete.
+    """
+    now = time.time() if now is None else now
+    by_age = sorted(files, key=lambda f: f[2])
+    selected = []
+    remaining = sum(size for _, size, _ in files)
+    for entry in by_age:
+        expired = older_than is not None and now - entry[2] > older_than
+        over = max_size is not None and remaining > max_size
+        if not (expired or over):
+            # the following files are newer and the size limit is met
+            break
+        selected.append(entry)
+        remaining -= entry[1]
+    return selected
+
+
+def delete_files(files: list[tuple[str, int, float]], root: Path) -> int:
+    """Delete files and the directories left empty below root.
+
+    Returns:
+        int: Bytes freed.
+    """
+    freed = 0
+    parents = set()
+    for path, size, _ in files:
+        try:
+            os.unlink(path)
+            freed += size
+            parents.add(os.path.dirname(path))
+        except FileNotFoundError:
+            pass
+    for parent in sorted(parents, key=len, reverse=True):
+        current = Path(parent)
+        while current != root and root in current.parents:
+            try:
+                current.rmdir()
+            except OSError:
+                break
+            current = current.parent
+    return freed
+
+
+def resolve_cache_root(config: dict, profile: dict, project_root: Path) -> Path | None:
+    """Get the relocated cache root of a profile, if any.
+
+    The profile's cache_path wins over [sim.cache] path; relative paths are
+    resolved against the project root.
+
+    Returns:
+        Path | None: Cache root, or None to keep Kit's default.
+    """
+    path = profile.get("cache_path") or config.get("sim", {}).get("cache", {}).get(
+        "path", ""
+    )
+    if not path:
+        return None
+    return (project_root / Path(path).expanduser()).resolve()
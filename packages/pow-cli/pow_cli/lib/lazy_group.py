@@ -0,0 +1,39 @@
+"""Click group that imports its subcommands only when they are used."""
+
+import importlib
+
+import click
+
+
+class LazyGroup(click.Group):
+    """Group whose subcommands are imported on first use.
+
+    Subcommands are given as "module:attribute" import paths, so running
+    one command does not import the modules (and dependencies) of all others.
+
+    Args:
+        lazy_subcommands: Command name to "package.module:command" mapping.
+    """
+
+    def __init__(self, *args, lazy_subcommands: dict[str, str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands:
+            return self._load(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load(self, cmd_name: str) -> click.Command:
+        import_path = self.lazy_subcommands[cmd_name]
+        module_name, _, attr = import_path.rpartition(":")
+        command = getattr(importlib.import_module(module_name), attr)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"{import_path} is not a click command")
+        # register it so later lookups skip the import machinery
+        self.add_command(command, cmd_name)
+        del self.lazy_subcommands[cmd_name]
+        return command
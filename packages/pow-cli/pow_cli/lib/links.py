@@ -0,0 +1,88 @@
+"""Share file data between trees with reflinks or hard links."""
+
+import errno
+import fcntl
+import os
+import shutil
+from pathlib import Path
+
+LINK_MODES = ("auto", "reflink", "hardlink", "copy")
+
+# ioctl request number of FICLONE (_IOW(0x94, 9, int)) on Linux
+_FICLONE = 0x40049409
+
+# Devices known not to support reflinks, so "auto" skips the attempt
+_no_reflink_devices: set[int] = set()
+
+
+def reflink(src: Path, dst: Path) -> None:
+    """Create dst as a copy-on-write clone of src.
+
+    Raises:
+        OSError: If the filesystem does not support reflinks (e.g., ext4).
+    """
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        except OSError:
+            fdst.close()
+            dst.unlink(missing_ok=True)
+            raise
+    shutil.copystat(src, dst)
+
+
+def link_file(src: Path, dst: Path, mode: str = "auto") -> str:
+    """Make dst share src's data using the cheapest available method.
+
+    In "auto" mode a reflink is tried first, since it keeps both files
+    independent, then a hard link, then a plain copy. An existing dst is
+    replaced, unless it already is src.
+
+    Args:
+        src: Existing file.
+        dst: Path to create.
+        mode: One of "auto", "reflink", "hardlink" or "copy".
+
+    Returns:
+        str: The method that was used ("reflink", "hardlink" or "copy").
+
+    Raises:
+        OSError: If the requested method is not possible.
+        ValueError: If dst is src, which replacing would delete.
+    """
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    if dst.exists() and os.path.samefile(src, dst):
+        raise ValueError(f"Cannot link {src} onto itself")
+    if dst.exists() or dst.is_symlink():
+        dst.unlink()
+
+    device = os.stat(dst.parent).st_dev
+    if mode == "reflink" or (mode == "auto" and device not in _no_reflink_devices):
+        try:
+            reflink(src, dst)
+            return "reflink"
+        except OSError as e:
+            _no_reflink_devices.add(device)
+            if mode == "reflink" or e.errno not in (
+                errno.EOPNOTSUPP,
+                errno.ENOTTY,
+                errno.EXDEV,
+                errno.EINVAL,
+                errno.ENOSYS,
+            ):
+                raise
+
+    if mode in ("auto", "hardlink"):
+        try:
+            os.link(src, dst)
+            return "hardlink"
+        except OSError as e:
+            if mode == "hardlink" or e.errno not in (
+                errno.EXDEV,
+                errno.EPERM,
+                errno.EMLINK,
+            ):
+                raise
+
+    shutil.copy2(src, dst)
+    return "copy"
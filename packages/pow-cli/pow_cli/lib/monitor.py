@@ -0,0 +1,246 @@
+"""Sample the resource usage of a process tree from /proc.
+
+Samples are aggregated over the tree and streamed as CSV rows, one per
+interval. Counters (CPU time, I/O bytes, context switches) are turned into
+rates from per-process deltas, so processes starting or exiting between
+samples do not produce jumps.
+"""
+
+import os
+import threading
+import time
+from pathlib import Path
+
+from .progress import format_size
+
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+COLUMNS = (
+    "time_s",
+    "processes",
+    "threads",
+    "cpu_percent",
+    "rss_bytes",
+    "read_bytes_per_s",
+    "write_bytes_per_s",
+    "voluntary_ctxsw_per_s",
+    "involuntary_ctxsw_per_s",
+)
+
+
+def _read(path: str) -> str | None:
+    try:
+        with open(path) as f:
+            return f.read()
+    except OSError:  # the process exited, or /proc/<pid>/io is not readable
+        return None
+
+
+def _children(pid: int) -> list[int]:
+    children = []
+    for task in os.listdir(f"/proc/{pid}/task"):
+        text = _read(f"/proc/{pid}/task/{task}/children")
+        if text:
+            children += map(int, text.split())
+    return children
+
+
+def list_tree(root_pid: int) -> list[int]:
+    """List the descendants of a process through /proc/<pid>/task/*/children."""
+    pids, pending = [], [root_pid]
+    while pending:
+        try:
+            children = _children(pending.pop())
+        except OSError:
+            continue
+        pids += children
+        pending += children
+    return pids
+
+
+def read_process(pid: int) -> dict | None:
+    """Read the counters of one process, or None if it exited."""
+    stat = _read(f"/proc/{pid}/stat")
+    if stat is None:
+        return None
+    # the command name may contain spaces, fields start after its ")"
+    fields = stat[stat.rindex(")") + 2 :].split()
+    counters = {
+        "cpu_ticks": int(fields[11]) + int(fields[12]),
+        "threads": int(fields[17]),
+        "rss_bytes": int(fields[21]) * PAGE_SIZE,
+        "read_bytes": 0,
+        "write_bytes": 0,
+        "voluntary_ctxsw": 0,
+        "involuntary_ctxsw": 0,
+    }
+    io = _read(f"/proc/{pid}/io")
+    for line in (io or "").splitlines():
+        key, _, value = line.partition(":")
+        if key in ("read_bytes", "write_bytes"):
+            counters[key] = int(value)
+    # status only counts the main thread, so sum over all threads
+    try:
+        tasks = os.listdir(f"/proc/{pid}/task")
+    except OSError:
+        tasks = []
+    for task in tasks:
+        for line in (_read(f"/proc/{pid}/task/{task}/status") or "").splitlines():
+            if line.startswith("voluntary_ctxt_switches"):
+                counters["voluntary_ctxsw"] += int(line.split()[1])
+            elif line.startswith("nonvoluntary_ctxt_switches"):
+                counters["involuntary_ctxsw"] += int(line.split()[1])
+    return counters
+
+
+class Monitor:
+    """Sample a process tree in a background thread.
+
+    Args:
+        root_pid: Process whose descendants are sampled.
+        output: CSV file receiving one row per sample (see COLUMNS).
+        interval: Seconds between samples.
+        include_root: If True, the root process is sampled as well.
+    """
+
+    def __init__(
+        self,
+        root_pid: int,
+        output: Path,
+        interval: float = 1.0,
+        include_root: bool = False,
+    ):
+        self.root_pid = root_pid
+        self.output = output
+        self.interval = interval
+        self.include_root = include_root
+        self.samples: list[tuple] = []
+        self._previous: dict[int, dict] = {}
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self.output.parent.mkdir(parents=True, exist_ok=True)
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> dict:
+        """Stop sampling and get the summary (see summarize)."""
+        self._stopping.set()
+        if self._thread:
+            self._thread.join()
+        return summarize(self.samples)
+
+    def sample(self, elapsed: float, dt: float) -> tuple:
+        """Take one sample of the tree, with rates over the last dt seconds."""
+        pids = list_tree(self.root_pid)
+        if self.include_root:
+            pids.append(self.root_pid)
+        current = {}
+        for pid in pids:
+            counters = read_process(pid)
+            if counters is not None:
+                current[pid] = counters
+
+        keys = (
+            "cpu_ticks",
+            "read_bytes",
+            "write_bytes",
+            "voluntary_ctxsw",
+            "involuntary_ctxsw",
+        )
+        deltas = dict.fromkeys(keys, 0)
+        for pid, counters in current.items():
+            previous = self._previous.get(pid, {})
+            for key in deltas:
+                deltas[key] += counters[key] - previous.get(key, 0)
+        self._previous = current
+
+        dt = max(dt, 1e-6)
+        return (
+            round(elapsed, 3),
+            len(current),
+            sum(c["threads"] for c in current.values()),
+            round(deltas["cpu_ticks"] / CLOCK_TICKS / dt * 100, 1),
+            sum(c["rss_bytes"] for c in current.values()),
+            round(deltas["read_bytes"] / dt),
+            round(deltas["write_bytes"] / dt),
+            round(deltas["voluntary_ctxsw"] / dt),
+            round(deltas["involuntary_ctxsw"] / dt),
+        )
+
+    def _loop(self) -> None:
+        start = last = time.monotonic()
+        with open(self.output, "w", buffering=1) as f:
+            f.write(",".join(COLUMNS) + "\n")
+            # baseline, so processes already running are not counted from 0
+            self.sample(0.0, 1.0)
+            while not self._stopping.wait(self.interval):
+                now = time.monotonic()
+                row = self.sample(now - start, now - last)
+                last = now
+                self.samples.append(row)
+                f.write(",".join(map(str, row)) + "\n")
+
+
+def summarize(samples: list[tuple]) -> dict:
+    """Summarize samples with the peak and mean of each column.
+
+    The RSS growth is the least squares slope of RSS over time, in bytes
+    per minute, to spot leaks in long runs.
+
+    Returns:
+        dict: Column name to {"peak", "mean"}, plus "samples", "duration_s"
+            and "rss_growth_bytes_per_min".
+    """
+    if not samples:
+        return {"samples": 0}
+    summary: dict = {"samples": len(samples), "duration_s": samples[-1][0]}
+    for index, column in enumerate(COLUMNS[1:], start=1):
+        values = [row[index] for row in samples]
+        summary[column] = {
+            "peak": max(values),
+            "mean": round(sum(values) / len(values), 1),
+        }
+
+    times = [row[0] for row in samples]
+    rss = [row[4] for row in samples]
+    mean_t = sum(times) / len(times)
+    mean_rss = sum(rss) / len(rss)
+    variance = sum((t - mean_t) ** 2 for t in times)
+    slope = (
+        sum((t - mean_t) * (r - mean_rss) for t, r in zip(times, rss)) / variance
+        if variance
+        else 0.0
+    )
+    summary["rss_growth_bytes_per_min"] = round(slope * 60)
+    return summary
+
+
+def format_summary(summary: dict) -> list[str]:
+    """Format a summary as human readable lines."""
+    if not summary.get("samples"):
+        return ["No resource usage samples were taken."]
+
+    rows = [
+        ("Processes", "processes", str),
+        ("Threads", "threads", str),
+        ("CPU %", "cpu_percent", str),
+        ("RSS", "rss_bytes", format_size),
+        ("Disk read/s", "read_bytes_per_s", format_size),
+        ("Disk write/s", "write_bytes_per_s", format_size),
+        ("Voluntary ctxsw/s", "voluntary_ctxsw_per_s", str),
+        ("Involuntary ctxsw/s", "involuntary_ctxsw_per_s", str),
+    ]
+    duration = f"{summary['duration_s']:.0f}s"
+    lines = [
+        f"Resource usage: {summary['samples']} samples over {duration}",
+        f"  {'':<22}{'peak':>12}{'mean':>12}",
+    ]
+    for label, key, fmt in rows:
+        peak, mean = summary[key]["peak"], summary[key]["mean"]
+        lines.append(f"  {label:<22}{fmt(peak):>12}{fmt(mean):>12}")
+    growth = format_size(summary["rss_growth_bytes_per_min"])
+    lines.append(f"  {'RSS growth':<22}{growth + '/min':>12}")
+    return lines
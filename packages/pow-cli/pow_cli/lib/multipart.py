@@ -0,0 +1,120 @@
+"""Read split archive parts as one file without merging them on disk."""
+
+import bisect
+import io
+from pathlib import Path
+
+
+class MultiPartFile(io.RawIOBase):
+    """Seekable, read-only view over several files concatenated in order.
+
+    The split Isaac Sim asset archive is a plain byte split of one zip file,
+    so zipfile can read it through this view as if the parts were merged.
+    Parts that are no longer needed can be released (and deleted) early.
+
+    Args:
+        paths: Part files in order.
+        sizes: Optional known part sizes, allowing parts that were already
+            released by a previous run to be missing on disk.
+    """
+
+    def __init__(self, paths: list[Path], sizes: list[int] | None = None):
+        super().__init__()
+        self.paths = [Path(p) for p in paths]
+        if sizes is None:
+            sizes = [p.stat().st_size for p in self.paths]
+        self.sizes = list(sizes)
+
+        self.starts = []
+        offset = 0
+        for size in self.sizes:
+            self.starts.append(offset)
+            offset += size
+        self.size = offset
+
+        self._pos = 0
+        self._handles = {}
+        # parts missing on disk were released by a previous run
+        self._released = {i for i, p in enumerate(self.paths) if not p.exists()}
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if pos < 0:
+            raise ValueError(f"Negative seek position {pos}")
+        self._pos = pos
+        return pos
+
+    def readinto(self, buffer) -> int:
+        view = memoryview(buffer).cast("B")
+        filled = 0
+        while filled < len(view) and self._pos < self.size:
+            index = bisect.bisect_right(self.starts, self._pos) - 1
+            if index in self._released:
+                raise OSError(f"Part already released: {self.paths[index]}")
+
+            handle = self._open(index)
+            part_offset = self._pos - self.starts[index]
+            handle.seek(part_offset)
+            want = min(len(view) - filled, self.sizes[index] - part_offset)
+            count = handle.readinto(view[filled : filled + want])
+            if not count:
+                raise OSError(f"Unexpected end of part: {self.paths[index]}")
+            filled += count
+            self._pos += count
+        return filled
+
+    def _open(self, index: int):
+        if index not in self._handles:
+            # kept open across reads, closed by release_before and close
+            self._handles[index] = open(self.paths[index], "rb")  # noqa: SIM115
+        return self._handles[index]
+
+    def part_index(self, offset: int) -> int:
+        """Get the index of the part containing a byte offset."""
+        return bisect.bisect_right(self.starts, offset) - 1
+
+    def release_before(self, offset: int, delete: bool = True) -> list[Path]:
+        """Close and optionally delete every part that ends at or before offset.
+
+        Args:
+            offset: Lowest byte offset that is still needed.
+            delete: If True, delete the released part files.
+
+        Returns:
+            list[Path]: Parts released by this call.
+        """
+        released = []
+        for index, path in enumerate(self.paths):
+            end = self.starts[index] + self.sizes[index]
+            if end > offset or index in self._released:
+                continue
+            handle = self._handles.pop(index, None)
+            if handle:
+                handle.close()
+            if delete:
+                path.unlink(missing_ok=True)
+            self._released.add(index)
+            released.append(path)
+        return released
+
+    def close(self) -> None:
+        for handle in self._handles.values():
+            handle.close()
+        self._handles.clear()
+        super().close()
@@ -1,15 +1,61 @@
+import hashlib
+import importlib.util
+import json
+import sys
 from pathlib import Path
 
+from .cache import get_cache_dir
+
+
+def _find_isaacsim_path() -> Path | None:
+    # find_spec locates the package without executing its __init__
+    try:
+        spec = importlib.util.find_spec("isaacsim")
+    except (ImportError, ValueError):
+        return None
+    if spec is None:
+        return None
+    if spec.submodule_search_locations:
+        return Path(next(iter(spec.submodule_search_locations)))
+    if spec.origin:
+        return Path(spec.origin).parent
+    return None
+
 
 def get_isaacsim_path() -> Path | None:
     """Get the installation path of Isaac Sim.
 
+    The package is located with an import spec lookup, without importing it.
+    Found paths are cached on disk per interpreter and sys.path, and checked
+    to still exist before being reused.
+
     Returns:
         Path | None: Path to the Isaac Sim installation if found, None otherwise.
     """
+    key = hashlib.sha256(
+        json.dumps([sys.executable, sys.path]).encode("utf-8")
+    ).hexdigest()[:16]
+    cache_file = get_cache_dir("isaacsim") / f"{key}.json"
     try:
-        import isaacsim
+        cached = Path(json.loads(cache_file.read_text())["path"])
+        if (cached / "__init__.py").exists():
+            return cached
+    except (FileNotFoundError, json.JSONDecodeError, KeyError, TypeError):
+        pass
+
+    path = _find_isaacsim_path()
+    if path is not None:
+        cache_file.write_text(json.dumps({"path": str(path)}))
+    return path
+
 
-        return Path(isaacsim.__file__).parent
-    except ImportError:
+def get_isaacsim_kit_path() -> Path | None:
+    """Get the path to isaacsim.exp.base.kit file.
+
+    Returns:
+        Path | None: Path to the kit file if isaacsim is installed, None otherwise.
+    """
+    isaacsim_path = get_isaacsim_path()
+    if isaacsim_path is None:
         return None
+    return isaacsim_path / "apps" / "isaacsim.exp.base.kit"
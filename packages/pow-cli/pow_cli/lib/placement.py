@@ -0,0 +1,218 @@
+"""Apply profile resource placement: CPU affinity, priority and rlimits."""
+
+import ctypes
+import functools
+import os
+import platform
+import resource
+
+from .download import parse_size
+from .instances import parse_cpulist
+
+IOPRIO_CLASSES = {"none": 0, "realtime": 1, "best-effort": 2, "idle": 3}
+IOPRIO_CLASS_SHIFT = 13
+IOPRIO_WHO_PROCESS = 1
+SYS_IOPRIO_SET = {"x86_64": 251, "amd64": 251, "aarch64": 30}
+SYS_IOPRIO_GET = {"x86_64": 252, "amd64": 252, "aarch64": 31}
+
+
+def parse_placement(profile: dict) -> dict:
+    """Read and normalize the placement keys of a profile.
+
+    Keys:
+        cpu_affinity: CPU list such as "0-7,16-23".
+        nice: Scheduling niceness, -20 (highest priority) to 19.
+        ionice: I/O class "idle", "best-effort[:level]" or
+            "realtime[:level]", level 0 (highest) to 7.
+        memory_limit: Data segment limit (RLIMIT_DATA) such as "32G". The
+            address space is not limited, GPU drivers reserve a lot of it.
+        open_files: Open file limit (RLIMIT_NOFILE).
+
+    Returns:
+        dict: The keys set in the profile: cpu_affinity as a CPU list,
+            ionice as (class, level) and memory_limit in bytes.
+
+    Raises:
+        ValueError: If a value is invalid.
+    """
+    placement = {}
+    if profile.get("cpu_affinity"):
+        try:
+            cpus = parse_cpulist(profile["cpu_affinity"])
+        except ValueError:
+            cpus = []
+        if not cpus:
+            raise ValueError(f"Invalid cpu_affinity: {profile['cpu_affinity']}")
+        placement["cpu_affinity"] = cpus
+    if "nice" in profile:
+        if not -20 <= profile["nice"] <= 19:
+            raise ValueError(f"nice must be between -20 and 19: {profile['nice']}")
+        placement["nice"] = profile["nice"]
+    if profile.get("ionice"):
+        name, _, level = profile["ionice"].partition(":")
+        if name not in IOPRIO_CLASSES or not (level or "4").isdigit():
+            raise ValueError(f"Invalid ionice: {profile['ionice']}")
+        if int(level or 4) > 7:
+            raise ValueError(f"ionice level must be between 0 and 7: {level}")
+        placement["ionice"] = (name, 0 if name == "idle" else int(level or 4))
+    if profile.get("memory_limit"):
+        placement["memory_limit"] = parse_size(profile["memory_limit"])
+    if "open_files" in profile:
+        placement["open_files"] = profile["open_files"]
+    return placement
+
+
+@functools.cache
+def _libc() -> ctypes.CDLL:
+    return ctypes.CDLL(None, use_errno=True)
+
+
+def _ioprio_syscall(numbers: dict, *args: int) -> int:
+    number = numbers.get(platform.machine().lower())
+    if number is None:
+        raise OSError(f"ionice is not supported on {platform.machine()}")
+    result = _libc().syscall(number, IOPRIO_WHO_PROCESS, *args)
+    if result < 0:
+        errno = ctypes.get_errno()
+        raise OSError(errno, f"ioprio syscall failed: {os.strerror(errno)}")
+    return result
+
+
+def _check_rlimit(key: str, limit: int, value: int) -> None:
+    _, hard = resource.getrlimit(limit)
+    if hard != resource.RLIM_INFINITY and value > hard and os.geteuid() != 0:
+        raise ValueError(
+            f"{key} {value} is above the hard limit of {hard}, raising it needs root"
+        )
+
+
+def _set_rlimit(limit: int, value: int) -> None:
+    _, hard = resource.getrlimit(limit)
+    if hard != resource.RLIM_INFINITY and value > hard:
+        if os.geteuid() != 0:
+            raise ValueError(f"{value} is above the hard limit of {hard}")
+        hard = value
+    resource.setrlimit(limit, (value, hard))
+
+
+def check_placement(placement: dict) -> None:
+    """Check that a placement can be applied without privileges it lacks.
+
+    Raises:
+        ValueError: If a setting needs root: a niceness below what
+            RLIMIT_NICE allows, the realtime I/O class or a limit above
+            its hard limit; or if no CPU of cpu_affinity is available.
+    """
+    cpus = set(placement.get("cpu_affinity", ()))
+    if cpus and not cpus & os.sched_getaffinity(0):
+        raise ValueError("No CPU of cpu_affinity is available")
+    if os.geteuid() != 0:
+        if "nice" in placement:
+            soft = resource.getrlimit(resource.RLIMIT_NICE)[0]
+            floor = -20 if soft == resource.RLIM_INFINITY else 20 - soft
+            current = os.getpriority(os.PRIO_PROCESS, 0)
+            if placement["nice"] < min(floor, current):
+                raise ValueError(
+                    f"nice {placement['nice']} is below {min(floor, current)}, "
+                    "lowering it needs root"
+                )
+        if placement.get("ionice", ("",))[0] == "realtime":
+            raise ValueError("The realtime I/O class needs root")
+    if "ionice" in placement and platform.machine().lower() not in SYS_IOPRIO_SET:
+        raise ValueError(f"ionice is not supported on {platform.machine()}")
+    if "memory_limit" in placement:
+        _check_rlimit("memory_limit", resource.RLIMIT_DATA, placement["memory_limit"])
+    if "open_files" in placement:
+        _check_rlimit("open_files", resource.RLIMIT_NOFILE, placement["open_files"])
+
+
+def apply_placement(placement: dict) -> None:
+    """Apply a placement to the current process, inherited by its children.
+
+    Meant to run in a child between fork and exec, see placement_preexec.
+
+    Raises:
+        OSError: If a setting cannot be applied.
+        ValueError: If a limit is above the hard limit without privileges.
+    """
+    if "cpu_affinity" in placement:
+        os.sched_setaffinity(0, placement["cpu_affinity"])
+    if "nice" in placement:
+        os.setpriority(os.PRIO_PROCESS, 0, placement["nice"])
+    if "ionice" in placement:
+        name, level = placement["ionice"]
+        _ioprio_syscall(
+            SYS_IOPRIO_SET, 0, IOPRIO_CLASSES[name] << IOPRIO_CLASS_SHIFT | level
+        )
+    if "memory_limit" in placement:
+        _set_rlimit(resource.RLIMIT_DATA, placement["memory_limit"])
+    if "open_files" in placement:
+        _set_rlimit(resource.RLIMIT_NOFILE, placement["open_files"])
+
+
+def placement_preexec(placement: dict):
+    """Build a Popen preexec_fn applying a placement to the child only.
+
+    The placement is checked here, so errors are reported by pow rather
+    than as a failed preexec_fn, and libc is loaded before forking: the
+    child then only makes system calls, which is safe with pow's threads.
+
+    Returns:
+        Callable | None: The preexec_fn, or None for an empty placement.
+
+    Raises:
+        ValueError: If the placement cannot be applied (see check_placement).
+    """
+    if not placement:
+        return None
+    check_placement(placement)
+    if "ionice" in placement:
+        _libc()
+    return functools.partial(apply_placement, placement)
+
+
+def placement_prefix(placement: dict) -> list[str]:
+    """Build a util-linux command prefix applying a placement (for scripts)."""
+    prefix = []
+    limits = []
+    if "memory_limit" in placement:
+        limits.append(f"--data={placement['memory_limit']}")
+    if "open_files" in placement:
+        limits.append(f"--nofile={placement['open_files']}")
+    if limits:
+        prefix += ["prlimit", *limits]
+    if "cpu_affinity" in placement:
+        prefix += ["taskset", "-c", ",".join(map(str, placement["cpu_affinity"]))]
+    if "nice" in placement:
+        prefix += ["nice", "-n", str(placement["nice"])]
+    if "ionice" in placement:
+        name, level = placement["ionice"]
+        prefix += ["ionice", "-c", str(IOPRIO_CLASSES[name])]
+        if name != "idle":
+            prefix += ["-n", str(level)]
+    return prefix
+
+
+def describe_placement(pid: int = 0) -> dict:
+    """Get the effective placement of a process (default: the current one)."""
+
+    def limit(value: int) -> int | None:
+        return None if value == resource.RLIM_INFINITY else value
+
+    description = {
+        "cpu_affinity": sorted(os.sched_getaffinity(pid)),
+        "nice": os.getpriority(os.PRIO_PROCESS, pid),
+        "memory_limit": limit(resource.prlimit(pid, resource.RLIMIT_DATA)[0]),
+        "open_files": limit(resource.prlimit(pid, resource.RLIMIT_NOFILE)[0]),
+    }
+    try:
+        ioprio = _ioprio_syscall(SYS_IOPRIO_GET, pid)
+    except OSError:
+        pass
+    else:
+        classes = {number: name for name, number in IOPRIO_CLASSES.items()}
+        description["ionice"] = (
+            f"{classes.get(ioprio >> IOPRIO_CLASS_SHIFT, 'none')}:"
+            f"{ioprio & ((1 << IOPRIO_CLASS_SHIFT) - 1)}"
+        )
+    return description
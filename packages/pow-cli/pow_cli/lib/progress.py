@@ -0,0 +1,62 @@
+"""Single-line progress output with throughput and ETA."""
+
+import time
+
+import click
+
+
+def format_size(num_bytes: float) -> str:
+    """Format a byte count for progress output (e.g., "1.2 GB")."""
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(num_bytes) < 1024:
+            return f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f} TB"
+
+
+def format_eta(seconds: float) -> str:
+    """Format a duration in seconds as H:MM:SS."""
+    seconds = int(max(seconds, 0))
+    return f"{seconds // 3600}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+class ProgressLine:
+    """Rewrite one terminal line with percentage, rate and ETA.
+
+    Args:
+        total: Total number of bytes expected.
+        done: Number of bytes already done before this run (e.g., resumed).
+    """
+
+    def __init__(self, total: int, done: int = 0):
+        self.total = total
+        self.done = done
+        self._start_done = done
+        self._start = time.monotonic()
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self._start
+
+    def rate(self) -> float:
+        """Bytes per second processed in this run."""
+        elapsed = self.elapsed
+        return (self.done - self._start_done) / elapsed if elapsed > 0 else 0.0
+
+    def update(self, done: int | None = None) -> None:
+        """Print the progress line, optionally setting the done byte count first."""
+        if done is not None:
+            self.done = done
+        rate = self.rate()
+        pct = (self.done / self.total) * 100 if self.total else 100.0
+        eta = format_eta((self.total - self.done) / rate) if rate else "-:--:--"
+        click.echo(
+            f"\r  Progress: {pct:.1f}% {format_size(self.done)}/{format_size(self.total)}"
+            f" {format_size(rate)}/s ETA {eta}   ",
+            nl=False,
+        )
+
+    def finish(self) -> None:
+        """Print the final state and end the line."""
+        self.update()
+        click.echo()  # newline after progress
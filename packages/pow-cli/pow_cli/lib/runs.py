@@ -0,0 +1,25 @@
+"""Record the metadata of each `pow sim run` in .pow/runs."""
+
+import json
+import os
+import time
+from pathlib import Path
+
+
+def get_runs_dir(project_root: Path) -> Path:
+    """Get the folder holding run metadata (.pow/runs)."""
+    return project_root / ".pow" / "runs"
+
+
+def new_run_path(project_root: Path, profile: str) -> Path:
+    """Get the metadata path of a new run (<time>-<profile>-<pid>.json)."""
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    return get_runs_dir(project_root) / f"{stamp}-{profile}-{os.getpid()}.json"
+
+
+def write_run_metadata(path: Path, record: dict) -> None:
+    """Write run metadata atomically, replacing an earlier version."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(json.dumps(record, indent=2) + "\n")
+    os.replace(tmp, path)
@@ -0,0 +1,204 @@
+"""Build an Isaac Sim startup timeline from Kit log output.
+
+Kit prints one line when it starts (or shuts down) each extension, e.g.
+
+    [3.552s] [ext: omni.kit.window.file-1.3.54] startup
+
+Extensions start one after another on the main thread, so an extension's
+startup lasts until the next event. Lines carry Kit's own timestamp
+("[3.552s]" on the console, "[3,552ms]" in log files); lines without one
+use the time pow received them.
+"""
+
+import re
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Iterable
+
+TIMESTAMP_RE = re.compile(r"\[(\d+(?:\.\d+)?)s\]|\[([\d,]+)ms\]")
+EXT_RE = re.compile(
+    r"\[ext: (?P<name>[\w.\-]+?)(?:-(?P<version>\d[\w.+\-]*))?\] "
+    r"(?P<event>startup|shutdown)"
+)
+STAGE_OPEN_RE = re.compile(r"open(?:ing)?[ _]stage|open_stage\.py", re.IGNORECASE)
+STAGE_OPENED_RE = re.compile(
+    r"stage (?:opened|loaded)|opened stage|stage loading (?:complete|finished)",
+    re.IGNORECASE,
+)
+# "[20.850s] [Info] [omni.usd] " in front of the message
+LOG_PREFIX_RE = re.compile(r"^(?:\[[^\]]*\]\s*)+")
+APP_READY_RE = re.compile(r"\bapp ready\b|app startup complete", re.IGNORECASE)
+
+
+def line_time(text: str, received: float) -> float:
+    """Get the Kit timestamp of a log line in seconds, else received."""
+    match = TIMESTAMP_RE.search(text)
+    if not match:
+        return received
+    if match.group(1):
+        return float(match.group(1))
+    return int(match.group(2).replace(",", "")) / 1000
+
+
+def parse_log(lines: Iterable[tuple[float, str]]) -> list[dict]:
+    """Extract startup events from (received time, text) log lines.
+
+    Returns:
+        list[dict]: Events with "ts" (seconds), "kind" (ext_startup,
+            ext_shutdown, stage_open, stage_opened or app_ready) and "name".
+    """
+    events = []
+    for received, text in lines:
+        ts = line_time(text, received)
+        if match := EXT_RE.search(text):
+            events.append(
+                {"ts": ts, "kind": f"ext_{match['event']}", "name": match["name"]}
+            )
+        elif APP_READY_RE.search(text):
+            events.append({"ts": ts, "kind": "app_ready", "name": "app ready"})
+        elif STAGE_OPENED_RE.search(text):
+            events.append({"ts": ts, "kind": "stage_opened", "name": "stage opened"})
+        elif STAGE_OPEN_RE.search(text):
+            name = LOG_PREFIX_RE.sub("", text.strip())[:120]
+            events.append({"ts": ts, "kind": "stage_open", "name": name})
+    return events
+
+
+def build_timeline(events: list[dict], end: float | None = None) -> list[dict]:
+    """Turn events into spans with "name", "category", "start" and "duration".
+
+    Extension startup and shutdown spans last until the next event. A stage
+    open lasts until the stage is reported opened (or the next stage open,
+    or the end). The "startup" span covers everything up to "app ready".
+    """
+    events = sorted(events, key=lambda e: e["ts"])
+    if not events:
+        return []
+    end = max(end or 0.0, events[-1]["ts"])
+    spans = []
+    for i, event in enumerate(events):
+        next_ts = events[i + 1]["ts"] if i + 1 < len(events) else end
+        if event["kind"] in ("ext_startup", "ext_shutdown"):
+            spans.append(
+                {
+                    "name": event["name"],
+                    "category": event["kind"].removeprefix("ext_"),
+                    "start": event["ts"],
+                    "duration": next_ts - event["ts"],
+                }
+            )
+        elif event["kind"] == "stage_open":
+            opened = next(
+                (
+                    e["ts"]
+                    for e in events[i + 1 :]
+                    if e["kind"] in ("stage_opened", "stage_open")
+                ),
+                end,
+            )
+            spans.append(
+                {
+                    "name": event["name"],
+                    "category": "stage",
+                    "start": event["ts"],
+                    "duration": opened - event["ts"],
+                }
+            )
+    ready = next((e["ts"] for e in events if e["kind"] == "app_ready"), None)
+    if ready is not None:
+        spans.append(
+            {"name": "startup", "category": "app", "start": 0.0, "duration": ready}
+        )
+    return spans
+
+
+def chrome_trace(spans: list[dict]) -> dict:
+    """Convert spans to the Chrome trace event format (chrome://tracing)."""
+    threads = {"app": 1, "startup": 2, "stage": 3, "shutdown": 4}
+    events = [
+        {
+            "name": span["name"],
+            "cat": span["category"],
+            "ph": "X",
+            "ts": round(span["start"] * 1e6),
+            "dur": round(span["duration"] * 1e6),
+            "pid": 1,
+            "tid": threads[span["category"]],
+        }
+        for span in spans
+    ]
+    events += [
+        {"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": name}}
+        for name, tid in threads.items()
+    ]
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def slowest_extensions(spans: list[dict], count: int = 10) -> list[tuple[str, float]]:
+    """Rank extensions by startup duration, slowest first."""
+    durations = [
+        (span["name"], span["duration"])
+        for span in spans
+        if span["category"] == "startup"
+    ]
+    return sorted(durations, key=lambda d: -d[1])[:count]
+
+
+def _pump(stream, sink, lines: list, start: float, lock: threading.Lock) -> None:
+    for raw in iter(stream.readline, b""):
+        received = time.monotonic() - start
+        sink.write(raw)
+        sink.flush()
+        with lock:
+            lines.append((received, raw.decode("utf-8", errors="replace")))
+    stream.close()
+
+
+def run_captured(
+    argv: list[str], env: dict | None = None, preexec_fn=None, on_start=None
+) -> tuple[int, list, float]:
+    """Run a command, echoing and timestamping its stdout and stderr.
+
+    Each stream is drained by its own thread, so the child never blocks on
+    a full pipe. preexec_fn is passed to Popen and on_start, if given, is
+    called with the child's pid once it started.
+
+    Returns:
+        tuple[int, list, float]: Return code, (received time, text) lines
+            and the run duration in seconds.
+    """
+    lines: list[tuple[float, str]] = []
+    lock = threading.Lock()
+    start = time.monotonic()
+    process = subprocess.Popen(
+        argv,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        preexec_fn=preexec_fn,  # noqa: PLW1509 (see placement_preexec)
+    )
+    if on_start is not None:
+        on_start(process.pid)
+    pumps = [
+        threading.Thread(
+            target=_pump, args=(stream, sink, lines, start, lock), daemon=True
+        )
+        for stream, sink in (
+            (process.stdout, sys.stdout.buffer),
+            (process.stderr, sys.stderr.buffer),
+        )
+    ]
+    for pump in pumps:
+        pump.start()
+    try:
+        returncode = process.wait()
+    except KeyboardInterrupt:
+        process.wait()
+        raise
+    finally:
+        for pump in pumps:
+            pump.join()
+    lines.sort(key=lambda line: line[0])
+    return returncode, lines, time.monotonic() - start
@@ -0,0 +1,183 @@
+"""Content-addressed file store shared through hard links."""
+
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+STORE_DIRNAME = ".pow-store"
+HASH_BLOCK_SIZE = 1024 * 1024  # 1MB
+
+
+def get_store_path(pow_config: dict, target_path: Path) -> Path:
+    """Get the content-addressed asset store location.
+
+    Uses [sim.assets].store from pow.toml if set, otherwise a .pow-store
+    directory next to isaacsim_assets. The store must be on the same
+    filesystem as the installed assets for hard links to work.
+
+    Args:
+        pow_config: Parsed pow.toml configuration dictionary.
+        target_path: Asset installation directory.
+
+    Returns:
+        Path: Store directory.
+    """
+    store = pow_config.get("sim", {}).get("assets", {}).get("store", "")
+    if store:
+        return Path(store).expanduser()
+    return target_path / STORE_DIRNAME
+
+
+def _existing_parent(path: Path) -> Path:
+    """Get path or its closest ancestor that exists."""
+    path = path.absolute()
+    while not path.exists() and path != path.parent:
+        path = path.parent
+    return path
+
+
+def is_same_filesystem(store: Path, target: Path) -> bool:
+    """Check if a store can hard link files of target (no EXDEV).
+
+    Either path may not exist yet, their closest existing ancestors are
+    compared instead.
+    """
+    store_dev = _existing_parent(store).stat().st_dev
+    return store_dev == _existing_parent(target).stat().st_dev
+
+
+def object_path(store: Path, digest: str) -> Path:
+    """Get the path of an object in the store (objects/ab/cdef...)."""
+    return store / "objects" / digest[:2] / digest[2:]
+
+
+def hash_file(path: Path) -> str:
+    """Compute the sha256 digest used as a store key."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(HASH_BLOCK_SIZE):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def ingest_file(store: Path, path: Path, digest: str) -> bool:
+    """Replace a file by a hard link to its store object.
+
+    If the store has no object with this digest yet, the file itself
+    becomes the object. The store must be on the same filesystem.
+
+    Args:
+        store: Root directory of the store.
+        path: File to ingest.
+        digest: sha256 digest of the file content.
+
+    Returns:
+        bool: True if an existing object was reused (the file was a duplicate).
+    """
+    obj = object_path(store, digest)
+    try:
+        if os.path.samefile(obj, path):
+            return False
+    except FileNotFoundError:
+        obj.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(path, obj)
+            return False
+        except FileExistsError:
+            pass  # another worker stored the same content first
+
+    tmp = path.with_name(f".{path.name}.pow-link")
+    os.link(obj, tmp)
+    os.replace(tmp, path)
+    return True
+
+
+def ingest_tree(store: Path, root: Path, workers: int | None = None) -> tuple[int, int]:
+    """Move every file of an existing tree into the store.
+
+    Args:
+        store: Root directory of the store.
+        root: Tree to deduplicate.
+        workers: Number of hashing threads (default: CPU count).
+
+    Returns:
+        tuple[int, int]: Number of files and bytes that were duplicates.
+    """
+    files = [
+        Path(dirpath) / name
+        for dirpath, _, names in os.walk(root)
+        for name in names
+        if not Path(dirpath, name).is_symlink()
+    ]
+
+    def ingest(path: Path) -> int:
+        if ingest_file(store, path, hash_file(path)):
+            return path.stat().st_size
+        return -1
+
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        results = [size for size in pool.map(ingest, files) if size >= 0]
+    return len(results), sum(results)
+
+
+def _scan_fanout(directory: str) -> list[tuple[str, int, int]]:
+    entries = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            stat = entry.stat(follow_symlinks=False)
+            entries.append((entry.path, stat.st_size, stat.st_nlink))
+    return entries
+
+
+def scan_objects(store: Path) -> list[tuple[str, int, int]]:
+    """List (path, size, link count) of every object, scanning in parallel."""
+    objects_dir = store / "objects"
+    if not objects_dir.is_dir():
+        return []
+    fanout = [entry.path for entry in os.scandir(objects_dir) if entry.is_dir()]
+    with ThreadPoolExecutor(max_workers=min(32, len(fanout) or 1)) as pool:
+        return [obj for chunk in pool.map(_scan_fanout, fanout) for obj in chunk]
+
+
+def store_stats(store: Path) -> dict:
+    """Summarize store usage.
+
+    Every link besides the store's own counts as one materialized file.
+
+    Returns:
+        dict: objects, unreferenced objects, stored bytes (on disk),
+            logical bytes (as seen by all linked trees) and saved bytes.
+    """
+    objects = scan_objects(store)
+    stored = sum(size for _, size, _ in objects)
+    logical = sum(size * (nlink - 1) for _, size, nlink in objects)
+    unreferenced = sum(1 for _, _, nlink in objects if nlink <= 1)
+    return {
+        "objects": len(objects),
+        "unreferenced": unreferenced,
+        "stored_bytes": stored,
+        "logical_bytes": logical,
+        "saved_bytes": max(logical - stored, 0),
+    }
+
+
+def gc(store: Path, dry_run: bool = False) -> tuple[int, int]:
+    """Delete objects no installed tree links to anymore.
+
+    Args:
+        store: Root directory of the store.
+        dry_run: If True, only report what would be deleted.
+
+    Returns:
+        tuple[int, int]: Number of objects and bytes freed.
+    """
+    removed, freed = 0, 0
+    for path, size, nlink in scan_objects(store):
+        if nlink > 1:
+            continue
+        if not dry_run:
+            os.unlink(path)
+        removed += 1
+        freed += size
+    return removed, freed
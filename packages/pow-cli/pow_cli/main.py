@@ -2,11 +2,7 @@
 
 import click
 
-from .sim.add.local_assets import add_local_assets
-from .sim.check.check import check_compatibility
-from .sim.info.info import info
-from .sim.init.init_sim import init_sim
-from .sim.run.run import run
+from .lib.lazy_group import LazyGroup
 
 
 @click.group()
@@ -15,8 +11,19 @@ def pow():
     pass
 
 
-# Sim commands
-@pow.group(invoke_without_command=True)
+# Sim commands, imported only when invoked
+@pow.group(
+    cls=LazyGroup,
+    invoke_without_command=True,
+    lazy_subcommands={
+        "run": "pow_cli.sim.run.run:run",
+        "init": "pow_cli.sim.init.init_sim:init_sim",
+        "check": "pow_cli.sim.check.check:check_compatibility",
+        "info": "pow_cli.sim.info.info:info",
+        "serve": "pow_cli.sim.serve.serve:serve",
+        "build-app": "pow_cli.sim.app.build_app:build_app",
+    },
+)
 @click.pass_context
 def sim(ctx):
     """Isaac Sim related commands.
@@ -27,21 +34,56 @@ def sim(ctx):
     # simulation command run only in x86_64 environment workstation, not in jetson device
 
     if ctx.invoked_subcommand is None:
-        ctx.invoke(run)
+        ctx.invoke(sim.get_command(ctx, "run"))
 
 
-@sim.group()
+@sim.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "local-assets": "pow_cli.sim.add.local_assets:add_local_assets",
+    },
+)
 def add():
     """Add resources to Isaac Sim."""
     pass
 
 
-# Register commands
-add.add_command(add_local_assets)
-sim.add_command(run)
-sim.add_command(init_sim)
-sim.add_command(check_compatibility)
-sim.add_command(info)
+@sim.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "gc": "pow_cli.sim.assets.store:gc_assets",
+        "dedupe": "pow_cli.sim.assets.store:dedupe_assets",
+        "index": "pow_cli.sim.assets.index:index_assets",
+        "search": "pow_cli.sim.assets.index:search_assets",
+        "ls": "pow_cli.sim.assets.index:ls_assets",
+        "du": "pow_cli.sim.assets.index:du_assets",
+        "serve": "pow_cli.sim.assets.serve:serve_assets",
+    },
+)
+def assets():
+    """Manage installed Isaac Sim local assets."""
+
+
+@sim.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "sync": "pow_cli.sim.ext.sync:sync_extensions",
+    },
+)
+def ext():
+    """Mirror Kit extensions for offline use."""
+
+
+@sim.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "du": "pow_cli.sim.cache.cache:du_cache",
+        "prune": "pow_cli.sim.cache.cache:prune_cache",
+    },
+)
+def cache():
+    """Report and prune Kit caches (shaders, textures, derived data)."""
+
 
 if __name__ == "__main__":
     pow()
@@ -1,22 +1,138 @@
+import os
 import re
-import subprocess
+import urllib.error
+import zipfile
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import click
 
+from ...lib.asset_index import connect, update_index
+from ...lib.browser_cache import (
+    build_browser_cache,
+    get_browser_cache_path,
+    write_browser_cache,
+)
+from ...lib.config import load_project_config
+from ...lib.delta import load_install_manifest, plan_delta, save_install_manifest
+from ...lib.download import (
+    DEFAULT_MAX_CONNECTIONS,
+    download_files,
+    is_download_incomplete,
+    parse_size,
+    probe,
+)
+from ...lib.download_cache import (
+    add_to_cache,
+    confirm_in_cache,
+    find_in_cache,
+    get_download_cache_path,
+    restore_from_cache,
+)
+from ...lib.extract import (
+    CorruptMemberError,
+    extract_parallel,
+    read_members,
+    safe_member_path,
+)
+from ...lib.integrity import (
+    CHUNK_SIZE,
+    chunks_for_range,
+    fetch_reference_manifest,
+    find_bad_chunks,
+    get_manifest,
+    manifest_path,
+    refresh_manifest,
+    repair_chunks,
+)
+from ...lib.journal import ExtractionJournal
+from ...lib.links import LINK_MODES, link_file
+from ...lib.multipart import MultiPartFile
+from ...lib.path import get_isaacsim_kit_path, get_isaacsim_path
+from ...lib.progress import format_size
+from ...lib.store import get_store_path, is_same_filesystem
+
+ASSET_BASE_URL = "https://download.isaacsim.omniverse.nvidia.com"
+ASSET_PART_COUNT = 3
+MAX_REPAIR_ATTEMPTS = 3
+LINK_WORKERS = 16
+ASSET_BROWSER_FOLDERS = [
+    "Isaac/Robots",
+    "Isaac/People",
+    "Isaac/IsaacLab",
+    "Isaac/Props",
+    "Isaac/Environments",
+    "Isaac/Materials",
+    "Isaac/Samples",
+    "Isaac/Sensors",
+]
+
 
-def get_isaacsim_kit_path():
-    """Get the path to isaacsim.exp.base.kit file.
+def get_asset_part_paths(target_path: Path, version: str = "5.1.0") -> list[Path]:
+    """Get the paths of the split asset zip parts.
+
+    Args:
+        target_path: Directory containing the zip parts.
+        version: Isaac Sim asset version string (e.g., "5.1.0").
 
     Returns:
-        Path | None: Path to the kit file if isaacsim is installed, None otherwise.
+        list[Path]: Paths to the .zip.001, .zip.002, ... parts in order.
     """
-    try:
-        import isaacsim
+    return [
+        target_path / f"isaac-sim-assets-complete-{version}.zip.{i:03d}"
+        for i in range(1, ASSET_PART_COUNT + 1)
+    ]
 
-        return Path(isaacsim.__file__).parent / "apps" / "isaacsim.exp.base.kit"
-    except ImportError:
-        return None
+
+def get_version_short(version: str) -> str:
+    """Get the major.minor asset folder name of a version (5.1.0 -> 5.1)."""
+    return ".".join(version.split(".")[:2])
+
+
+def get_install_manifest_path(output_path: Path, version: str) -> Path:
+    """Get the path of the (size, CRC) manifest of an installed asset version."""
+    return output_path / f".pow-install-{version}.json"
+
+
+def get_asset_index_path(target_path: Path, version: str) -> Path:
+    """Get the path of the search index of an installed asset version.
+
+    The index lives next to isaacsim_assets rather than inside it, so it is
+    never linked into the content store by "pow sim assets dedupe".
+    """
+    return target_path / f".pow-index-{get_version_short(version)}.sqlite"
+
+
+def get_asset_part_url(base_url: str, part: Path) -> str:
+    """Get the download URL of an asset zip part."""
+    return f"{base_url.rstrip('/')}/{part.name}"
+
+
+def find_part_url(
+    part: Path, mirrors: list[str] | None = None, base_url: str = ASSET_BASE_URL
+) -> str:
+    """Get the URL of an asset zip part on the first mirror serving it.
+
+    Mirrors are probed in order; the asset server is used when none of them
+    has the part.
+
+    Args:
+        part: Local path of the zip part.
+        mirrors: Base URLs of the mirrors ([sim.assets] mirrors).
+        base_url: Base URL of the asset server.
+
+    Returns:
+        str: Download URL of the part.
+    """
+    for mirror in mirrors or []:
+        url = get_asset_part_url(mirror, part)
+        try:
+            probe(url)
+            return url
+        except (urllib.error.URLError, OSError, ValueError):
+            continue
+    return get_asset_part_url(base_url, part)
 
 
 def generate_settings_block(asset_base: Path) -> str:
@@ -28,6 +144,9 @@ def generate_settings_block(asset_base: Path) -> str:
     Returns:
         str: Formatted settings block string to append to the kit file.
     """
+    folders = "".join(
+        f'    "{asset_base}/{folder}",\n' for folder in ASSET_BROWSER_FOLDERS
+    )
     return f'''
 
 # Local asset settings (added by pow cli)
@@ -36,26 +155,10 @@ exts."isaacsim.asset.browser".visible_after_startup = true
 persistent.isaac.asset_root.default = "{asset_base}"
 
 exts."isaacsim.gui.content_browser".folders = [
-    "{asset_base}/Isaac/Robots",
-    "{asset_base}/Isaac/People",
-    "{asset_base}/Isaac/IsaacLab",
-    "{asset_base}/Isaac/Props",
-    "{asset_base}/Isaac/Environments",
-    "{asset_base}/Isaac/Materials",
-    "{asset_base}/Isaac/Samples",
-    "{asset_base}/Isaac/Sensors",
-]
+{folders}]
 
 exts."isaacsim.asset.browser".folders = [
-    "{asset_base}/Isaac/Robots",
-    "{asset_base}/Isaac/People",
-    "{asset_base}/Isaac/IsaacLab",
-    "{asset_base}/Isaac/Props",
-    "{asset_base}/Isaac/Environments",
-    "{asset_base}/Isaac/Materials",
-    "{asset_base}/Isaac/Samples",
-    "{asset_base}/Isaac/Sensors",
-]
+{folders}]
 # End: Local asset settings (added by pow cli)
 '''
 
@@ -79,7 +182,7 @@ def update_kit_settings(asset_root: Path, version: str = "5.1.0") -> Path:
             "Could not find isaacsim.exp.base.kit file. Is isaacsim installed?"
         )
 
-    version_short = ".".join(version.split(".")[:2])  # 5.1.0 -> 5.1
+    version_short = get_version_short(version)
     asset_base = asset_root / "Assets" / "Isaac" / version_short
     settings_block = generate_settings_block(asset_base)
 
@@ -104,117 +207,479 @@ def update_kit_settings(asset_root: Path, version: str = "5.1.0") -> Path:
     return asset_base
 
 
-def download_assets(target_path: Path, version: str = "5.1.0") -> None:
-    """Download Isaac Sim asset zip parts using aria2c.
+def update_asset_browser_cache(asset_base: Path, index_path: Path) -> Path | None:
+    """Refresh the asset index and pre-populate the asset browser cache.
+
+    Only folders changed since the index was last refreshed are listed
+    again, so this is cheap to run after every install or upgrade.
+
+    Args:
+        asset_base: Asset version folder (e.g., .../Assets/Isaac/5.1).
+        index_path: Asset index database of this folder.
+
+    Returns:
+        Path | None: The cache file, or None if Isaac Sim is not installed.
+    """
+    stats = update_index(asset_base, index_path)
+    isaacsim_path = get_isaacsim_path()
+    if isaacsim_path is None:
+        return None
+
+    conn = connect(index_path)
+    cache = build_browser_cache(conn, asset_base, ASSET_BROWSER_FOLDERS)
+    conn.close()
+
+    cache_path = get_browser_cache_path(isaacsim_path)
+    if write_browser_cache(cache_path, cache):
+        click.echo(
+            f"Updated asset browser cache ({stats['changed']} changed folders):\n"
+            f"  {cache_path}"
+        )
+    return cache_path
 
-    Downloads three zip parts from NVIDIA's Isaac Sim asset server.
-    Supports resuming incomplete downloads.
+
+def download_assets(
+    target_path: Path,
+    version: str = "5.1.0",
+    base_url: str = ASSET_BASE_URL,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    max_bandwidth: int | None = None,
+    mirrors: list[str] | None = None,
+    cache: Path | None = None,
+) -> None:
+    """Download Isaac Sim asset zip parts concurrently.
+
+    Downloads all missing zip parts from NVIDIA's Isaac Sim asset server at
+    the same time with segmented range requests, using aria2c when available
+    and a pure Python downloader otherwise. Supports resuming incomplete downloads.
+    Parts already extracted and released by an interrupted extraction are skipped.
+    Parts found in the download cache are linked from it, and parts served by
+    a mirror are fetched from there. Every part is then verified and added to
+    the cache, as pending until extraction if only its size could be checked.
 
     Args:
         target_path: Directory to download the zip files to.
         version: Isaac Sim asset version string (e.g., "5.1.0").
+        base_url: Base URL of the asset server.
+        max_connections: Total number of connections shared by all parts.
+        max_bandwidth: Overall bandwidth limit in bytes per second (None = unlimited).
+        mirrors: Base URLs of mirrors tried before the asset server.
+        cache: Download cache shared by projects (None = not used).
 
     Returns:
         None
 
     Raises:
         subprocess.CalledProcessError: If aria2c download fails.
+        urllib.error.URLError: If the Python downloader fails.
     """
-    for i in range(1, 4):
-        zip_file = target_path / f"isaac-sim-assets-complete-{version}.zip.00{i}"
-        aria2_file = (
-            target_path / f"isaac-sim-assets-complete-{version}.zip.00{i}.aria2"
-        )
-
-        if aria2_file.exists():
+    journal = get_extraction_journal(target_path, version)
+    journal.load()
+    target_path.mkdir(parents=True, exist_ok=True)
+
+    jobs = []
+    for zip_file in get_asset_part_paths(target_path, version):
+        if zip_file.name in journal.released:
+            click.echo(f"Asset part already extracted: {zip_file.name}.")
+            continue
+        if is_download_incomplete(zip_file):
             click.echo(f"Incomplete download detected: {zip_file.name}. Resuming...")
         elif not zip_file.exists():
+            method = (
+                restore_from_cache(cache, zip_file.name, zip_file) if cache else None
+            )
+            if method:
+                click.echo(
+                    f"Found asset part in download cache ({method}): {zip_file.name}."
+                )
+                continue
             click.echo(f"Missing asset: {zip_file.name}. Downloading...")
         else:
             click.echo(f"Found complete asset part: {zip_file.name}.")
             continue
 
-        subprocess.run(
-            [
-                "aria2c",
-                f"https://download.isaacsim.omniverse.nvidia.com/isaac-sim-assets-complete-{version}.zip.00{i}",
-                "-d",
-                str(target_path),
-            ],
-            check=True,
-        )
+        url = find_part_url(zip_file, mirrors, base_url)
+        if not url.startswith(base_url):
+            click.echo(f"  from mirror {url}")
+        jobs.append((url, zip_file))
+
+    download_files(jobs, max_connections=max_connections, max_bandwidth=max_bandwidth)
+    verified = verify_assets(target_path, version, base_url, max_connections, mirrors)
+    if cache:
+        cache_assets(target_path, version, cache, verified)
 
     click.echo(f"All isaac sim asset v{version} parts are present.")
 
 
-def extract_assets(
-    target_path: Path, version: str = "5.1.0", keep_zip: bool = False
+def cache_assets(
+    target_path: Path,
+    version: str,
+    cache: Path,
+    verified: set[str] | frozenset[str] = frozenset(),
 ) -> None:
-    """Merge and extract Isaac Sim asset zip files.
+    """Add downloaded asset parts to the download cache.
 
-    Combines three zip parts into a single archive, extracts it to
-    target_path/isaacsim_assets, and optionally cleans up the zip files.
+    Parts are keyed by their chunk manifest, which verification usually
+    computed already, and linked into the cache when the filesystem allows.
+    Parts not verified against a reference manifest are added as pending,
+    and only used once their extraction passed every CRC check (see
+    extract_assets).
 
     Args:
-        target_path: Directory containing the downloaded zip parts.
+        target_path: Directory containing the zip parts.
         version: Isaac Sim asset version string (e.g., "5.1.0").
-        keep_zip: If True, keep zip files after extraction.
+        cache: Download cache directory.
+        verified: Names of the parts that matched a reference manifest.
 
     Returns:
         None
+    """
+    for part in get_asset_part_paths(target_path, version):
+        if not part.exists():
+            continue
+        obj = find_in_cache(cache, part.name)
+        if obj is not None and os.path.samefile(obj, part):
+            continue
+        pending = part.name not in verified
+        click.echo(
+            f"Adding {part.name} to the download cache"
+            + (" (pending extraction)..." if pending else "...")
+        )
+        try:
+            add_to_cache(cache, part, pending=pending)
+        except OSError as e:
+            click.echo(click.style(f"Could not cache {part.name}: {e}", fg="yellow"))
+
+
+def verify_assets(
+    target_path: Path,
+    version: str = "5.1.0",
+    base_url: str = ASSET_BASE_URL,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    mirrors: list[str] | None = None,
+) -> set[str]:
+    """Verify downloaded asset parts and re-fetch only the broken chunks.
+
+    When the server publishes a chunk manifest next to a part, the part is
+    hashed in chunks (cached in a sidecar keyed on size and mtime) and every
+    chunk that differs is re-fetched with a range request. Otherwise only
+    the size is compared, and a truncated tail is fetched.
+
+    Args:
+        target_path: Directory containing the zip parts.
+        version: Isaac Sim asset version string (e.g., "5.1.0").
+        base_url: Base URL of the asset server.
+        max_connections: Number of parallel range requests for repairs.
+        mirrors: Base URLs of mirrors tried before the asset server.
+
+    Returns:
+        set[str]: Names of the parts that matched a reference manifest.
 
     Raises:
-        subprocess.CalledProcessError: If unzip extraction fails.
+        click.ClickException: If a part is still corrupted after repair.
     """
-    merged_zip = target_path / f"isaac-sim-assets-complete-{version}.zip"
-    zip_parts = [
-        target_path / f"isaac-sim-assets-complete-{version}.zip.001",
-        target_path / f"isaac-sim-assets-complete-{version}.zip.002",
-        target_path / f"isaac-sim-assets-complete-{version}.zip.003",
-    ]
+    verified = set()
+    for part in get_asset_part_paths(target_path, version):
+        if not part.exists():
+            continue  # already extracted and released
+        url = find_part_url(part, mirrors, base_url)
+
+        reference = fetch_reference_manifest(url)
+        if reference is not None:
+            click.echo(f"Verifying chunk hashes of {part.name}...")
+            chunk_size = reference["chunk_size"]
+            local = get_manifest(part, chunk_size)
+            bad_chunks = find_bad_chunks(local, reference)
+            size = reference["size"]
+        else:
+            size, _ = probe(url)
+            local_size = part.stat().st_size
+            chunk_size = CHUNK_SIZE
+            bad_chunks = chunks_for_range(min(local_size, size), size, chunk_size)
+
+        if not bad_chunks and part.stat().st_size == size:
+            if reference is not None:
+                verified.add(part.name)
+            continue
+
+        click.echo(
+            click.style(
+                f"Repairing {len(bad_chunks)} corrupted chunk(s) of {part.name}...",
+                fg="yellow",
+            )
+        )
+        repair_chunks(url, part, bad_chunks, size, chunk_size, max_connections)
+
+        if reference is not None:
+            local = refresh_manifest(part, local, bad_chunks)
+            if find_bad_chunks(local, reference):
+                raise click.ClickException(
+                    click.style(
+                        f"{part.name} is still corrupted after repair.", fg="red"
+                    )
+                )
+            verified.add(part.name)
+    return verified
+
+
+def repair_corrupt_member(
+    target_path: Path,
+    error: CorruptMemberError,
+    version: str = "5.1.0",
+    base_url: str = ASSET_BASE_URL,
+    mirrors: list[str] | None = None,
+    cache: Path | None = None,
+) -> None:
+    """Re-fetch the chunks holding a member that failed its CRC check.
+
+    Maps the member's byte range in the concatenated archive onto the zip
+    parts and re-fetches only the overlapping chunks of each part. Repaired
+    parts are added to the download cache again, as pending, under their
+    new content id.
 
-    if merged_zip.exists():
-        click.echo(f"Removing existing merged archive: {merged_zip}")
-        merged_zip.unlink()
+    Args:
+        target_path: Directory containing the zip parts.
+        error: The CRC failure raised during extraction.
+        version: Isaac Sim asset version string (e.g., "5.1.0").
+        base_url: Base URL of the asset server.
+        mirrors: Base URLs of mirrors tried before the asset server.
+        cache: Download cache shared by projects (None = not used).
 
-    click.echo("Merging zip parts...")
+    Returns:
+        None
+    """
+    journal = get_extraction_journal(target_path, version)
+    journal.load()
+
+    part_start = 0
+    for part, (_, size) in zip(
+        get_asset_part_paths(target_path, version), journal.parts
+    ):
+        part_end = part_start + size
+        start, end = max(error.start, part_start), min(error.end, part_end)
+        if start < end and part.exists():
+            chunks = chunks_for_range(start - part_start, end - part_start)
+            click.echo(f"Re-fetching {len(chunks)} chunk(s) of {part.name}...")
+            url = find_part_url(part, mirrors, base_url)
+            repair_chunks(url, part, chunks, size)
+            if cache:
+                try:
+                    add_to_cache(cache, part, pending=True)
+                except OSError as e:
+                    click.echo(
+                        click.style(f"Could not cache {part.name}: {e}", fg="yellow")
+                    )
+        part_start = part_end
+
+
+def get_extraction_journal(
+    target_path: Path, version: str = "5.1.0"
+) -> ExtractionJournal:
+    """Get the extraction journal stored next to the extracted assets.
 
-    total_size = sum(p.stat().st_size for p in zip_parts)
-    written = 0
+    Args:
+        target_path: Directory containing the zip parts and isaacsim_assets.
+        version: Isaac Sim asset version string (e.g., "5.1.0").
 
-    with open(merged_zip, "wb") as outfile:
-        for part in zip_parts:
-            with open(part, "rb") as infile:
-                while chunk := infile.read(1024 * 1024 * 10):  # 10MB chunks
-                    outfile.write(chunk)
-                    written += len(chunk)
-                    pct = (written / total_size) * 100
-                    click.echo(f"\r  Progress: {pct:.1f}%", nl=False)
-    click.echo()  # newline after progress
-    click.echo(f"Created merged archive: {merged_zip}")
-
-    click.echo("Extracting assets...")
-    subprocess.run(
-        ["unzip", str(merged_zip), "-d", str(target_path / "isaacsim_assets")],
-        check=True,
+    Returns:
+        ExtractionJournal: Journal object (not loaded).
+    """
+    return ExtractionJournal(
+        target_path / f"isaac-sim-assets-complete-{version}.journal"
     )
-    click.echo("Extraction complete.")
 
-    version_short = ".".join(version.split(".")[:2])  # 5.1.0 -> 5.1
+
+def _extract_remaining(
+    zip_parts: list[Path],
+    output_path: Path,
+    journal: ExtractionJournal,
+    keep_zip: bool,
+    workers: int | None,
+    version: str,
+    upgrade_from: str | None,
+    link_mode: str,
+    store: Path | None,
+) -> None:
+    """Extract the members the journal does not record as complete."""
+
+    def on_parts_released(parts: list[Path]) -> None:
+        journal.record_released(parts)
+        for part in parts:
+            click.echo(f"\n  Removed extracted zip part: {part.name}")
+
+    sizes = [size for _, size in journal.parts]
+    with MultiPartFile(zip_parts, sizes) as archive:
+        members = read_members(archive)
+        remaining = [
+            m
+            for m in members
+            if not journal.is_complete(
+                m.filename,
+                m.file_size,
+                m.CRC,
+                safe_member_path(output_path, m.filename),
+            )
+        ]
+        if len(remaining) < len(members):
+            click.echo(
+                f"Skipping {len(members) - len(remaining)} already extracted files."
+            )
+
+        if upgrade_from:
+            remaining = _link_unchanged_members(
+                remaining, output_path, journal, version, upgrade_from, link_mode
+            )
+
+        click.echo(f"Extracting assets with {workers or os.cpu_count()} workers...")
+        _, deduped = extract_parallel(
+            archive,
+            output_path,
+            workers=workers,
+            release_parts=not keep_zip,
+            members=remaining,
+            on_batch_done=journal.record_members,
+            on_parts_released=on_parts_released,
+            store=store,
+        )
+        if store:
+            click.echo(
+                f"Deduplicated {format_size(deduped)} through content store: {store}"
+            )
+
+
+def _link_unchanged_members(
+    members: list[zipfile.ZipInfo],
+    output_path: Path,
+    journal: ExtractionJournal,
+    version: str,
+    upgrade_from: str,
+    link_mode: str,
+) -> list[zipfile.ZipInfo]:
+    """Link members unchanged since the installed version, return the rest."""
+    new_prefix = f"Assets/Isaac/{get_version_short(version)}/"
+    old_prefix = f"Assets/Isaac/{get_version_short(upgrade_from)}/"
+
+    def old_name_for(name: str) -> str | None:
+        if not name.startswith(new_prefix):
+            return None
+        return old_prefix + name[len(new_prefix) :]
+
+    click.echo(f"Comparing archive against installed v{upgrade_from} assets...")
+    known = load_install_manifest(get_install_manifest_path(output_path, upgrade_from))
+    unchanged, changed = plan_delta(members, output_path, old_name_for, known)
+
+    def link(pair: tuple[zipfile.ZipInfo, Path]) -> str:
+        member, old_path = pair
+        target = safe_member_path(output_path, member.filename)
+        if target == old_path:
+            return "in place"  # same asset folder (same minor version)
+        return link_file(old_path, target, link_mode)
+
+    with ThreadPoolExecutor(max_workers=LINK_WORKERS) as pool:
+        methods = Counter(pool.map(link, unchanged))
+    journal.record_members([(m.filename, m.file_size, m.CRC) for m, _ in unchanged])
+
+    reused = sum(m.file_size for m, _ in unchanged)
+    how = ", ".join(f"{count} {method}" for method, count in methods.items())
     click.echo(
-        f"Isaac Sim assets installed to: {target_path}/isaacsim_assets/Assets/Isaac/{version_short}"
+        f"Reused {len(unchanged)} unchanged files ({format_size(reused)})"
+        + (f" via {how}" if how else "")
+        + f"; {len(changed)} changed or new members to extract."
     )
+    return changed
 
-    click.echo("Cleaning up zip files parts...")
-    for part in zip_parts:
-        if part.exists():
-            part.unlink()
 
-    if merged_zip.exists() and not keep_zip:
-        merged_zip.unlink()
+def extract_assets(
+    target_path: Path,
+    version: str = "5.1.0",
+    keep_zip: bool = False,
+    workers: int | None = None,
+    upgrade_from: str | None = None,
+    link_mode: str = "auto",
+    store: Path | None = None,
+    cache: Path | None = None,
+) -> None:
+    """Extract Isaac Sim asset zip parts in parallel without merging them first.
+
+    Reads the zip parts as one concatenated archive and extracts it to
+    target_path/isaacsim_assets with a pool of worker processes. Each part is
+    deleted as soon as no remaining member needs it, unless keep_zip is set.
+    Progress is recorded in a journal, so a rerun after an interruption only
+    extracts the members that are not complete yet.
+
+    When upgrading from an installed version, members whose size and CRC-32
+    match the installed file are reflinked or hard-linked instead of being
+    extracted again. With a content store, every extracted file becomes a
+    hard link into the store, so identical files share one copy on disk.
+    Once every member passed its CRC check, the parts added to the download
+    cache as pending are confirmed.
+
+    Args:
+        target_path: Directory containing the downloaded zip parts.
+        version: Isaac Sim asset version string (e.g., "5.1.0").
+        keep_zip: If True, keep zip parts after extraction.
+        workers: Number of extraction processes (default: CPU count).
+        upgrade_from: Installed asset version to reuse unchanged files from.
+        link_mode: How unchanged files are shared ("auto", "reflink",
+            "hardlink" or "copy").
+        store: Optional content-addressed store on the same filesystem.
+        cache: Download cache shared by projects (None = not used).
+
+    Returns:
+        None
+
+    Raises:
+        zipfile.BadZipFile: If the archive is corrupted or a CRC check fails.
+    """
+    zip_parts = get_asset_part_paths(target_path, version)
+    output_path = target_path / "isaacsim_assets"
+
+    journal = get_extraction_journal(target_path, version)
+    if journal.load() and journal.matches(zip_parts):
+        click.echo(f"Resuming interrupted extraction from journal: {journal.path}")
     else:
+        journal.start(zip_parts)
+
+    # The last part holds the central directory and is only released once
+    # every member is extracted, so there is nothing left to do
+    if journal.parts[-1][0] in journal.released:
+        click.echo("All asset files were already extracted.")
+    else:
+        _extract_remaining(
+            zip_parts=zip_parts,
+            output_path=output_path,
+            journal=journal,
+            keep_zip=keep_zip,
+            workers=workers,
+            version=version,
+            upgrade_from=upgrade_from,
+            link_mode=link_mode,
+            store=store,
+        )
+    save_install_manifest(
+        get_install_manifest_path(output_path, version), journal.completed
+    )
+    journal.remove()
+    click.echo("Extraction complete.")
+    if cache:
+        # every member passed its CRC check, so pending parts are sound
+        for part in zip_parts:
+            if confirm_in_cache(cache, part):
+                click.echo(f"Added {part.name} to the download cache.")
+
+    version_short = get_version_short(version)
+    click.echo(
+        f"Isaac Sim assets installed to: {output_path}/Assets/Isaac/{version_short}"
+    )
+
+    if keep_zip:
         click.echo(f"Keeping zip files at: {target_path}")
+        return
 
+    click.echo("Cleaning up zip files parts...")
+    for part in zip_parts:
+        part.unlink(missing_ok=True)
+        manifest_path(part).unlink(missing_ok=True)
     click.echo("Cleanup complete.")
 
 
@@ -236,10 +701,71 @@ def extract_assets(
     "-k",
     "--keep-zip",
     is_flag=True,
-    help="Keep zip files after extraction",
+    help="Keep zip parts after extraction",
+)
+@click.option(
+    "-j",
+    "--connections",
+    default=DEFAULT_MAX_CONNECTIONS,
+    show_default=True,
+    type=click.IntRange(1, 64),
+    help="Total download connections shared by all asset parts",
+)
+@click.option(
+    "--limit-rate",
+    default=None,
+    help="Overall download bandwidth limit, e.g. 50M or 1G (bytes per second)",
+)
+@click.option(
+    "-w",
+    "--workers",
+    default=None,
+    type=click.IntRange(1),
+    help="Number of extraction processes (default: CPU count)",
+)
+@click.option(
+    "-u",
+    "--upgrade-from",
+    default=None,
+    help="Installed asset version at the same path to reuse unchanged files from",
+)
+@click.option(
+    "--link-mode",
+    type=click.Choice(LINK_MODES),
+    default="auto",
+    show_default=True,
+    help="How unchanged files are shared when upgrading",
+)
+@click.option(
+    "--no-store",
+    is_flag=True,
+    help="Do not deduplicate files through the content-addressed asset store",
+)
+@click.option(
+    "-m",
+    "--mirror",
+    "mirrors",
+    multiple=True,
+    help="Mirror to try before [sim.assets] mirrors and the asset server (repeatable)",
+)
+@click.option(
+    "--no-download-cache",
+    is_flag=True,
+    help="Do not reuse or fill the download cache shared by projects",
 )
 def add_local_assets(
-    path: str, skip_download: bool, version: str, keep_zip: bool
+    path: str,
+    skip_download: bool,
+    version: str,
+    keep_zip: bool,
+    connections: int,
+    limit_rate: str | None,
+    workers: int | None,
+    upgrade_from: str | None,
+    link_mode: str,
+    no_store: bool,
+    mirrors: tuple[str, ...],
+    no_download_cache: bool,
 ) -> None:
     """Download Isaac Sim assets and install at target path.
 
@@ -250,7 +776,15 @@ def add_local_assets(
         path: Target directory path for asset installation.
         skip_download: If True, skip download and use existing files.
         version: Isaac Sim asset version string (e.g., "5.1.0").
-        keep_zip: If True, keep zip files after extraction.
+        keep_zip: If True, keep zip parts after extraction.
+        connections: Total download connections shared by all asset parts.
+        limit_rate: Overall download bandwidth limit (e.g., "50M").
+        workers: Number of extraction processes (default: CPU count).
+        upgrade_from: Installed asset version to reuse unchanged files from.
+        link_mode: How unchanged files are shared when upgrading.
+        no_store: If True, do not deduplicate through the content store.
+        mirrors: Mirrors to try before the configured ones.
+        no_download_cache: If True, do not use the download cache.
 
     Returns:
         None
@@ -264,14 +798,98 @@ def add_local_assets(
         )
 
     target_path = Path(path).resolve()
+    pow_config = load_project_config(Path.cwd())
+    store = None if no_store else get_store_path(pow_config, target_path)
+    if store and not is_same_filesystem(store, target_path):
+        click.echo(
+            click.style(
+                f"Asset store {store} is not on the filesystem of {target_path},"
+                " files cannot be hard linked into it: not deduplicating.",
+                fg="yellow",
+            )
+        )
+        store = None
+    mirrors = [
+        *mirrors,
+        *pow_config.get("sim", {}).get("assets", {}).get("mirrors", []),
+    ]
+    cache = None if no_download_cache else get_download_cache_path(pow_config)
+    if store and link_mode == "auto":
+        # reflinks would create new inodes outside the store
+        link_mode = "hardlink"
+
+    try:
+        max_bandwidth = parse_size(limit_rate)
+    except ValueError:
+        raise click.BadParameter(
+            f"Invalid rate '{limit_rate}'", param_hint="'--limit-rate'"
+        )
+
+    if upgrade_from:
+        old_asset_base = (
+            target_path
+            / "isaacsim_assets"
+            / "Assets"
+            / "Isaac"
+            / get_version_short(upgrade_from)
+        )
+        if not old_asset_base.is_dir():
+            raise click.ClickException(
+                click.style(
+                    f"No installed v{upgrade_from} assets found at {old_asset_base}",
+                    fg="red",
+                )
+            )
+        if get_version_short(upgrade_from) == get_version_short(version):
+            click.echo(
+                f"v{upgrade_from} and v{version} share {old_asset_base}: "
+                "unchanged files are kept in place."
+            )
 
     if not skip_download:
-        download_assets(target_path, version)
-        extract_assets(target_path, version, keep_zip)
+        download_assets(
+            target_path,
+            version,
+            max_connections=connections,
+            max_bandwidth=max_bandwidth,
+            mirrors=mirrors,
+            cache=cache,
+        )
+        for attempt in range(1, MAX_REPAIR_ATTEMPTS + 1):
+            try:
+                extract_assets(
+                    target_path,
+                    version,
+                    keep_zip,
+                    workers,
+                    upgrade_from,
+                    link_mode,
+                    store,
+                    cache,
+                )
+                break
+            except CorruptMemberError as e:
+                if attempt == MAX_REPAIR_ATTEMPTS:
+                    raise click.ClickException(
+                        click.style(f"Failed to extract assets: {e}", fg="red")
+                    )
+                click.echo(
+                    click.style(f"\n{e}. Repairing the affected chunks...", fg="yellow")
+                )
+                repair_corrupt_member(
+                    target_path, e, version, mirrors=mirrors, cache=cache
+                )
+            except zipfile.BadZipFile as e:
+                raise click.ClickException(
+                    click.style(f"Failed to extract assets: {e}", fg="red")
+                )
 
     # Update kit settings with local asset paths
     asset_path = update_kit_settings(target_path / "isaacsim_assets", version)
 
+    click.echo("Indexing installed assets...")
+    update_asset_browser_cache(asset_path, get_asset_index_path(target_path, version))
+
     click.echo(f"Local assets installed at:\n {asset_path}")
     click.echo(
         click.style(
@@ -0,0 +1,3 @@
+from .build_app import build_app
+
+__all__ = ["build_app"]
@@ -0,0 +1,90 @@
+"""Compile pow.toml profiles into Kit app files."""
+
+import click
+
+from ...lib.kit_app import (
+    DEFAULT_BASE_APP,
+    generate_app,
+    get_app_path,
+    lock_extensions,
+    profile_hash,
+    write_app,
+)
+from ...lib.path import get_isaacsim_path
+from ..run.run import (
+    find_project_root,
+    get_target_profile,
+    load_config,
+    report_extensions,
+)
+
+
+@click.command("build-app")
+@click.option(
+    "-p",
+    "--profile",
+    "profiles",
+    multiple=True,
+    help="Profile to build (repeatable, default: all profiles).",
+)
+def build_app(profiles: tuple[str, ...]) -> None:
+    """Compile profiles into Kit app files with a pinned version lock.
+
+    Each profile becomes apps/<profile>.kit, depending on the base Isaac Sim
+    app ([sim] base_app) and the profile's extensions, with its
+    "--/path=value" raw_args as settings and every extension of the solved
+    dependency closure pinned, plus apps/<profile>.lock.json. 'pow sim run'
+    launches the app of a profile while it matches pow.toml and the pinned
+    extensions are still available.
+
+    Args:
+        profiles: Profiles to build.
+
+    Returns:
+        None
+    """
+    project_root = find_project_root()
+    if project_root is None:
+        raise click.ClickException(
+            click.style(
+                "Not initialized. Run 'pow sim init' in your project directory.",
+                fg="red",
+            )
+        )
+    isaacsim_path = get_isaacsim_path()
+    if isaacsim_path is None:
+        raise click.ClickException(
+            click.style("Isaac Sim is not installed in this environment.", fg="red")
+        )
+
+    config = load_config(project_root)
+    base_app = config.get("sim", {}).get("base_app", DEFAULT_BASE_APP)
+    for name in profiles or list(config.profiles):
+        target_profile = get_target_profile(config, name)
+        resolution = lock_extensions(
+            config, project_root, target_profile, isaacsim_path
+        )
+        report_extensions(resolution, 0, 0)
+
+        app_path = get_app_path(project_root, name)
+        content = generate_app(
+            config, project_root, name, target_profile, resolution, isaacsim_path
+        )
+        lock = {
+            "profile": name,
+            "base_app": base_app,
+            "profile_hash": profile_hash(config, target_profile),
+            "extensions": {
+                ext: candidate["version"]
+                for ext, candidate in resolution["selected"].items()
+            },
+            "missing": sorted(resolution["missing"]),
+        }
+        write_app(app_path, content, lock)
+        click.echo(
+            click.style(
+                f"Built {app_path.relative_to(project_root)} "
+                f"({len(lock['extensions'])} extensions pinned)",
+                fg="green",
+            )
+        )
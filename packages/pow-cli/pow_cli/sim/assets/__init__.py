@@ -0,0 +1,13 @@
+from .index import du_assets, index_assets, ls_assets, search_assets
+from .serve import serve_assets
+from .store import dedupe_assets, gc_assets
+
+__all__ = [
+    "dedupe_assets",
+    "du_assets",
+    "gc_assets",
+    "index_assets",
+    "ls_assets",
+    "search_assets",
+    "serve_assets",
+]
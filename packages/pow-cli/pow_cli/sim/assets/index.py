@@ -0,0 +1,201 @@
+"""Asset search and disk usage commands backed by the asset index."""
+
+import sqlite3
+from pathlib import Path
+
+import click
+
+from ...lib.asset_index import connect, disk_usage, list_dir, search, update_index
+from ...lib.path import get_isaacsim_kit_path
+from ...lib.progress import format_size
+from ..info.info import get_local_assets_path_from_kit
+
+
+def resolve_asset_base(assets: str | None) -> Path:
+    """Find the installed asset version folder to index.
+
+    Args:
+        assets: Asset version folder given on the command line, if any.
+
+    Returns:
+        Path: Asset version folder (e.g., .../Assets/Isaac/5.1).
+
+    Raises:
+        click.ClickException: If no installed assets can be found.
+    """
+    if assets:
+        asset_base = Path(assets).expanduser().resolve()
+    else:
+        kit_path = get_isaacsim_kit_path()
+        found = None
+        if kit_path and kit_path.exists():
+            found = get_local_assets_path_from_kit(kit_path)
+        if not found:
+            raise click.ClickException(
+                click.style(
+                    "Could not find local assets. Pass --assets or run "
+                    "'pow sim add local-assets <path>' first.",
+                    fg="red",
+                )
+            )
+        asset_base = Path(found)
+
+    if not asset_base.is_dir():
+        raise click.ClickException(
+            click.style(f"Asset folder not found: {asset_base}", fg="red")
+        )
+    return asset_base
+
+
+def get_index_path(asset_base: Path) -> Path:
+    """Get the index database of an asset version folder.
+
+    For the layout installed by "pow sim add local-assets"
+    (<target>/isaacsim_assets/Assets/Isaac/<ver>), this is the index written
+    at install time in <target>.
+    """
+    parents = asset_base.parents
+    if len(parents) >= 4 and parents[2].name == "isaacsim_assets":
+        return parents[3] / f".pow-index-{asset_base.name}.sqlite"
+    return asset_base.parent / f".pow-index-{asset_base.name}.sqlite"
+
+
+def open_index(assets: str | None, refresh: bool = False) -> sqlite3.Connection:
+    """Open the asset index, building or refreshing it when needed."""
+    asset_base = resolve_asset_base(assets)
+    index_path = get_index_path(asset_base)
+    if refresh or not index_path.exists():
+        click.echo(f"Indexing {asset_base}...", err=True)
+        update_index(asset_base, index_path)
+    return connect(index_path)
+
+
+assets_option = click.option(
+    "--assets", default=None, help="Asset version folder (default: from Isaac Sim)"
+)
+refresh_option = click.option(
+    "-r", "--refresh", is_flag=True, help="Refresh the index before querying"
+)
+
+
+@click.command("index")
+@assets_option
+def index_assets(assets: str | None) -> None:
+    """Build or refresh the asset search index.
+
+    Only folders whose modification time changed since the last run are
+    listed again, so refreshing an unchanged tree is cheap.
+
+    Args:
+        assets: Asset version folder.
+
+    Returns:
+        None
+    """
+    asset_base = resolve_asset_base(assets)
+    index_path = get_index_path(asset_base)
+    stats = update_index(asset_base, index_path)
+    click.echo(
+        f"Scanned {stats['scanned']} folders: {stats['changed']} updated, "
+        f"{stats['removed']} removed."
+    )
+    click.echo(f"Index: {index_path}")
+
+
+@click.command("search")
+@click.argument("pattern", required=True)
+@click.option("-c", "--category", default=None, help="Category, e.g. Robots or Props")
+@click.option(
+    "-t", "--type", "kind", default=None, help="File type, e.g. usd, texture, material"
+)
+@click.option("-n", "--limit", default=50, show_default=True, help="Maximum results")
+@assets_option
+@refresh_option
+def search_assets(
+    pattern: str,
+    category: str | None,
+    kind: str | None,
+    limit: int,
+    assets: str | None,
+    refresh: bool,
+) -> None:
+    """Search installed assets by file name.
+
+    PATTERN matches anywhere in the name unless it contains * or ? wildcards.
+
+    Args:
+        pattern: File name pattern.
+        category: Only show files in this category.
+        kind: Only show files of this type.
+        limit: Maximum number of results.
+        assets: Asset version folder.
+        refresh: If True, refresh the index first.
+
+    Returns:
+        None
+    """
+    conn = open_index(assets, refresh)
+    rows = search(conn, pattern, category, kind, limit)
+    conn.close()
+
+    if not rows:
+        click.echo(click.style("No matching assets.", fg="yellow"))
+        return
+    for path, _, typ, size in rows:
+        click.echo(f"{format_size(size):>10}  {typ:<8}  {path}")
+
+
+@click.command("ls")
+@click.argument("path", default="")
+@assets_option
+@refresh_option
+def ls_assets(path: str, assets: str | None, refresh: bool) -> None:
+    """List an installed asset folder (e.g., Isaac/Robots).
+
+    Args:
+        path: Folder relative to the asset version folder.
+        assets: Asset version folder.
+        refresh: If True, refresh the index first.
+
+    Returns:
+        None
+    """
+    conn = open_index(assets, refresh)
+    subdirs, files = list_dir(conn, path)
+    conn.close()
+
+    if not subdirs and not files:
+        raise click.ClickException(
+            click.style(f"No indexed folder: {path or '.'}", fg="red")
+        )
+    for name in subdirs:
+        click.echo(click.style(f"{'':>10}  {'dir':<8}  {name}/", fg="blue"))
+    for name, typ, size in files:
+        click.echo(f"{format_size(size):>10}  {typ:<8}  {name}")
+
+
+@click.command("du")
+@click.argument("path", default="")
+@click.option("-d", "--depth", default=1, show_default=True, help="Grouping depth")
+@assets_option
+@refresh_option
+def du_assets(path: str, depth: int, assets: str | None, refresh: bool) -> None:
+    """Show the size of installed asset folders, largest first.
+
+    Args:
+        path: Folder relative to the asset version folder.
+        depth: Number of folder levels below PATH to group sizes by.
+        assets: Asset version folder.
+        refresh: If True, refresh the index first.
+
+    Returns:
+        None
+    """
+    conn = open_index(assets, refresh)
+    rows = disk_usage(conn, path, depth)
+    conn.close()
+
+    total = sum(size for _, size, _ in rows)
+    for rel, size, count in rows:
+        click.echo(f"{format_size(size):>10}  {count:>8} files  {rel}")
+    click.echo(f"{format_size(total):>10}  total")
@@ -0,0 +1,80 @@
+"""Serve the asset download cache to other machines."""
+
+import socket
+from pathlib import Path
+
+import click
+
+from ...lib.asset_server import make_server
+from ...lib.config import load_project_config
+from ...lib.download_cache import get_download_cache_path, list_refs
+from ...lib.progress import format_size
+
+
+@click.command("serve")
+@click.option(
+    "--host", default="0.0.0.0", show_default=True, help="Address to listen on"
+)
+@click.option("--port", default=8765, show_default=True, help="Port to listen on")
+@click.option(
+    "--cache",
+    "cache_path",
+    default=None,
+    help="Download cache to serve (default: [sim.assets] download_cache)",
+)
+@click.option("-q", "--quiet", is_flag=True, help="Do not log requests")
+def serve_assets(host: str, port: int, cache_path: str | None, quiet: bool) -> None:
+    """Serve downloaded asset parts over HTTP to other machines.
+
+    Other machines list this server in [sim.assets] mirrors, and
+    'pow sim add local-assets' fetches the parts it has from here, with
+    range requests and chunk manifests for verification, instead of from
+    the internet.
+
+    Args:
+        host: Address to listen on.
+        port: Port to listen on.
+        cache_path: Download cache to serve.
+        quiet: If True, do not log requests.
+
+    Returns:
+        None
+    """
+    if cache_path:
+        cache = Path(cache_path).expanduser().resolve()
+    else:
+        pow_toml_path = Path.cwd() / "pow.toml"
+        pow_config = load_project_config(Path.cwd()) if pow_toml_path.exists() else {}
+        cache = get_download_cache_path(pow_config)
+
+    refs = list_refs(cache)
+    if not refs:
+        click.echo(
+            click.style(
+                f"{cache} holds no downloads yet, serving it anyway.", fg="yellow"
+            )
+        )
+    for name, ref in sorted(refs.items()):
+        click.echo(f"{format_size(ref.get('size', 0)):>10}  {name}")
+
+    try:
+        server = make_server(cache, host, port, quiet)
+    except OSError as e:
+        raise click.ClickException(
+            click.style(f"Cannot listen on {host}:{port}: {e.strerror}", fg="red")
+        )
+    shown_host = socket.gethostname() if host in ("0.0.0.0", "::") else host
+    click.echo(
+        click.style(
+            f"Serving {cache} at http://{shown_host}:{port}\n"
+            f'Add it to [sim.assets] mirrors = ["http://{shown_host}:{port}"] '
+            "on other machines. Press Ctrl+C to stop.",
+            fg="green",
+        )
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,132 @@
+"""Content-addressed asset store commands."""
+
+from pathlib import Path
+
+import click
+
+from ...lib.config import load_project_config
+from ...lib.path import get_isaacsim_kit_path
+from ...lib.progress import format_size
+from ...lib.store import (
+    STORE_DIRNAME,
+    gc,
+    get_store_path,
+    ingest_tree,
+    is_same_filesystem,
+    store_stats,
+)
+from ..info.info import get_local_assets_path_from_kit
+
+
+def resolve_store_path(store: str | None) -> Path:
+    """Find the asset store used by this project.
+
+    Uses the --store option if given, then [sim.assets].store from pow.toml,
+    then the .pow-store next to the local assets configured in Isaac Sim.
+
+    Args:
+        store: Store path given on the command line, if any.
+
+    Returns:
+        Path: Store directory.
+
+    Raises:
+        click.ClickException: If no store can be found.
+    """
+    if store:
+        return Path(store).expanduser().resolve()
+
+    pow_toml_path = Path.cwd() / "pow.toml"
+    pow_config = load_project_config(Path.cwd()) if pow_toml_path.exists() else {}
+
+    kit_path = get_isaacsim_kit_path()
+    asset_base = None
+    if kit_path and kit_path.exists():
+        asset_base = get_local_assets_path_from_kit(kit_path)
+
+    if pow_config.get("sim", {}).get("assets", {}).get("store"):
+        return get_store_path(pow_config, Path.cwd())
+    if asset_base:
+        # <target>/isaacsim_assets/Assets/Isaac/<ver> -> <target>
+        return Path(asset_base).parents[3] / STORE_DIRNAME
+
+    raise click.ClickException(
+        click.style(
+            "Could not find the asset store. Pass --store or install local assets first.",
+            fg="red",
+        )
+    )
+
+
+def print_store_report(store: Path) -> None:
+    """Print object count, disk usage and bytes saved by the store."""
+    stats = store_stats(store)
+    click.echo(f"Asset store: {store}")
+    click.echo(f"  Objects:        {stats['objects']}")
+    click.echo(f"  Stored on disk: {format_size(stats['stored_bytes'])}")
+    click.echo(f"  Linked size:    {format_size(stats['logical_bytes'])}")
+    click.echo(
+        click.style(
+            f"  Bytes saved:    {format_size(stats['saved_bytes'])}", fg="green"
+        )
+    )
+
+
+@click.command("gc")
+@click.option("--store", default=None, help="Path to the asset store")
+@click.option("-n", "--dry-run", is_flag=True, help="Only report what would be deleted")
+def gc_assets(store: str | None, dry_run: bool) -> None:
+    """Remove store objects no installed asset tree uses anymore.
+
+    Objects are unused once every hard link to them outside the store is
+    gone, e.g. after deleting an old asset version directory.
+
+    Args:
+        store: Path to the asset store.
+        dry_run: If True, only report what would be deleted.
+
+    Returns:
+        None
+    """
+    store_path = resolve_store_path(store)
+    removed, freed = gc(store_path, dry_run)
+
+    action = "Would remove" if dry_run else "Removed"
+    click.echo(f"{action} {removed} unused objects ({format_size(freed)}).")
+    print_store_report(store_path)
+
+
+@click.command("dedupe")
+@click.argument("path", required=True)
+@click.option("--store", default=None, help="Path to the asset store")
+def dedupe_assets(path: str, store: str | None) -> None:
+    """Move an existing asset tree into the content-addressed store.
+
+    Identical files are replaced by hard links to a single store object.
+    The store must be on the same filesystem as the tree.
+
+    Args:
+        path: Asset tree to deduplicate.
+        store: Path to the asset store.
+
+    Returns:
+        None
+    """
+    store_path = resolve_store_path(store)
+    tree = Path(path).resolve()
+    if not tree.is_dir():
+        raise click.ClickException(click.style(f"Not a directory: {tree}", fg="red"))
+    if not is_same_filesystem(store_path, tree):
+        raise click.ClickException(
+            click.style(
+                f"Asset store {store_path} is not on the filesystem of {tree}, "
+                "files cannot be hard linked into it. Pass --store with a "
+                "directory on the same filesystem.",
+                fg="red",
+            )
+        )
+
+    click.echo(f"Deduplicating {tree}...")
+    files, saved = ingest_tree(store_path, tree)
+    click.echo(f"Replaced {files} duplicate files ({format_size(saved)}).")
+    print_store_report(store_path)
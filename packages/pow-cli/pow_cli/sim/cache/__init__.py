@@ -0,0 +1,3 @@
+from .cache import du_cache, prune_cache
+
+__all__ = ["du_cache", "prune_cache"]
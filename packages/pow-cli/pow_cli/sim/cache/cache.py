@@ -0,0 +1,153 @@
+"""Report, relocate and prune Kit caches."""
+
+import time
+from pathlib import Path
+
+import click
+
+from ...lib.download import parse_size
+from ...lib.kit_cache import (
+    delete_files,
+    get_default_cache_root,
+    parse_duration,
+    resolve_cache_root,
+    scan_tree,
+    select_prune,
+    summarize,
+)
+from ...lib.progress import format_size
+from ..run.run import find_project_root, get_target_profile, load_config
+
+
+def get_cache_roots(profile: str | None, all_roots: bool) -> tuple[list[Path], dict]:
+    """Get the cache roots to work on and the [sim.cache] settings.
+
+    Inside a project, this is the cache root of the profile (its cache_path,
+    [sim.cache] path, or Kit's default). With all_roots, the roots of every
+    profile and Kit's default are included.
+
+    Returns:
+        tuple[list[Path], dict]: Cache roots and the [sim.cache] table.
+    """
+    default_root = get_default_cache_root()
+    project_root = find_project_root()
+    if project_root is None:
+        return [default_root], {}
+
+    config = load_config(project_root)
+    names = list(config.profiles) if all_roots else [profile or "default"]
+    roots = [default_root] if all_roots else []
+    for name in names:
+        target_profile = get_target_profile(config, name)
+        root = resolve_cache_root(config, target_profile, project_root)
+        root = root or default_root
+        if root not in roots:
+            roots.append(root)
+    return roots, config.get("sim", {}).get("cache", {})
+
+
+profile_option = click.option(
+    "-p",
+    "--profile",
+    default=None,
+    help="Profile whose cache to use (default: default)",
+)
+all_option = click.option(
+    "-a", "--all", "all_roots", is_flag=True, help="Include the caches of all profiles"
+)
+
+
+@click.command("du")
+@profile_option
+@all_option
+def du_cache(profile: str | None, all_roots: bool) -> None:
+    """Show the size of Kit caches (shaders, textures, derived data).
+
+    Caches are relocated per project with [sim.cache] path in pow.toml, or
+    per profile with its cache_path key; 'pow sim run' passes the matching
+    Kit settings.
+
+    Args:
+        profile: Profile whose cache to report.
+        all_roots: If True, report the caches of all profiles.
+
+    Returns:
+        None
+    """
+    roots, _ = get_cache_roots(profile, all_roots)
+    now = time.time()
+    for root in roots:
+        click.echo(click.style(f"{root}", bold=True))
+        files = scan_tree(root)
+        if not files:
+            click.echo("  (empty)")
+            continue
+        usage = sorted(summarize(root, files).items(), key=lambda i: -i[1][0])
+        for name, (size, count, used) in usage:
+            days = (now - used) / 86400
+            click.echo(
+                f"{format_size(size):>10}  {count:>8} files  "
+                f"used {days:>5.1f}d ago  {name}"
+            )
+        total = sum(size for _, size, _ in files)
+        click.echo(f"{format_size(total):>10}  total")
+
+
+@click.command("prune")
+@profile_option
+@all_option
+@click.option("--max-size", default=None, help="Keep at most this size, e.g. 20G")
+@click.option("--max-age", default=None, help="Delete files unused for, e.g. 30d")
+@click.option("-n", "--dry-run", is_flag=True, help="Only show what would be deleted")
+def prune_cache(
+    profile: str | None,
+    all_roots: bool,
+    max_size: str | None,
+    max_age: str | None,
+    dry_run: bool,
+) -> None:
+    """Delete least recently used Kit cache files.
+
+    Limits default to [sim.cache] max_size and max_age in pow.toml. Files
+    unused for longer than the maximum age are deleted, then the least
+    recently used ones until each cache fits in the maximum size.
+
+    Args:
+        profile: Profile whose cache to prune.
+        all_roots: If True, prune the caches of all profiles.
+        max_size: Maximum cache size.
+        max_age: Maximum time since a file was last used.
+        dry_run: If True, do not delete anything.
+
+    Returns:
+        None
+    """
+    roots, settings = get_cache_roots(profile, all_roots)
+    max_size = max_size or settings.get("max_size") or None
+    max_age = max_age or settings.get("max_age") or None
+    try:
+        size_limit = parse_size(max_size)
+        age_limit = parse_duration(max_age) if max_age else None
+    except ValueError as e:
+        raise click.ClickException(click.style(str(e), fg="red"))
+    if size_limit is None and age_limit is None:
+        raise click.ClickException(
+            click.style(
+                "Pass --max-size and/or --max-age, or set them in [sim.cache].",
+                fg="red",
+            )
+        )
+
+    for root in roots:
+        files = scan_tree(root)
+        selected = select_prune(files, age_limit, size_limit)
+        size = sum(size for _, size, _ in selected)
+        if dry_run:
+            for path, file_size, _ in selected:
+                click.echo(f"{format_size(file_size):>10}  {path}")
+            click.echo(
+                f"Would delete {len(selected)} files ({format_size(size)}) from {root}"
+            )
+            continue
+        freed = delete_files(selected, root)
+        click.echo(f"Deleted {len(selected)} files ({format_size(freed)}) from {root}")
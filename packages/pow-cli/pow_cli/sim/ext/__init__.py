@@ -0,0 +1,3 @@
+from .sync import sync_extensions
+
+__all__ = ["sync_extensions"]
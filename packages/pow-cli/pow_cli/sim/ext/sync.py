@@ -0,0 +1,169 @@
+"""Mirror the extensions needed by pow.toml profiles for offline use."""
+
+import time
+import urllib.error
+from pathlib import Path
+
+import click
+
+from ...lib.config import ConfigError
+from ...lib.ext_folders import get_mirror_path
+from ...lib.ext_index import build_ext_index, get_builtin_ext_folders, resolve_closure
+from ...lib.ext_mirror import (
+    load_registry_index,
+    merge_indexes,
+    sync_packages,
+    write_mirror_index,
+)
+from ...lib.kit_app import DEFAULT_BASE_APP, read_app_dependencies
+from ...lib.path import get_isaacsim_path
+from ...lib.progress import format_eta, format_size
+from ..run.run import find_project_root, get_target_profile, load_config
+
+
+def get_roots(config: dict, profiles: list[str], isaacsim_path: Path | None) -> list:
+    """Get the extensions to resolve: the base app's and the profiles'."""
+    roots = []
+    if isaacsim_path is not None:
+        base_app = config.get("sim", {}).get("base_app", DEFAULT_BASE_APP)
+        try:
+            dependencies = read_app_dependencies(isaacsim_path / "apps", base_app)
+        except ConfigError:
+            dependencies = {}
+        roots += [
+            f"{name}-{version}" if version else name
+            for name, version in dependencies.items()
+        ]
+    for name in profiles:
+        roots += get_target_profile(config, name).get("extensions", [])
+    return list(dict.fromkeys(roots))
+
+
+@click.command("sync")
+@click.option(
+    "-p",
+    "--profile",
+    "profiles",
+    multiple=True,
+    help="Profile to mirror (repeatable, default: all profiles).",
+)
+@click.option(
+    "--registry",
+    default=None,
+    help="Registry URL or path (default: [sim.ext_mirror] registry).",
+)
+@click.option("-j", "--jobs", default=8, show_default=True, help="Parallel downloads.")
+@click.option(
+    "--verify", is_flag=True, help="Re-hash mirrored archives, refetch corrupted ones."
+)
+@click.option("-n", "--dry-run", is_flag=True, help="Only list what would be fetched")
+def sync_extensions(
+    profiles: tuple[str, ...],
+    registry: str | None,
+    jobs: int,
+    verify: bool,
+    dry_run: bool,
+) -> None:
+    """Mirror the extensions needed by the profiles from a registry.
+
+    The dependency closure of the base app and of the profiles' extensions
+    is resolved over ext_folders and Isaac Sim's own extensions; what is
+    missing is taken from the registry's index.json. Archives are fetched in
+    parallel, checked against their sha256 and stored by content in the
+    mirror ([sim.ext_mirror] path). 'pow sim run' then passes the mirror's
+    exts folder to Kit, so it starts without network access.
+
+    Args:
+        profiles: Profiles to mirror.
+        registry: Registry URL or path.
+        jobs: Number of parallel downloads.
+        verify: If True, re-hash archives already in the mirror.
+        dry_run: If True, do not download anything.
+
+    Returns:
+        None
+    """
+    project_root = find_project_root()
+    if project_root is None:
+        raise click.ClickException(
+            click.style(
+                "Not initialized. Run 'pow sim init' in your project directory.",
+                fg="red",
+            )
+        )
+    config = load_config(project_root)
+    mirror_config = config.get("sim", {}).get("ext_mirror", {})
+    registry = registry or mirror_config.get("registry", "")
+    if not registry:
+        raise click.ClickException(
+            click.style(
+                "No registry. Pass --registry or set [sim.ext_mirror] registry.",
+                fg="red",
+            )
+        )
+
+    try:
+        registry_index = load_registry_index(registry)
+    except urllib.error.URLError as e:
+        raise click.ClickException(
+            click.style(f"Cannot read registry {registry}: {e.reason}", fg="red")
+        )
+
+    isaacsim_path = get_isaacsim_path()
+    local_folders = [
+        (project_root / Path(folder).expanduser()).resolve()
+        for folder in config.get("sim", {}).get("ext_folders", [])
+    ]
+    index = build_ext_index(local_folders + get_builtin_ext_folders(isaacsim_path))
+    roots = get_roots(config, list(profiles or config.profiles), isaacsim_path)
+    resolution = resolve_closure(roots, merge_indexes(index, registry_index), set())
+
+    for name, requesters in sorted(resolution["missing"].items()):
+        required_by = ", ".join(sorted(set(requesters)))
+        click.echo(
+            click.style(
+                f"Extension '{name}' (required by {required_by}) "
+                "is neither local nor in the registry.",
+                fg="yellow",
+            )
+        )
+    for name, message in sorted(resolution["conflicts"].items()):
+        click.echo(
+            click.style(f"Version conflict for '{name}': {message}", fg="yellow")
+        )
+
+    candidates = [c for c in resolution["selected"].values() if "url" in c]
+    mirror = get_mirror_path(config)
+    click.echo(
+        f"{len(candidates)} of {len(resolution['selected'])} extensions come from "
+        f"the registry, mirroring into {mirror}"
+    )
+    if dry_run:
+        for candidate in sorted(candidates, key=lambda c: c["name"]):
+            size = format_size(candidate["size"] or 0)
+            click.echo(f"  {candidate['name']}-{candidate['version']}  {size}")
+        return
+
+    start = time.monotonic()
+    fetched, failures = sync_packages(mirror, candidates, jobs, verify)
+    for package, error in sorted(failures.items()):
+        click.echo(click.style(f"  {package}: {error}", fg="red"))
+    failed = set(failures)
+    write_mirror_index(
+        mirror,
+        [c for c in candidates if f"{c['name']}-{c['version']}" not in failed],
+    )
+    if failures:
+        raise click.ClickException(
+            click.style(
+                f"{len(failures)} extension(s) could not be mirrored.", fg="red"
+            )
+        )
+    click.echo(
+        click.style(
+            f"Mirrored {len(candidates)} extensions "
+            f"({format_size(fetched)} fetched in "
+            f"{format_eta(time.monotonic() - start)})",
+            fg="green",
+        )
+    )
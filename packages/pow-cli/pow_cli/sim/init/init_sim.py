@@ -5,9 +5,13 @@ from importlib.resources import files
 from pathlib import Path
 
 import click
-import toml
 
 from ...lib import get_isaacsim_path
+from ...lib.browser_cache import get_browser_cache_path
+from ...lib.config import load_project_config
+from ..add.local_assets import update_asset_browser_cache
+from ..assets.index import get_index_path
+from ..info.info import get_local_assets_path_from_kit
 
 
 def generate_vscode_settings() -> bool:
@@ -57,10 +61,12 @@ def generate_vscode_settings() -> bool:
 
 
 def fix_asset_browser_cache(isaacsim_path: Path) -> bool:
-    """Fix the Isaac Sim asset browser cache issue by creating an empty cache file.
+    """Fix the Isaac Sim asset browser cache issue by creating the cache file.
 
     The asset browser extension requires a cache.json file to exist. If it doesn't,
-    the browser may fail to load. This function creates an empty cache structure.
+    the browser may fail to load. When local assets are configured, the cache is
+    pre-populated from the asset index so the browser does not rescan every
+    folder on first use. Otherwise an empty cache structure is created.
 
     Args:
         isaacsim_path: Path to the Isaac Sim installation directory.
@@ -68,18 +74,18 @@ def fix_asset_browser_cache(isaacsim_path: Path) -> bool:
     Returns:
         bool: True if cache was created or already exists, False otherwise.
     """
-    cache_path = (
-        isaacsim_path
-        / "exts"
-        / "isaacsim.asset.browser"
-        / "cache"
-        / "isaacsim.asset.browser.cache.json"
-    )
+    cache_path = get_browser_cache_path(isaacsim_path)
 
     if cache_path is None:
         click.echo("Warning: Could not find isaacsim installation")
         return False
 
+    kit_path = isaacsim_path / "apps" / "isaacsim.exp.base.kit"
+    asset_base = get_local_assets_path_from_kit(kit_path) if kit_path.exists() else None
+    if asset_base and Path(asset_base).is_dir():
+        update_asset_browser_cache(Path(asset_base), get_index_path(Path(asset_base)))
+        return True
+
     # Create cache directory if it doesn't exist
     cache_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -114,14 +120,14 @@ def create_pow_config_toml() -> tuple[dict, bool]:
 
     if pow_toml_path.exists():
         click.echo("Skipped creating pow.toml config, already exists.")
-        return (toml.load(pow_toml_path), True)
+        return (load_project_config(Path.cwd()), True)
 
     try:
         default_toml = files("pow_cli").joinpath("data", "pow.default.toml")
         content = default_toml.read_text()
         pow_toml_path.write_text(content)
         click.echo("Created pow.toml config")
-        return (toml.load(pow_toml_path), False)
+        return (load_project_config(Path.cwd()), False)
     except FileNotFoundError:
         click.echo("Error: Default template not found in package")
         return ({}, False)
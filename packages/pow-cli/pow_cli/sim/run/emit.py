@@ -0,0 +1,97 @@
+"""Compile a resolved profile into a standalone launcher script."""
+
+import hashlib
+import os
+import shlex
+from pathlib import Path
+
+SCRIPT_TEMPLATE = """#!/usr/bin/env bash
+# Isaac Sim launcher for profile '{profile}', generated by:
+#   {command}
+# It refuses to start once one of its inputs changed; run that command again.
+set -euo pipefail
+
+inputs=(
+{inputs})
+expected={expected}
+actual=$(sha256sum -- "${{inputs[@]}}" 2>/dev/null | sha256sum | cut -d' ' -f1) || actual=""
+if [ "$actual" != "$expected" ]; then
+    echo "Launcher for profile '{profile}' is stale, its inputs changed." >&2
+    echo "Regenerate it with: {command}" >&2
+    exit 3
+fi
+
+{environment}
+cd {project_root}
+{pre_commands}exec {argv} "$@"
+"""
+
+
+def get_launch_script_path(project_root: Path, profile: str) -> Path:
+    """Get the default launcher path of a profile (.pow/launch/<profile>.sh)."""
+    return project_root / ".pow" / "launch" / f"{profile}.sh"
+
+
+def hash_inputs(paths: list[Path]) -> str:
+    """Hash files the same way as `sha256sum -- paths | sha256sum` does."""
+    listing = ""
+    for path in paths:
+        digest = hashlib.sha256(Path(path).read_bytes()).hexdigest()
+        listing += f"{digest}  {path}\n"
+    return hashlib.sha256(listing.encode("utf-8")).hexdigest()
+
+
+def generate_launch_script(
+    profile: str,
+    project_root: Path,
+    argv: list[str],
+    env_delta: dict,
+    inputs: list[Path],
+    pre_commands: list[list[str]] | None = None,
+    base_env: dict[str, str] | None = None,
+) -> str:
+    """Generate a bash launcher that applies an env delta and execs argv.
+
+    Args:
+        profile: Profile name, used in messages.
+        project_root: Directory the launcher changes to before starting.
+        argv: Isaac Sim command line; arguments given to the script are appended.
+        env_delta: Variables to set and unset (see env_cache.diff_env).
+        inputs: Files whose content the launcher was generated from.
+        pre_commands: Commands to run before launching (e.g., CPU governor).
+        base_env: Environment the delta was computed against. Variables the
+            setup files only prepended to (e.g., PATH) are written relative
+            to the caller's value, so the launcher works from other shells.
+
+    Returns:
+        str: Script content.
+    """
+    environment = [f"unset {name}" for name in env_delta.get("unset", [])]
+    for name, value in sorted(env_delta.get("set", {}).items()):
+        base = (base_env or {}).get(name)
+        if base and value.endswith(f":{base}"):
+            prefix = value[: -len(base) - 1]
+            environment.append(
+                f"export {name}={shlex.quote(prefix)}${{{name}:+:${name}}}"
+            )
+        else:
+            environment.append(f"export {name}={shlex.quote(value)}")
+    return SCRIPT_TEMPLATE.format(
+        profile=profile,
+        command=shlex.join(["pow", "sim", "run", "--profile", profile, "--emit"]),
+        inputs="".join(f"    {shlex.quote(str(path))}\n" for path in inputs),
+        expected=hash_inputs(inputs),
+        environment="\n".join(environment),
+        project_root=shlex.quote(str(project_root)),
+        pre_commands="".join(f"{shlex.join(cmd)}\n" for cmd in pre_commands or []),
+        argv=shlex.join(argv),
+    )
+
+
+def write_launch_script(path: Path, content: str) -> None:
+    """Write an executable launcher script atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(content)
+    tmp.chmod(0o755)
+    os.replace(tmp, path)
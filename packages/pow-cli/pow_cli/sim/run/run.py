@@ -1,13 +1,40 @@
 """Run Isaac Sim App command."""
 
+import itertools
+import json
 import os
 import platform
 import shlex
 import subprocess
+import time
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
-import toml
+
+from ...lib.config import (
+    PLACEMENT_KEYS,
+    ProjectConfig,
+    compile_profiles,
+    load_project_config,
+)
+from ...lib.env_cache import (
+    apply_env_delta,
+    diff_env,
+    env_cache_key,
+    load_env_delta,
+    parse_env0,
+    save_env_delta,
+)
+from ...lib.ext_folders import get_ext_folders, get_mirror_ext_folder
+from ...lib.kit_cache import cache_settings, resolve_cache_root
+from ...lib.path import get_isaacsim_path
+from ...lib.runs import new_run_path, write_run_metadata
+
+# Feature modules are imported where they are used, so a plain launch
+# does not pay for the daemon, instances, placement, monitor or trace code.
+if TYPE_CHECKING:
+    from ...lib.monitor import Monitor
 
 
 def find_project_root(start_path: Path | None = None) -> Path | None:
@@ -39,23 +66,26 @@ def find_project_root(start_path: Path | None = None) -> Path | None:
     return None
 
 
-def load_config(project_root: Path) -> dict:
+def load_config(project_root: Path) -> ProjectConfig:
     """Load pow.toml configuration.
 
+    The validated configuration is cached until pow.toml changes.
+
     Args:
         project_root: Path to the project root directory.
 
     Returns:
-        dict: Parsed TOML configuration.
+        ProjectConfig: Parsed TOML configuration.
 
     Raises:
         FileNotFoundError: If pow.toml is not found.
+        ConfigError: If pow.toml is invalid.
     """
     config_path = project_root / "pow.toml"
     if not config_path.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
-    return toml.load(config_path)
+    return load_project_config(project_root)
 
 
 def source_setup_file(
@@ -82,7 +112,7 @@ def source_setup_file(
     command = [
         shell_type,
         "-c",
-        f"source {safe_path} && env",
+        f"source {safe_path} && env -0",
     ]
 
     try:
@@ -94,12 +124,8 @@ def source_setup_file(
             env=env,
         )
 
-        # Parse the environment variables from stdout
-        new_env = {}
-        for line in result.stdout.splitlines():
-            if "=" in line:
-                key, _, value = line.partition("=")
-                new_env[key] = value
+        # Parse the NUL-delimited environment so values with newlines survive
+        new_env = parse_env0(result.stdout)
 
         label = description if description else str(file_path)
         click.echo(
@@ -120,17 +146,18 @@ def source_setup_file(
         )
 
 
-def source_isaacsim_ros_workspace(config: dict) -> dict:
-    """Check and prepare ROS workspace environment variables.
-
-    Checks if the ROS setup files exist based on isaacsim_ros_ws config.
-    Returns environment variables that would be set by sourcing the setup files.
+def get_ros_setup_files(config: dict) -> tuple[str, str, list[Path]]:
+    """Find the ROS setup files to source for the current shell.
 
     Args:
         config: Parsed pow.toml configuration dictionary.
 
     Returns:
-        dict[str, str]: Environment variables to be set for ROS workspace.
+        tuple[str, str, list[Path]]: Shell type, ROS distro, and the distro
+            and Isaac Sim ROS workspace local_setup files, in sourcing order.
+
+    Raises:
+        click.ClickException: If the workspace, shell or setup files are invalid.
     """
 
     ros_config = config.get("sim", {}).get("ros", {})
@@ -197,6 +224,38 @@ def source_isaacsim_ros_workspace(config: dict) -> dict:
             )
         )
 
+    return shell_type, ros_distro, [distro_local_setup, isaac_sim_ros_setup]
+
+
+def source_isaacsim_ros_workspace(config: dict, use_cache: bool = True) -> dict:
+    """Check and prepare ROS workspace environment variables.
+
+    Checks if the ROS setup files exist based on isaacsim_ros_ws config.
+    Returns environment variables that would be set by sourcing the setup files.
+    The variables set by sourcing are cached in ~/.pow/cache/ros-env, keyed on
+    the setup files, shell, distro and base environment, so later launches
+    skip the shells until one of those changes.
+
+    Args:
+        config: Parsed pow.toml configuration dictionary.
+        use_cache: If False, always source the setup files again.
+
+    Returns:
+        dict[str, str]: Environment variables to be set for ROS workspace.
+    """
+    shell_type, ros_distro, (distro_local_setup, isaac_sim_ros_setup) = (
+        get_ros_setup_files(config)
+    )
+
+    base_env = dict(os.environ)
+    cache_key = env_cache_key(
+        [distro_local_setup, isaac_sim_ros_setup], shell_type, ros_distro, base_env
+    )
+    delta = load_env_delta(cache_key) if use_cache else None
+    if delta is not None:
+        click.echo(click.style("Using cached ROS environment", fg="green"))
+        return apply_env_delta(base_env, delta)
+
     # Source setup files, passing environment from first to second
     distro_env = source_setup_file(
         distro_local_setup,
@@ -211,34 +270,29 @@ def source_isaacsim_ros_workspace(config: dict) -> dict:
         env=distro_env,
     )
 
+    save_env_delta(cache_key, diff_env(base_env, output_env))
     return output_env
 
 
 def get_target_profile(config: dict, profile_name: str = "default") -> dict:
-    """Get the target profile, merging with default profile if needed.
+    """Get the target profile, resolved through the profiles it extends.
 
     Args:
         config: Parsed pow.toml configuration dictionary.
         profile_name: Name of the profile to use (default: "default").
 
     Returns:
-        dict: The target profile, merged with default if applicable.
+        dict: The target profile, merged over the profiles it extends.
 
     Raises:
         click.ClickException: If the specified profile is not found.
     """
-    profiles = config.get("sim", {}).get("profiles", [])
-
-    default_profile = next((p for p in profiles if p.get("name") == "default"), None)
-    target_profile = None
-
-    if profile_name == "default":
-        target_profile = default_profile
+    if isinstance(config, ProjectConfig):
+        profiles = config.profiles
     else:
-        target_profile = next(
-            (p for p in profiles if p.get("name") == profile_name), None
-        )
+        profiles = compile_profiles(config)
 
+    target_profile = profiles.get(profile_name)
     if target_profile is None:
         raise click.ClickException(
             click.style(
@@ -246,13 +300,89 @@ def get_target_profile(config: dict, profile_name: str = "default") -> dict:
             )
         )
 
-    # Merge with default profile if it exists
-    if default_profile:
-        merged_profile = default_profile.copy()
-        merged_profile.update(target_profile)
-        target_profile = merged_profile
+    # profiles are resolved once when the config is compiled
+    return dict(target_profile)
+
+
+def get_enabled_extensions(target_profile: dict, extra_args: list[str]) -> list[str]:
+    """Get the extensions a launch enables: profile extensions and --enable args."""
+    extensions = list(target_profile.get("extensions", []))
+    args = [*target_profile.get("raw_args", []), *extra_args]
+    for arg, value in itertools.pairwise(args):
+        if arg == "--enable":
+            extensions.append(value)
+    return extensions
+
+
+def select_ext_folders(
+    config: dict, project_root: Path, target_profile: dict, extra_args: list[str]
+) -> tuple[list[str], dict | None]:
+    """Select the ext_folders the profile's extension closure needs.
 
-    return target_profile
+    The extension.toml files of ext_folders, the extension mirror ('pow sim
+    ext sync') and Isaac Sim's own extension folders are indexed (cached
+    until a directory or extension.toml mtime changes). The dependency
+    closure of the enabled extensions is resolved over that index and only
+    the folders holding a selected extension are kept. Set [sim]
+    trim_ext_folders = false to pass every folder, e.g. when extensions are
+    enabled at runtime.
+
+    Returns:
+        tuple[list[str], dict | None]: Folders to pass, as written in
+            pow.toml, and the resolution (see ext_index.resolve_closure), or
+            None when nothing was resolved.
+    """
+    sim_config = config.get("sim", {})
+    ext_folders = get_ext_folders(config)
+    if not ext_folders:
+        return ext_folders, None
+
+    from ...lib.ext_index import (
+        build_ext_index,
+        get_builtin_ext_folders,
+        resolve_closure,
+    )
+
+    paths = {
+        folder: (project_root / Path(folder).expanduser()).resolve()
+        for folder in ext_folders
+    }
+    index = build_ext_index(list(paths.values()))
+    isaacsim_path = get_isaacsim_path()
+    builtin = set(build_ext_index(get_builtin_ext_folders(isaacsim_path)))
+    resolution = resolve_closure(
+        get_enabled_extensions(target_profile, extra_args), index, builtin
+    )
+    if isaacsim_path is None:
+        # without Isaac Sim's own extensions, missing ones cannot be told apart
+        resolution["missing"] = {}
+
+    if not sim_config.get("trim_ext_folders", True):
+        return ext_folders, resolution
+    needed = {candidate["folder"] for candidate in resolution["selected"].values()}
+    return [f for f in ext_folders if str(paths[f]) in needed], resolution
+
+
+def report_extensions(resolution: dict, passed: int, total: int) -> None:
+    """Print missing and conflicting extensions found before launch."""
+    for name, requesters in sorted(resolution["missing"].items()):
+        click.echo(
+            click.style(
+                f"Extension '{name}' (required by {', '.join(sorted(requesters))}) "
+                "is not in ext_folders or Isaac Sim; Kit can only get it from "
+                "the extension registry.",
+                fg="yellow",
+            )
+        )
+    for name, message in sorted(resolution["conflicts"].items()):
+        click.echo(click.style(f"Extension '{name}': {message}", fg="yellow"))
+    if passed < total:
+        click.echo(
+            click.style(
+                f"Passing {passed} of {total} ext_folders needed by the profile.",
+                fg="bright_black",
+            )
+        )
 
 
 def build_launch_command(
@@ -260,6 +390,9 @@ def build_launch_command(
     project_root: Path,
     profile_name: str = "default",
     extra_args: list[str] | None = None,
+    executable: str = "uv run isaacsim",
+    ext_folders: list[str] | None = None,
+    app_path: Path | None = None,
 ) -> str:
     """Build the Isaac Sim launch command from configuration.
 
@@ -268,6 +401,12 @@ def build_launch_command(
         project_root: Path to the project root directory.
         profile_name: Name of the profile to use (default: "default").
         extra_args: Optional list of extra CLI arguments to append.
+        executable: Command the Kit arguments are passed to.
+        ext_folders: Extension folders to pass (default: all ext_folders and
+            the extension mirror).
+        app_path: Generated app of the profile (see 'pow sim build-app'). It
+            already holds the extension folders, extensions and settings;
+            only the extension mirror is passed.
 
     Returns:
         str: The constructed launch command.
@@ -275,8 +414,13 @@ def build_launch_command(
     Raises:
         click.ClickException: If the specified profile is not found.
     """
-    launch_cmd = "uv run isaacsim"
-    ext_folders = config.get("sim", {}).get("ext_folders", [])
+    launch_cmd = executable
+    if app_path is not None:
+        launch_cmd += f" {shlex.quote(str(app_path))}"
+        mirror_folder = get_mirror_ext_folder(config)
+        ext_folders = [str(mirror_folder)] if mirror_folder is not None else []
+    elif ext_folders is None:
+        ext_folders = get_ext_folders(config)
 
     if ext_folders:
         for folder in ext_folders:
@@ -288,14 +432,23 @@ def build_launch_command(
     if headless:
         launch_cmd += " --no-window"
 
-    enable_exts = target_profile.get("extensions", [])
+    enable_exts = target_profile.get("extensions", []) if app_path is None else []
     for ext in enable_exts:
         launch_cmd += f" --enable {ext}"
 
     raw_args = target_profile.get("raw_args", [])
+    if app_path is not None:
+        from ...lib.kit_app import split_setting_args
+
+        raw_args = split_setting_args(raw_args)[1]
     for arg in raw_args:
         launch_cmd += f" {arg}"
 
+    cache_root = resolve_cache_root(config, target_profile, project_root)
+    if cache_root:
+        for setting in cache_settings(cache_root):
+            launch_cmd += f" {shlex.quote(setting)}"
+
     open_scene_path = target_profile.get("open_scene_path", "")
     if open_scene_path:
         full_scene_path = project_root / open_scene_path
@@ -308,6 +461,119 @@ def build_launch_command(
     return launch_cmd
 
 
+USD_SUFFIXES = (".usd", ".usda", ".usdc", ".usdz")
+
+
+def attach_request(project_root: Path, target_profile: dict, args: list[str]) -> dict:
+    """Build the request sent to a warm instance by 'pow sim run --attach'.
+
+    Args:
+        project_root: Path to the project root directory.
+        target_profile: Resolved profile, used for its open_scene_path.
+        args: Extra arguments: a stage to open, or a script and its arguments.
+
+    Returns:
+        dict: Request for the daemon control socket.
+
+    Raises:
+        click.ClickException: If the first argument is neither a stage nor a script.
+    """
+    if args:
+        path = Path(args[0]).resolve()
+        if path.suffix == ".py":
+            return {"op": "run_script", "path": str(path), "args": args[1:]}
+        if path.suffix in USD_SUFFIXES:
+            return {"op": "open_stage", "path": str(path)}
+        raise click.ClickException(
+            click.style(
+                f"Cannot attach '{args[0]}': expected a .py script or a USD stage.",
+                fg="red",
+            )
+        )
+
+    open_scene_path = target_profile.get("open_scene_path", "")
+    if open_scene_path:
+        return {"op": "open_stage", "path": str(project_root / open_scene_path)}
+    return {"op": "status"}
+
+
+def start_run(
+    run_path: Path, record: dict, monitor_interval: float | None
+) -> "Monitor | None":
+    """Write the run metadata and start the resource monitor if requested.
+
+    The monitor samples every descendant of pow, i.e. Isaac Sim or all
+    instances, into <run>.monitor.csv.
+    """
+    monitor = None
+    if monitor_interval:
+        samples_path = run_path.with_suffix(".monitor.csv")
+        record["monitor"] = {
+            "interval_s": monitor_interval,
+            "samples": str(samples_path),
+        }
+        from ...lib.monitor import Monitor
+
+        monitor = Monitor(os.getpid(), samples_path, monitor_interval)
+        monitor.start()
+    write_run_metadata(run_path, record)
+    return monitor
+
+
+def finish_run(run_path: Path, record: dict, monitor: "Monitor | None") -> None:
+    """Record the end of a run and print the resource usage summary."""
+    record["ended_at"] = time.time()
+    if monitor is not None:
+        from ...lib.monitor import format_summary
+
+        record["monitor"]["summary"] = monitor.stop()
+        for line in format_summary(record["monitor"]["summary"]):
+            click.echo(line)
+        click.echo(f"Samples: {record['monitor']['samples']}")
+    write_run_metadata(run_path, record)
+
+
+def report_startup(trace_path: Path, lines: list, duration: float) -> dict:
+    """Write the startup Chrome trace and print the slowest extensions.
+
+    Returns:
+        dict: Startup summary for the run metadata.
+    """
+    from ...lib.startup_trace import (
+        build_timeline,
+        chrome_trace,
+        parse_log,
+        slowest_extensions,
+    )
+
+    spans = build_timeline(parse_log(lines), duration)
+    trace_path.parent.mkdir(parents=True, exist_ok=True)
+    trace_path.write_text(json.dumps(chrome_trace(spans)))
+
+    ready = next((s["duration"] for s in spans if s["name"] == "startup"), None)
+    slowest = slowest_extensions(spans)
+    click.echo(
+        click.style(
+            f"Startup: {ready:.2f}s to app ready"
+            if ready is not None
+            else "Startup: 'app ready' was not seen",
+            bold=True,
+        )
+    )
+    for name, seconds in slowest:
+        click.echo(f"{seconds:>10.3f}s  {name}")
+    for span in spans:
+        if span["category"] == "stage":
+            click.echo(f"{span['duration']:>10.3f}s  stage: {span['name']}")
+    click.echo(f"Trace (open in chrome://tracing or Perfetto): {trace_path}")
+    return {
+        "trace": str(trace_path),
+        "app_ready_s": ready,
+        "extensions": sum(1 for s in spans if s["category"] == "startup"),
+        "slowest": slowest,
+    }
+
+
 @click.command(
     context_settings={"ignore_unknown_options": True, "allow_extra_args": True}
 )
@@ -317,8 +583,69 @@ def build_launch_command(
     default="default",
     help="Profile name to use from pow.toml (default: 'default').",
 )
+@click.option(
+    "--refresh-env",
+    is_flag=True,
+    help="Source the ROS setup files again instead of using the cached environment.",
+)
+@click.option(
+    "--emit",
+    "emit_path",
+    is_flag=False,
+    flag_value="",
+    default=None,
+    help="Write a standalone launcher script instead of launching "
+    "(default path: .pow/launch/<profile>.sh).",
+)
+@click.option(
+    "--attach",
+    is_flag=True,
+    help="Open a stage or run a script (given as argument) in the warm instance "
+    "of 'pow sim serve' instead of launching.",
+)
+@click.option(
+    "-n",
+    "--instances",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Run this many isolated headless instances of the profile.",
+)
+# for testing only: hidden, and left out of the docstring click shows as --help
+@click.option(
+    "--dummy-command",
+    default=None,
+    hidden=True,
+    help="Run this command instead of 'uv run isaacsim', with the same "
+    "arguments (for testing).",
+)
+@click.option(
+    "--monitor",
+    "monitor_interval",
+    type=click.FloatRange(min=0.05),
+    is_flag=False,
+    flag_value=1.0,
+    default=None,
+    help="Sample CPU, memory, I/O and context switches of the launched process "
+    "tree every SECONDS (default: 1) into .pow/runs and print a summary on exit.",
+)
+@click.option(
+    "--profile-startup",
+    is_flag=True,
+    help="Timestamp Isaac Sim output, write a Chrome trace of extension startup "
+    "and stage open times to .pow/runs and print the slowest extensions.",
+)
 @click.pass_context
-def run(ctx, profile: str) -> None:
+def run(
+    ctx,
+    profile: str,
+    refresh_env: bool,
+    emit_path: str | None,
+    attach: bool,
+    instances: int,
+    dummy_command: str | None,
+    monitor_interval: float | None,
+    profile_startup: bool,
+) -> None:
     """Run an Isaac Sim App.
 
     Loads configuration from pow.toml in the project root.
@@ -327,6 +654,15 @@ def run(ctx, profile: str) -> None:
     Args:
         ctx: Click context containing extra arguments.
         profile: Name of the profile to use.
+        refresh_env: If True, ignore the cached ROS environment.
+        emit_path: If set, write a launcher script to this path ("" for the
+            default path) instead of launching Isaac Sim.
+        attach: If True, send the stage or script to 'pow sim serve'.
+        instances: Number of isolated headless instances to run. Each gets
+            its own ROS_DOMAIN_ID, Kit HTTP port, cache and log folders in
+            .pow/instances/<profile>/<n>, and CPUs spread across NUMA nodes.
+        monitor_interval: If set, seconds between resource usage samples.
+        profile_startup: If True, profile the startup from the Kit output.
 
     Returns:
         None
@@ -342,6 +678,35 @@ def run(ctx, profile: str) -> None:
 
     config = load_config(project_root)
 
+    if instances > 1 and (attach or emit_path is not None or profile_startup):
+        raise click.ClickException(
+            click.style(
+                "--instances cannot be used with --attach, --emit or "
+                "--profile-startup.",
+                fg="red",
+            )
+        )
+
+    if attach:
+        from ...lib.daemon import DaemonError, get_control_socket_path, send_request
+
+        request = attach_request(
+            project_root, get_target_profile(config, profile), ctx.args
+        )
+        try:
+            response = send_request(get_control_socket_path(project_root), request)
+        except DaemonError as e:
+            raise click.ClickException(
+                click.style(f"{e}. Start one with 'pow sim serve'.", fg="red")
+            )
+        if not response.get("ok"):
+            raise click.ClickException(
+                click.style(f"Request failed: {response.get('error')}", fg="red")
+            )
+        done = {k: v for k, v in response.items() if k not in ("ok", "error")}
+        click.echo(click.style(f"Done: {done}", fg="green"))
+        return
+
     # Check x86_64 environment
     if platform.machine().lower() not in ("x86_64", "amd64"):
         raise click.ClickException(
@@ -362,19 +727,117 @@ def run(ctx, profile: str) -> None:
     enable_ros = ros_config.get("enable_ros", False)
     source_env = None
     if enable_ros:
-        source_env = source_isaacsim_ros_workspace(config)
+        source_env = source_isaacsim_ros_workspace(config, not refresh_env)
     else:
         click.echo(click.style("ROS integration is disabled."))
 
     # construct isaacsim command
-    launch_cmd = build_launch_command(config, project_root, profile, ctx.args)
+    from ...lib.kit_app import (
+        check_app_lock,
+        get_app_path,
+        is_app_fresh,
+        profile_hash,
+    )
+
+    app_path = get_app_path(project_root, profile)
+    resolution = None
+    stale = None
+    if app_path.exists():
+        if not is_app_fresh(
+            app_path, profile_hash(config, get_target_profile(config, profile))
+        ):
+            stale = "pow.toml or the extension mirror changed"
+        else:
+            stale = check_app_lock(app_path, config, project_root, get_isaacsim_path())
+    if app_path.exists() and stale is None:
+        # the generated app pins the solved extensions
+        click.echo(click.style(f"Using app {app_path}", fg="bright_black"))
+        ext_folders = None
+    else:
+        if stale is not None:
+            click.echo(
+                click.style(
+                    f"{app_path} is out of date ({stale}), run 'pow sim "
+                    "build-app' to update it. Launching with command line flags.",
+                    fg="yellow",
+                )
+            )
+        app_path = None
+        ext_folders, resolution = select_ext_folders(
+            config, project_root, get_target_profile(config, profile), ctx.args
+        )
+    if emit_path is not None:
+        # launchers do not track the extension folders, keep them all
+        ext_folders = None
+    if resolution is not None:
+        total = len(get_ext_folders(config))
+        passed = total if ext_folders is None else len(ext_folders)
+        report_extensions(resolution, passed, total)
+
+    launch_cmd = build_launch_command(
+        config,
+        project_root,
+        profile,
+        ctx.args,
+        dummy_command or "uv run isaacsim",
+        ext_folders,
+        app_path,
+    )
 
     # Get target profile for cpu_performance_mode check
     target_profile = get_target_profile(config, profile)
 
+    cpu_performance_mode = target_profile.get("cpu_performance_mode", False)
+    cpu_performance_cmd = "sudo cpupower frequency-set -g performance"
+
+    placement = {}
+    if any(key in target_profile for key in PLACEMENT_KEYS):
+        from ...lib.placement import parse_placement
+
+        try:
+            placement = parse_placement(target_profile)
+        except ValueError as e:
+            raise click.ClickException(
+                click.style(f"Profile '{profile}': {e}", fg="red")
+            )
+
+    if emit_path is not None:
+        from .emit import (
+            generate_launch_script,
+            get_launch_script_path,
+            write_launch_script,
+        )
+
+        prefix = []
+        if placement:
+            from ...lib.placement import placement_prefix
+
+            prefix = placement_prefix(placement)
+        inputs = [project_root / "pow.toml"]
+        if app_path is not None:
+            inputs += [app_path, app_path.with_suffix(".lock.json")]
+        if enable_ros:
+            inputs += get_ros_setup_files(config)[2]
+        script_path = (
+            Path(emit_path).resolve()
+            if emit_path
+            else get_launch_script_path(project_root, profile)
+        )
+        script = generate_launch_script(
+            profile,
+            project_root,
+            prefix + shlex.split(launch_cmd),
+            diff_env(dict(os.environ), source_env) if source_env else {},
+            inputs,
+            [shlex.split(cpu_performance_cmd)] if cpu_performance_mode else None,
+            dict(os.environ),
+        )
+        write_launch_script(script_path, script)
+        click.echo(click.style(f"Wrote launcher script: {script_path}", fg="green"))
+        return
+
     # --- Execute the command ---
     # cpu performance mode
-    cpu_performance_mode = target_profile.get("cpu_performance_mode", False)
     if cpu_performance_mode:
         click.echo(
             click.style(
@@ -382,8 +845,124 @@ def run(ctx, profile: str) -> None:
                 fg="bright_black",
             )
         )
-        cmd = "sudo cpupower frequency-set -g performance"
-        subprocess.run(shlex.split(cmd), check=True)
+        subprocess.run(shlex.split(cpu_performance_cmd), check=True)
+
+    run_path = new_run_path(project_root, profile)
+    record = {
+        "profile": profile,
+        "command": launch_cmd,
+        "host": platform.node(),
+        "started_at": time.time(),
+        "cpu_performance_mode": cpu_performance_mode,
+    }
+
+    # applied in the children between fork and exec, not to pow itself
+    preexec_fn = instance_preexec_fn = on_start = on_instance_start = None
+    if placement:
+        from ...lib.placement import describe_placement, placement_preexec
+
+        try:
+            preexec_fn = placement_preexec(placement)
+            instance_preexec_fn = placement_preexec(
+                {k: v for k, v in placement.items() if k != "cpu_affinity"}
+            )
+        except (OSError, ValueError) as e:
+            raise click.ClickException(
+                click.style(
+                    f"Could not apply the placement of '{profile}': {e}", fg="red"
+                )
+            )
+        record["placement"] = {
+            "requested": {
+                key: target_profile[key]
+                for key in PLACEMENT_KEYS
+                if key in target_profile
+            },
+            "effective": None,
+        }
+
+        def describe(pid: int) -> dict | None:
+            try:
+                return describe_placement(pid)
+            except OSError:
+                return None  # the child already exited
+
+        def on_start(pid: int) -> None:
+            record["placement"]["effective"] = describe(pid)
+
+        def on_instance_start(instance: dict, pid: int) -> None:
+            record["instances"][instance["index"]]["effective"] = describe(pid)
+
+    if instances > 1:
+        from ...lib.instances import plan_instances, run_instances
+
+        launch_argv = shlex.split(launch_cmd)
+        if "--no-window" not in launch_argv:
+            launch_argv.append("--no-window")
+        try:
+            planned = plan_instances(
+                instances,
+                launch_argv,
+                source_env or dict(os.environ),
+                project_root / ".pow" / "instances" / profile,
+                allowed_cpus=placement.get("cpu_affinity"),
+            )
+        except ValueError as e:
+            raise click.ClickException(click.style(str(e), fg="red"))
+        record["instances"] = [
+            {
+                "index": instance["index"],
+                "numa_node": instance["node"],
+                "cpu_affinity": instance["cpus"],
+                "ros_domain_id": instance["env"]["ROS_DOMAIN_ID"],
+                "log": str(instance["log"]),
+            }
+            for instance in planned
+        ]
+        monitor = start_run(run_path, record, monitor_interval)
+        try:
+            status = run_instances(
+                planned,
+                project_root,
+                click.echo,
+                instance_preexec_fn,
+                on_instance_start,
+            )
+            record["exit_code"] = status
+        finally:
+            finish_run(run_path, record, monitor)
+        if status:
+            click.echo(
+                click.style(f"An instance failed with exit code {status}.", fg="red"),
+                err=True,
+            )
+            ctx.exit(status)
+        click.echo(click.style(f"All {instances} instances succeeded.", fg="green"))
+        return
 
     # launch isaacsim with constructed command
-    subprocess.run(shlex.split(launch_cmd), check=True, env=source_env)
+    monitor = start_run(run_path, record, monitor_interval)
+    try:
+        if profile_startup:
+            from ...lib.startup_trace import run_captured
+
+            returncode, lines, duration = run_captured(
+                shlex.split(launch_cmd), source_env, preexec_fn, on_start
+            )
+            record["startup"] = report_startup(
+                run_path.with_suffix(".startup.json"), lines, duration
+            )
+        else:
+            with subprocess.Popen(
+                shlex.split(launch_cmd),
+                env=source_env,
+                preexec_fn=preexec_fn,  # noqa: PLW1509 (see placement_preexec)
+            ) as process:
+                if on_start is not None:
+                    on_start(process.pid)
+                returncode = process.wait()
+        result = subprocess.CompletedProcess(shlex.split(launch_cmd), returncode)
+        record["exit_code"] = result.returncode
+    finally:
+        finish_run(run_path, record, monitor)
+    result.check_returncode()
@@ -0,0 +1,3 @@
+from .serve import serve
+
+__all__ = ["serve"]
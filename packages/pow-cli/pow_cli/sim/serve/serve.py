@@ -0,0 +1,140 @@
+"""Keep a warm Isaac Sim instance running for `pow sim run --attach`."""
+
+import shlex
+import signal
+import sys
+import threading
+from importlib.resources import files
+
+import click
+
+from ...lib.daemon import (
+    ControlServer,
+    DaemonError,
+    Supervisor,
+    get_control_socket_path,
+    send_request,
+)
+from ..run.run import (
+    build_launch_command,
+    find_project_root,
+    load_config,
+    source_isaacsim_ros_workspace,
+)
+
+
+def build_serve_command(config: dict, project_root, profile: str) -> list[str]:
+    """Build the Isaac Sim command line running the pow bridge at startup.
+
+    Args:
+        config: Parsed pow.toml configuration dictionary.
+        project_root: Path to the project root directory.
+        profile: Name of the profile to use.
+
+    Returns:
+        list[str]: Command line arguments.
+    """
+    bridge = files("pow_cli").joinpath("data", "kit_bridge.py")
+    launch_cmd = build_launch_command(config, project_root, profile)
+    return shlex.split(launch_cmd) + ["--exec", str(bridge)]
+
+
+@click.command("serve")
+@click.option(
+    "-p",
+    "--profile",
+    default="default",
+    help="Profile name to use from pow.toml (default: 'default').",
+)
+@click.option(
+    "--standin",
+    is_flag=True,
+    help="Supervise a stand-in process instead of Isaac Sim (for testing).",
+)
+@click.option("--status", is_flag=True, help="Show the status of the running daemon.")
+@click.option("--stop", is_flag=True, help="Stop the running daemon.")
+def serve(profile: str, standin: bool, status: bool, stop: bool) -> None:
+    """Keep a warm Isaac Sim instance for this project.
+
+    Isaac Sim is started once and restarted with exponential backoff if it
+    exits. 'pow sim run --attach' then opens stages and runs scripts in it
+    through a local UNIX socket instead of cold starting Kit.
+
+    Args:
+        profile: Name of the profile to use.
+        standin: If True, supervise a stand-in process instead of Isaac Sim.
+        status: If True, only show the status of the running daemon.
+        stop: If True, stop the running daemon.
+
+    Returns:
+        None
+    """
+    project_root = find_project_root()
+    if project_root is None:
+        raise click.ClickException(
+            click.style(
+                "Not initialized. Run 'pow sim init' in your project directory.",
+                fg="red",
+            )
+        )
+    try:
+        socket_path = get_control_socket_path(project_root)
+    except DaemonError as e:
+        raise click.ClickException(click.style(str(e), fg="red"))
+
+    if status or stop:
+        try:
+            response = send_request(socket_path, {"op": "stop" if stop else "status"})
+        except DaemonError as e:
+            raise click.ClickException(click.style(str(e), fg="red"))
+        if stop:
+            click.echo("Daemon stopped.")
+        else:
+            for key in ("pid", "ready", "restarts", "uptime"):
+                click.echo(f"{key}: {response.get(key)}")
+        return
+
+    try:
+        send_request(socket_path, {"op": "status"}, timeout=5)
+    except (DaemonError, OSError):
+        pass
+    else:
+        raise click.ClickException(
+            click.style(
+                f"A daemon is already serving this project on {socket_path}.",
+                fg="red",
+            )
+        )
+
+    env = None
+    if standin:
+        argv = [sys.executable, "-m", "pow_cli.sim.serve.standin"]
+    else:
+        config = load_config(project_root)
+        if config.get("sim", {}).get("ros", {}).get("enable_ros", False):
+            env = source_isaacsim_ros_workspace(config)
+        argv = build_serve_command(config, project_root, profile)
+
+    supervisor = Supervisor(
+        argv,
+        socket_path.with_suffix(".bridge"),
+        env=env,
+        cwd=project_root,
+        log=click.echo,
+    )
+    server = ControlServer(socket_path, supervisor)
+    signal.signal(
+        signal.SIGTERM,
+        lambda *_: threading.Thread(target=server.shutdown, daemon=True).start(),
+    )
+
+    supervisor.start()
+    click.echo(f"Serving on {socket_path} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        click.echo("Stopping Isaac Sim...")
+        supervisor.stop()
+        server.server_close()
@@ -0,0 +1,67 @@
+"""Stand-in for Isaac Sim speaking the `pow sim serve` bridge protocol.
+
+Used with `pow sim serve --standin` to exercise the daemon, supervision and
+`pow sim run --attach` without Kit or a GPU. Stages are only checked to
+exist; scripts are run in this process.
+"""
+
+import os
+import runpy
+import socket
+import sys
+import time
+import traceback
+from pathlib import Path
+
+from ...lib.daemon import BRIDGE_ENV, read_message, write_message
+
+# seconds to wait before accepting requests, mimicking Kit startup
+STARTUP_DELAY_ENV = "POW_STANDIN_STARTUP"
+
+
+class ScriptError(Exception):
+    """Raised when a script run for a request fails, with its traceback."""
+
+
+# malformed requests and failures reported back to the client
+REQUEST_ERRORS = (ScriptError, KeyError, TypeError, ValueError, OSError)
+
+
+def handle(request: dict) -> dict:
+    op = request.get("op")
+    if op == "open_stage":
+        path = request["path"]
+        if not Path(path).exists():
+            return {"ok": False, "error": f"Stage not found: {path}"}
+        return {"ok": True, "stage": path}
+    if op == "run_script":
+        saved_argv = sys.argv
+        sys.argv = [request["path"], *request.get("args", [])]
+        try:
+            runpy.run_path(request["path"], run_name="__main__")
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                raise ScriptError(f"{request['path']} exited with {e.code}") from e
+        except Exception as e:
+            raise ScriptError(traceback.format_exc()) from e
+        finally:
+            sys.argv = saved_argv
+        return {"ok": True, "script": request["path"]}
+    return {"ok": False, "error": f"Unknown op: {op}"}
+
+
+def main() -> None:
+    time.sleep(float(os.environ.get(STARTUP_DELAY_ENV, "0")))
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(os.environ[BRIDGE_ENV])
+        with sock.makefile("rwb") as stream:
+            while (request := read_message(stream)) is not None:
+                try:
+                    response = handle(request)
+                except REQUEST_ERRORS as e:
+                    response = {"ok": False, "error": str(e)}
+                write_message(stream, response)
+
+
+if __name__ == "__main__":
+    main()
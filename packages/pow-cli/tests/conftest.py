@@ -0,0 +1,45 @@
+"""Shared fixtures for the pow-cli tests."""
+
+import functools
+import sys
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+# the synthetic Isaac Sim, Kit and registry fixtures of the benchmarks
+sys.path.insert(0, str(Path(__file__).parents[1] / "benchmarks"))
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    """Static file handler that does not log requests."""
+
+    def log_message(self, format, *args):
+        pass
+
+
+def directory_handler(directory: Path):
+    """Get a handler serving the files of directory."""
+    return functools.partial(QuietHandler, directory=str(directory))
+
+
+@pytest.fixture
+def http_server():
+    """Start HTTP servers on localhost for the duration of a test.
+
+    Yields a function taking a request handler class and returning the base
+    URL of a new server using it.
+    """
+    servers = []
+
+    def start(handler) -> str:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_port}"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,96 @@
+"""Tests of serving the download cache over HTTP."""
+
+import json
+import os
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from pow_cli.lib.asset_server import make_server, parse_range
+from pow_cli.lib.download_cache import add_to_cache
+from pow_cli.lib.integrity import MANIFEST_SUFFIX
+
+PAYLOAD = os.urandom(1000)
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, None),
+        ("bytes=0-99", (0, 100)),
+        ("bytes=500-", (500, 1000)),
+        ("bytes=990-5000", (990, 1000)),
+        ("bytes=-100", (900, 1000)),
+        ("bytes=-5000", (0, 1000)),
+        ("bytes=0-1,5-6", None),
+    ],
+)
+def test_parse_range(header, expected):
+    assert parse_range(header, 1000) == expected
+
+
+@pytest.mark.parametrize(
+    "header", ["bytes=1000-", "bytes=2000-3000", "bytes=5-3", "bytes=-", "items=0-1"]
+)
+def test_parse_range_rejects_unsatisfiable(header):
+    with pytest.raises(ValueError):
+        parse_range(header, 1000)
+
+
+@pytest.fixture
+def served(tmp_path):
+    """Serve a cache holding part.zip, and a pending pending.zip."""
+    cache = tmp_path / "cache"
+    for name, pending in [("part.zip", False), ("pending.zip", True)]:
+        path = tmp_path / name
+        path.write_bytes(PAYLOAD)
+        add_to_cache(cache, path, pending=pending)
+    server = make_server(cache, "127.0.0.1", 0, quiet=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def request(url: str, method: str = "GET", byte_range: str | None = None):
+    headers = {"Range": byte_range} if byte_range else {}
+    req = urllib.request.Request(url, method=method, headers=headers)
+    with urllib.request.urlopen(req, timeout=10) as response:
+        return response.status, response.headers, response.read()
+
+
+def test_get_whole_file_and_range(served):
+    status, headers, body = request(f"{served}/part.zip")
+    assert (status, body) == (200, PAYLOAD)
+    assert headers["Accept-Ranges"] == "bytes"
+
+    status, headers, body = request(f"{served}/part.zip", byte_range="bytes=-10")
+    assert (status, body) == (206, PAYLOAD[-10:])
+    assert headers["Content-Range"] == "bytes 990-999/1000"
+
+
+def test_head_sends_headers_only(served):
+    status, headers, body = request(f"{served}/part.zip", "HEAD", "bytes=100-199")
+    assert (status, body) == (206, b"")
+    assert headers["Content-Length"] == "100"
+
+
+def test_unsatisfiable_range(served):
+    with pytest.raises(urllib.error.HTTPError) as e:
+        request(f"{served}/part.zip", byte_range="bytes=1000-")
+    assert e.value.code == 416
+    assert e.value.headers["Content-Range"] == "bytes */1000"
+
+
+def test_index_and_manifests_hide_pending_files(served):
+    _, _, body = request(f"{served}/index.json")
+    assert list(json.loads(body)) == ["part.zip"]
+    _, _, body = request(f"{served}/part.zip{MANIFEST_SUFFIX}")
+    assert json.loads(body)["size"] == len(PAYLOAD)
+
+    for name in ["pending.zip", f"pending.zip{MANIFEST_SUFFIX}", "missing.zip"]:
+        with pytest.raises(urllib.error.HTTPError) as e:
+            request(f"{served}/{name}")
+        assert e.value.code == 404
@@ -0,0 +1,159 @@
+"""Tests of the serve daemon, supervising the stand-in child."""
+
+import itertools
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from pow_cli.lib import daemon
+from pow_cli.lib.daemon import ControlServer, DaemonError, Supervisor, send_request
+
+STANDIN = [sys.executable, "-m", "pow_cli.sim.serve.standin"]
+
+
+@pytest.fixture
+def socket_dir():
+    # tmp_path can exceed the length limit of UNIX socket paths
+    path = Path(tempfile.mkdtemp(prefix="pow-test-"))
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.fixture
+def supervise(socket_dir):
+    """Start Supervisors logging to a list, and stop them after the test."""
+    supervisors = []
+
+    def start(argv: list[str]) -> tuple[Supervisor, list[tuple[float, str]]]:
+        lines = []
+        supervisor = Supervisor(
+            argv,
+            socket_dir / f"{len(supervisors)}.bridge",
+            log=lambda line: lines.append((time.monotonic(), line)),
+        )
+        supervisor.start()
+        supervisors.append(supervisor)
+        return supervisor, lines
+
+    yield start
+    for supervisor in supervisors:
+        supervisor.stop()
+
+
+def wait_until(condition, timeout: float = 20.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.05)
+
+
+def test_requests_are_forwarded_to_the_child(supervise, tmp_path):
+    supervisor, _ = supervise(STANDIN)
+    stage = tmp_path / "scene.usd"
+    stage.touch()
+    script = tmp_path / "script.py"
+    script.write_text(
+        "import pathlib, sys\npathlib.Path(sys.argv[1]).write_text(sys.argv[2])\n"
+    )
+
+    assert supervisor.request({"op": "open_stage", "path": str(stage)})["ok"]
+    response = supervisor.request({"op": "open_stage", "path": str(tmp_path / "x")})
+    assert not response["ok"]
+    request = {"op": "run_script", "path": str(script), "args": [str(stage), "ran"]}
+    assert supervisor.request(request)["ok"]
+    assert stage.read_text() == "ran"
+
+    status = supervisor.status()
+    assert status["ready"] and status["pid"] and status["restarts"] == 0
+
+
+def test_child_is_restarted_with_backoff(supervise, monkeypatch):
+    monkeypatch.setattr(daemon, "INITIAL_BACKOFF", 0.2)
+    supervisor, lines = supervise([sys.executable, "-c", "raise SystemExit(3)"])
+
+    wait_until(lambda: supervisor.restarts >= 4)
+
+    starts = [at for at, line in lines if line.startswith("Started")]
+    gaps = [later - earlier for earlier, later in itertools.pairwise(starts)]
+    # 0.2s, 0.4s then 0.8s between restarts
+    for gap, backoff in zip(gaps[:3], [0.2, 0.4, 0.8], strict=True):
+        assert gap >= backoff
+    assert gaps[2] > gaps[0] * 2
+    assert any("exited with code 3" in line for _, line in lines)
+
+
+def test_backoff_resets_after_a_stable_run(supervise, monkeypatch):
+    monkeypatch.setattr(daemon, "INITIAL_BACKOFF", 0.2)
+    monkeypatch.setattr(daemon, "STABLE_AFTER", 0.0)
+    supervisor, lines = supervise([sys.executable, "-c", "raise SystemExit(3)"])
+
+    wait_until(lambda: supervisor.restarts >= 4)
+
+    starts = [at for at, line in lines if line.startswith("Started")]
+    assert starts[3] - starts[0] < 0.2 * 7  # every wait stays at 0.2s
+
+
+def test_crash_during_request_restarts_the_child(supervise, monkeypatch, tmp_path):
+    monkeypatch.setattr(daemon, "INITIAL_BACKOFF", 0.1)
+    supervisor, _ = supervise(STANDIN)
+    crash = tmp_path / "crash.py"
+    crash.write_text("import os\nos._exit(1)\n")
+
+    with pytest.raises(DaemonError):
+        supervisor.request({"op": "run_script", "path": str(crash)})
+    stage = tmp_path / "scene.usd"
+    stage.touch()
+    # the next request waits for the restarted child
+    assert supervisor.request({"op": "open_stage", "path": str(stage)})["ok"]
+    assert supervisor.restarts == 1
+
+
+def test_control_server_protocol(supervise, socket_dir, tmp_path):
+    supervisor, _ = supervise(STANDIN)
+    socket_path = socket_dir / "control.sock"
+    server = ControlServer(socket_path, supervisor)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    stage = tmp_path / "scene.usd"
+    stage.touch()
+
+    try:
+        response = send_request(socket_path, {"op": "open_stage", "path": str(stage)})
+        assert response == {"ok": True, "stage": str(stage)}
+        assert send_request(socket_path, {"op": "bogus"}) == {
+            "ok": False,
+            "error": "Unknown op: bogus",
+        }
+        status = send_request(socket_path, {"op": "status"})
+        assert status["ok"] and status["ready"]
+
+        assert send_request(socket_path, {"op": "stop"}) == {"ok": True}
+        thread.join(timeout=10)
+        assert not thread.is_alive()
+    finally:
+        server.server_close()
+    assert not socket_path.exists()
+    with pytest.raises(DaemonError):
+        send_request(socket_path, {"op": "status"})
+
+
+def test_script_errors_are_reported(supervise, tmp_path):
+    supervisor, _ = supervise(STANDIN)
+    failing = tmp_path / "failing.py"
+    failing.write_text("raise RuntimeError('boom')\n")
+    exiting = tmp_path / "exiting.py"
+    exiting.write_text("import sys\nsys.exit(2)\n")
+
+    response = supervisor.request({"op": "run_script", "path": str(failing)})
+    assert not response["ok"]
+    assert "RuntimeError: boom" in response["error"]
+    response = supervisor.request({"op": "run_script", "path": str(exiting)})
+    assert response == {"ok": False, "error": f"{exiting} exited with 2"}
+    response = supervisor.request({"op": "run_script"})
+    assert not response["ok"]
+    assert supervisor.status()["restarts"] == 0
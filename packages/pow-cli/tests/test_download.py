@@ -0,0 +1,159 @@
+"""Tests of the segmented downloader against a local HTTP server."""
+
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+from typing import ClassVar
+
+import pytest
+
+from pow_cli.lib.download import (
+    READ_BLOCK_SIZE,
+    STATE_SUFFIX,
+    RangeNotSupportedError,
+    _RateLimiter,
+    download_files,
+    fetch_range,
+    probe,
+)
+
+PAYLOAD = os.urandom(10_000)
+
+
+def make_handler(payload: bytes, ranges: bool = True):
+    """Make a handler serving payload, with or without range support.
+
+    The Range headers of all requests are recorded in the handler's
+    ``requested`` list.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        requested: ClassVar[list[str | None]] = []
+
+        def do_GET(self):
+            header = self.headers.get("Range")
+            self.requested.append(header)
+            if ranges and header:
+                first, last = header.removeprefix("bytes=").split("-")
+                start, end = int(first), min(int(last) + 1, len(payload))
+                self.send_response(206)
+                self.send_header(
+                    "Content-Range", f"bytes {start}-{end - 1}/{len(payload)}"
+                )
+            else:
+                start, end = 0, len(payload)
+                self.send_response(200)
+            self.send_header("Content-Length", str(end - start))
+            self.end_headers()
+            self.wfile.write(payload[start:end])
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def test_rate_below_block_size_does_not_hang():
+    rate = READ_BLOCK_SIZE // 2
+    limiter = _RateLimiter(rate)
+    done = threading.Event()
+
+    def consume():
+        limiter.consume(READ_BLOCK_SIZE)
+        limiter.consume(READ_BLOCK_SIZE)
+        done.set()
+
+    start = time.monotonic()
+    threading.Thread(target=consume, daemon=True).start()
+    assert done.wait(timeout=20)
+    # the second block waits for the bucket to refill at the limited rate
+    assert time.monotonic() - start >= READ_BLOCK_SIZE / rate * 0.9
+
+
+def test_unlimited_rate_returns_immediately():
+    limiter = _RateLimiter(None)
+    start = time.monotonic()
+    limiter.consume(10 * READ_BLOCK_SIZE)
+    assert time.monotonic() - start < 0.1
+
+
+def test_probe_reports_size_and_range_support(http_server):
+    assert probe(http_server(make_handler(PAYLOAD)) + "/f") == (len(PAYLOAD), True)
+    url = http_server(make_handler(PAYLOAD, ranges=False)) + "/f"
+    assert probe(url) == (len(PAYLOAD), False)
+
+
+def test_fetch_range_writes_at_offset(http_server, tmp_path):
+    url = http_server(make_handler(PAYLOAD)) + "/f"
+    dest = tmp_path / "f"
+    dest.write_bytes(bytes(len(PAYLOAD)))
+    written = []
+
+    fetch_range(url, dest, 1000, 3000, written.append)
+
+    data = dest.read_bytes()
+    assert data[1000:3000] == PAYLOAD[1000:3000]
+    assert data[:1000] == bytes(1000)
+    assert sum(written) == 2000
+
+
+def test_fetch_range_rejects_full_response(http_server, tmp_path):
+    url = http_server(make_handler(PAYLOAD, ranges=False)) + "/f"
+    dest = tmp_path / "f"
+    dest.write_bytes(bytes(len(PAYLOAD)))
+
+    with pytest.raises(RangeNotSupportedError):
+        fetch_range(url, dest, 1000, 3000)
+    # a request from the start can use the full response
+    fetch_range(url, dest, 0, len(PAYLOAD))
+    assert dest.read_bytes() == PAYLOAD
+
+
+def test_download_files_in_segments(http_server, tmp_path):
+    handler = make_handler(PAYLOAD)
+    url = http_server(handler)
+    jobs = [(f"{url}/a", tmp_path / "a"), (f"{url}/b", tmp_path / "b")]
+
+    download_files(jobs, max_connections=4, segment_size=3000, use_aria2c=False)
+
+    for _, dest in jobs:
+        assert dest.read_bytes() == PAYLOAD
+        assert not dest.with_name(dest.name + STATE_SUFFIX).exists()
+    # one probe and four segments per file
+    assert len(handler.requested) == 10
+
+
+def test_download_files_resumes_from_sidecar(http_server, tmp_path):
+    handler = make_handler(PAYLOAD)
+    url = http_server(handler) + "/f"
+    dest = tmp_path / "f"
+    dest.write_bytes(PAYLOAD[:4000] + bytes(len(PAYLOAD) - 4000))
+    state = {
+        "url": url,
+        "size": len(PAYLOAD),
+        "segments": [[0, 5000, 4000], [5000, 10_000, 0]],
+    }
+    dest.with_name(dest.name + STATE_SUFFIX).write_text(json.dumps(state))
+
+    download_files([(url, dest)], segment_size=5000, use_aria2c=False)
+
+    assert dest.read_bytes() == PAYLOAD
+    assert not dest.with_name(dest.name + STATE_SUFFIX).exists()
+    assert sorted(handler.requested[1:]) == ["bytes=4000-4999", "bytes=5000-9999"]
+
+
+def test_download_files_restarts_without_range_support(http_server, tmp_path):
+    handler = make_handler(PAYLOAD, ranges=False)
+    url = http_server(handler) + "/f"
+    dest = tmp_path / "f"
+    dest.write_bytes(PAYLOAD[:4000] + bytes(len(PAYLOAD) - 4000))
+    state = {"url": url, "size": len(PAYLOAD), "segments": [[0, len(PAYLOAD), 4000]]}
+    dest.with_name(dest.name + STATE_SUFFIX).write_text(json.dumps(state))
+
+    download_files([(url, dest)], use_aria2c=False)
+
+    assert dest.read_bytes() == PAYLOAD
+    # the resumed request got the whole file, so the segment restarted at 0
+    assert handler.requested[1:] == ["bytes=4000-9999", "bytes=0-9999"]
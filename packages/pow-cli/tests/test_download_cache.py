@@ -0,0 +1,66 @@
+"""Tests of the pending and confirmed files of the download cache."""
+
+from pow_cli.lib.download_cache import (
+    add_to_cache,
+    confirm_in_cache,
+    find_in_cache,
+    list_refs,
+    restore_from_cache,
+)
+from pow_cli.lib.integrity import manifest_path
+
+
+def make_file(directory, name="part.zip", data=b"part data"):
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / name
+    path.write_bytes(data)
+    return path
+
+
+def test_added_file_is_found_and_restored(tmp_path):
+    cache = tmp_path / "cache"
+    path = make_file(tmp_path / "downloads")
+
+    digest, created = add_to_cache(cache, path)
+
+    assert created
+    assert find_in_cache(cache, "part.zip") is not None
+    assert list_refs(cache) == {"part.zip": {"id": digest, "size": 9}}
+    assert add_to_cache(cache, path) == (digest, False)
+
+    dest = tmp_path / "project" / "part.zip"
+    dest.parent.mkdir()
+    assert restore_from_cache(cache, "part.zip", dest) is not None
+    assert dest.read_bytes() == b"part data"
+    assert manifest_path(dest).exists()
+
+
+def test_pending_file_needs_confirmation_from_its_path(tmp_path):
+    cache = tmp_path / "cache"
+    path = make_file(tmp_path / "downloads")
+    add_to_cache(cache, path, pending=True)
+
+    assert find_in_cache(cache, "part.zip") is None
+    assert list_refs(cache) == {}
+    assert restore_from_cache(cache, "part.zip", tmp_path / "dest.zip") is None
+
+    # a file of the same name elsewhere does not confirm it
+    assert not confirm_in_cache(cache, make_file(tmp_path / "other"))
+    assert find_in_cache(cache, "part.zip") is None
+
+    assert confirm_in_cache(cache, path)
+    assert find_in_cache(cache, "part.zip") is not None
+    assert not confirm_in_cache(cache, path)
+
+
+def test_pending_add_keeps_confirmed_content(tmp_path):
+    cache = tmp_path / "cache"
+    path = make_file(tmp_path / "downloads")
+    add_to_cache(cache, path)
+
+    add_to_cache(cache, make_file(tmp_path / "again"), pending=True)
+    assert find_in_cache(cache, "part.zip") is not None
+
+    # different content under the same name waits for its confirmation
+    add_to_cache(cache, make_file(tmp_path / "new", data=b"new data"), pending=True)
+    assert find_in_cache(cache, "part.zip") is None
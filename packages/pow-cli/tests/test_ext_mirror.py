@@ -0,0 +1,96 @@
+"""Tests of mirroring a Kit extension registry served over HTTP."""
+
+import json
+
+import pytest
+from conftest import directory_handler
+from fixtures import make_ext_registry
+
+from pow_cli.lib import ext_mirror
+from pow_cli.lib.ext_mirror import (
+    SOURCE_MARKER,
+    load_registry_index,
+    mirror_package,
+    sync_packages,
+    write_mirror_index,
+)
+from pow_cli.lib.store import hash_file, object_path
+
+
+@pytest.fixture
+def registry(tmp_path):
+    return make_ext_registry(tmp_path, extensions=4)
+
+
+def candidates_of(index: dict[str, list[dict]]) -> list[dict]:
+    return [candidate for name in sorted(index) for candidate in index[name]]
+
+
+def test_sync_packages_extracts_archives(http_server, registry, tmp_path):
+    index = load_registry_index(http_server(directory_handler(registry)))
+    candidates = candidates_of(index)
+    mirror = tmp_path / "mirror"
+
+    fetched, failures = sync_packages(mirror, candidates)
+
+    assert failures == {}
+    assert fetched == sum(c["size"] for c in candidates)
+    for candidate in candidates:
+        dest = mirror / "exts" / f"{candidate['name']}-{candidate['version']}"
+        assert (dest / "config" / "extension.toml").is_file()
+        assert (dest / SOURCE_MARKER).read_text() == candidate["sha256"]
+    # archives already in the mirror are not fetched again
+    assert sync_packages(mirror, candidates) == (0, {})
+
+
+def test_sync_packages_reports_sha256_mismatch(
+    http_server, registry, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(ext_mirror, "MAX_RETRIES", 1)
+    index = load_registry_index(http_server(directory_handler(registry)))
+    bad = index["omni.fake.mirror_1"][0]
+    archive = registry / "objects" / bad["sha256"][:2] / bad["sha256"][2:]
+    archive.write_bytes(bytes(bad["size"]))
+    mirror = tmp_path / "mirror"
+
+    _, failures = sync_packages(mirror, candidates_of(index))
+
+    assert list(failures) == ["omni.fake.mirror_1-1.1.0"]
+    assert "sha256 mismatch" in failures["omni.fake.mirror_1-1.1.0"]
+    assert not object_path(mirror, bad["sha256"]).exists()
+    assert not (mirror / "exts" / "omni.fake.mirror_1-1.1.0").exists()
+    assert (mirror / "exts" / "omni.fake.mirror_0-1.0.0").is_dir()
+
+
+def test_verify_fetches_corrupted_archive_again(http_server, registry, tmp_path):
+    index = load_registry_index(http_server(directory_handler(registry)))
+    candidate = index["omni.fake.mirror_0"][0]
+    mirror = tmp_path / "mirror"
+    mirror_package(mirror, candidate)
+    archive = object_path(mirror, candidate["sha256"])
+    archive.write_bytes(bytes(candidate["size"]))
+
+    assert mirror_package(mirror, candidate) == 0
+    assert mirror_package(mirror, candidate, verify=True) == candidate["size"]
+    assert hash_file(archive) == candidate["sha256"]
+
+
+def test_write_mirror_index_keeps_earlier_entries(http_server, registry, tmp_path):
+    candidates = candidates_of(
+        load_registry_index(http_server(directory_handler(registry)))
+    )
+    mirror = tmp_path / "mirror"
+    sync_packages(mirror, candidates)
+
+    write_mirror_index(mirror, candidates[:2])
+    path = write_mirror_index(mirror, candidates[2:])
+
+    names = [p["name"] for p in json.loads(path.read_text())["packages"]]
+    assert names == [c["name"] for c in candidates]
+    # the mirror can be served as the registry of other machines
+    served = candidates_of(load_registry_index(http_server(directory_handler(mirror))))
+    assert [c["sha256"] for c in served] == [c["sha256"] for c in candidates]
+    assert [c["dependencies"] for c in served] == [
+        c["dependencies"] for c in candidates
+    ]
+    assert sync_packages(tmp_path / "other", served)[1] == {}
@@ -0,0 +1,110 @@
+"""Tests of planning and running several Isaac Sim instances."""
+
+import os
+import sys
+
+import pytest
+
+from pow_cli.lib import instances
+from pow_cli.lib.instances import (
+    BASE_PORT,
+    parse_cpulist,
+    plan_instances,
+    run_instances,
+    spread_cpus,
+)
+
+TWO_NODES = [(0, [0, 1, 2, 3]), (1, [4, 5, 6, 7])]
+
+
+def test_parse_cpulist():
+    assert parse_cpulist("0-3,8,10-11\n") == [0, 1, 2, 3, 8, 10, 11]
+
+
+def test_spread_cpus_round_robin_over_nodes():
+    assert spread_cpus(4, TWO_NODES) == [
+        (0, [0, 1]),
+        (1, [4, 5]),
+        (0, [2, 3]),
+        (1, [6, 7]),
+    ]
+    assert spread_cpus(1, TWO_NODES) == [(0, [0, 1, 2, 3])]
+
+
+def test_spread_cpus_wraps_when_cpus_run_out():
+    assert spread_cpus(3, [(None, [0, 1])]) == [(None, [0]), (None, [1]), (None, [0])]
+
+
+@pytest.fixture
+def two_nodes(monkeypatch):
+    monkeypatch.setattr(instances, "get_numa_nodes", lambda allowed: TWO_NODES)
+    monkeypatch.setattr(instances.shutil, "which", lambda name: None)
+
+
+def test_plan_instances_env_and_ports(two_nodes, tmp_path):
+    base_env = {"ROS_DOMAIN_ID": "7", "HOME": "/home/sim"}
+
+    planned = plan_instances(3, ["kit"], base_env, tmp_path)
+
+    for index, instance in enumerate(planned):
+        assert instance["env"] == {
+            "ROS_DOMAIN_ID": str(7 + index),
+            "HOME": "/home/sim",
+            "POW_INSTANCE": str(index),
+            "POW_INSTANCES": "3",
+        }
+        port = f"--/exts/omni.services.transport.server.http/port={BASE_PORT + index}"
+        assert instance["argv"][0] == "kit"
+        assert port in instance["argv"]
+        assert (
+            f"--/log/file={tmp_path / str(index) / 'logs' / 'kit.log'}"
+            in (instance["argv"])
+        )
+        assert instance["log"].parent.is_dir()
+    assert [(i["node"], i["cpus"]) for i in planned] == spread_cpus(3, TWO_NODES)
+    assert base_env == {"ROS_DOMAIN_ID": "7", "HOME": "/home/sim"}
+
+
+def test_plan_instances_custom_port_and_numactl(two_nodes, monkeypatch, tmp_path):
+    monkeypatch.setattr(instances.shutil, "which", lambda name: f"/usr/bin/{name}")
+
+    planned = plan_instances(2, ["kit"], {}, tmp_path, base_port=9000)
+
+    assert planned[1]["argv"][:3] == ["numactl", "--membind=1", "kit"]
+    assert (
+        "--/exts/omni.services.transport.server.http/port=9001" in (planned[1]["argv"])
+    )
+    assert planned[0]["env"]["ROS_DOMAIN_ID"] == "0"
+
+
+def test_plan_instances_rejects_too_many_domains(two_nodes, tmp_path):
+    with pytest.raises(ValueError):
+        plan_instances(3, ["kit"], {"ROS_DOMAIN_ID": "100"}, tmp_path)
+
+
+def test_run_instances_reports_first_failure(tmp_path):
+    script = (
+        "import os, sys; print(os.environ['POW_INSTANCE']); sys.exit(int(sys.argv[1]))"
+    )
+    cpus = sorted(os.sched_getaffinity(0))
+    planned = []
+    for index, code in enumerate([0, 3, 4]):
+        log = tmp_path / f"{index}.log"
+        env = {**os.environ, "POW_INSTANCE": str(index), "ROS_DOMAIN_ID": "0"}
+        argv = [sys.executable, "-c", script, str(code)]
+        planned.append(
+            {"index": index, "argv": argv, "env": env, "cpus": cpus, "log": log}
+        )
+    started = []
+
+    status = run_instances(
+        planned, log=lambda line: None, on_start=lambda i, pid: started.append(pid)
+    )
+
+    assert status == 3
+    assert len(started) == 3
+    assert [(tmp_path / f"{i}.log").read_text() for i in range(3)] == [
+        "0\n",
+        "1\n",
+        "2\n",
+    ]
@@ -0,0 +1,72 @@
+"""Tests of the startup timeline built from a recorded Kit log."""
+
+import pytest
+from fixtures import make_kit_log
+
+from pow_cli.lib.startup_trace import (
+    build_timeline,
+    chrome_trace,
+    line_time,
+    parse_log,
+    run_captured,
+    slowest_extensions,
+)
+
+
+@pytest.fixture
+def kit_log(tmp_path):
+    return make_kit_log(tmp_path, extensions=30)
+
+
+def read_lines(log) -> list[tuple[float, str]]:
+    return [(0.0, line) for line in log.read_text().splitlines()]
+
+
+def test_line_time():
+    assert line_time("[3.552s] [ext: omni.a-1.0] startup", 9.0) == 3.552
+    assert line_time("2024-01-01 [3,552ms] [Info] message", 9.0) == 3.552
+    assert line_time("no timestamp", 9.0) == 9.0
+
+
+def test_parse_log_events(kit_log):
+    events = parse_log(read_lines(kit_log))
+
+    kinds = [event["kind"] for event in events]
+    assert kinds.count("ext_startup") == 30
+    assert kinds.count("ext_shutdown") == 30
+    assert kinds[30:33] == ["app_ready", "stage_open", "stage_opened"]
+    assert events[0] == {"ts": 0.25, "kind": "ext_startup", "name": "omni.fake.ext_0"}
+    assert events[31]["name"] == "Opening stage scenes/a.usd"
+
+
+def test_timeline_spans(kit_log):
+    spans = build_timeline(parse_log(read_lines(kit_log)))
+    by_category = {}
+    for span in spans:
+        by_category.setdefault(span["category"], []).append(span)
+
+    # every tenth extension takes 0.5s, the others 0.02s
+    slowest = slowest_extensions(spans, count=3)
+    assert [name for name, _ in slowest] == [
+        "omni.fake.ext_9",
+        "omni.fake.ext_19",
+        "omni.fake.ext_29",
+    ]
+    assert all(duration == pytest.approx(0.5) for _, duration in slowest)
+    (startup,) = by_category["app"]
+    ready = 0.25 + 27 * 0.02 + 3 * 0.5
+    assert startup["duration"] == pytest.approx(ready)
+    (stage,) = by_category["stage"]
+    assert stage["start"] == pytest.approx(ready + 0.2)
+    assert stage["duration"] == pytest.approx(3.0)
+    assert len(by_category["shutdown"]) == 30
+
+    trace = chrome_trace(spans)
+    assert len(trace["traceEvents"]) == len(spans) + 4
+
+
+def test_captured_run_uses_kit_timestamps(kit_log):
+    returncode, lines, _ = run_captured(["cat", str(kit_log)])
+
+    assert returncode == 0
+    assert parse_log(lines) == parse_log(read_lines(kit_log))